@@ -0,0 +1 @@
+"""Load tests and benchmarks (not part of the unit test run)."""
@@ -0,0 +1,231 @@
+"""
+API benchmark suite.
+
+Boots ``create_app()`` in-process against a seeded database, drives the
+main endpoints at a fixed concurrency and writes p50/p95/p99 latency and
+throughput per endpoint to a JSON results file. The results are compared
+with a stored baseline; the run fails when an endpoint regresses by more
+than the tolerance.
+
+    python -m benchmarks.api                              # SQLite stand-in
+    python -m benchmarks.api --database-url postgresql://... --concurrency 32
+    python -m benchmarks.api --update-baseline            # accept current numbers
+
+For scale runs, load a known-size dataset first and skip the small seed:
+
+    python -m benchmarks.dataset --database-url postgresql://... --scale full
+    python -m benchmarks.api --database-url postgresql://... --skip-seed
+
+Baselines are hardware-specific: refresh the stored one when the runner
+changes, not to make a regression go away.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.load import LoadResult, Target, fetch, run_load
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baselines" / "api-sqlite.json"
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results" / "api-latest.json"
+
+
+def build_targets(
+    token: str, caregiver_id: str, patient_id: str, email: str, password: str
+) -> list[Target]:
+    auth = {"Authorization": f"Bearer {token}"}
+    return [
+        Target(
+            "login", "/api/v1/auth/login", method="POST",
+            body={"email": email, "password": password},
+        ),
+        Target("patients", "/api/v1/patients/?pageSize=20", headers=auth),
+        Target("patients_by_caregiver", f"/api/v1/patients/caregiver/{caregiver_id}", headers=auth),
+        Target("inventory_by_patient", f"/api/v1/inventory/patient/{patient_id}", headers=auth),
+        Target("reports_summary", "/api/v1/reports/summary", headers=auth),
+    ]
+
+
+def summarize(runs: list[LoadResult], meta: dict[str, Any]) -> dict[str, Any]:
+    """JSON-serialisable summary of one load run per endpoint."""
+    return {
+        "meta": meta,
+        "concurrency": runs[0].concurrency if runs else 0,
+        "duration_s": runs[0].duration_s if runs else 0,
+        "targets": {
+            name: {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "throughput": round(result.throughput(name), 2),
+                "p50_ms": round(stats.percentile(50), 2),
+                "p95_ms": round(stats.percentile(95), 2),
+                "p99_ms": round(stats.percentile(99), 2),
+            }
+            for result in runs
+            for name, stats in result.targets.items()
+        },
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+) -> list[str]:
+    """
+    List regressions of ``results`` against ``baseline``.
+
+    An endpoint regresses when its throughput drops, or its p95 latency
+    grows, by more than ``tolerance`` (a fraction), or when it starts
+    returning errors.
+    """
+    regressions = []
+    for name, current in results["targets"].items():
+        previous = baseline.get("targets", {}).get(name)
+        if previous is None:
+            continue
+        baseline_errors = previous.get("errors", 0)
+        if current["errors"] > baseline_errors:
+            regressions.append(f"{name}: {current['errors']} errors (baseline {baseline_errors})")
+        slower = current["throughput"] < previous["throughput"] * (1 - tolerance)
+        if previous["throughput"] and slower:
+            regressions.append(
+                f"{name}: throughput {current['throughput']:.1f} req/s "
+                f"(baseline {previous['throughput']:.1f})"
+            )
+        if previous["p95_ms"] and current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']:.1f} ms (baseline {previous['p95_ms']:.1f})"
+            )
+    return regressions
+
+
+def _serve(app) -> tuple[str, Any]:
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", server
+
+
+def _login(base_url: str, email: str, password: str) -> str:
+    status, body = fetch(base_url, Target(
+        "login", "/api/v1/auth/login", method="POST", body={"email": email, "password": password}
+    ))
+    if status != 200:
+        raise RuntimeError(f"Benchmark login failed ({status}): {body[:200]!r}")
+    return json.loads(body)["access_token"]
+
+
+def run_benchmark(
+    concurrency: int,
+    duration_s: float,
+    patients: int,
+    seed: bool = True,
+) -> dict[str, Any]:
+    """Seed (optionally), boot the app and load it. Settings must already be in the environment."""
+    from benchmarks.seed import BENCHMARK_EMAIL, BENCHMARK_PASSWORD, SeedInfo, seed_database
+    from src.infrastructure.database.models.patient_model import PatientModel
+    from src.infrastructure.database.models.user_model import UserModel
+    from src.infrastructure.database.session import OLTP, engines, get_db_context
+    from src.main import create_app
+
+    if seed:
+        info = seed_database(engines.get_engine(OLTP), patients=patients)
+    else:
+        with get_db_context(read_only=True) as session:
+            caregiver = session.query(UserModel).filter(UserModel.email == BENCHMARK_EMAIL).one()
+            patient = (
+                session.query(PatientModel)
+                .filter(PatientModel.caregiver_id == caregiver.id)
+                .first()
+            )
+            info = SeedInfo(caregiver.id, patient.id, BENCHMARK_EMAIL, BENCHMARK_PASSWORD)
+
+    base_url, server = _serve(create_app())
+    try:
+        token = _login(base_url, info.email, info.password)
+        targets = build_targets(
+            token, str(info.caregiver_id), str(info.patient_id), info.email, info.password
+        )
+        # One endpoint at a time, so a slow one (bcrypt login) doesn't throttle the others
+        runs = [
+            run_load(base_url, [target], concurrency=concurrency, duration_s=duration_s)
+            for target in targets
+        ]
+    finally:
+        server.shutdown()
+        engines.dispose()
+
+    return summarize(runs, {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "database": engines.get_engine(OLTP).url.get_backend_name(),
+        "patients": patients if seed else None,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    })
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--database-url", help="defaults to a fresh SQLite file in a temp dir")
+    parser.add_argument("--skip-seed", action="store_true", help="use an already seeded database")
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Settings are read on first import of src.config, so set them up front
+    database_url = args.database_url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'benchmark.db'}"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    results = run_benchmark(args.concurrency, args.duration, args.patients, seed=not args.skip_seed)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    print(f"{'endpoint':<24}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, stats in results["targets"].items():
+        print(
+            f"{name:<24}{stats['throughput']:>10.1f}{stats['p50_ms']:>10.1f}"
+            f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['errors']:>8}"
+        )
+    print(f"results written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline updated: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
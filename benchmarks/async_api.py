@@ -0,0 +1,113 @@
+"""
+Compare one WSGI worker with one ASGI worker on the read endpoints.
+
+Boots a single-process gunicorn (``sync`` profile, one thread) and a
+single-process uvicorn running ``src.asgi:app``, drives the same read
+routes at the same concurrency, and prints throughput and latency per
+process:
+
+    python -m benchmarks.async_api --concurrency 64 --duration 20
+
+Uses DATABASE_URL from the environment (seed it first, e.g. with
+``python -m benchmarks.dataset``); the ASGI server derives its asyncio
+driver URL from it. Needs uvicorn and asyncpg installed.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.load import LoadResult, Target, run_load, wait_until_up
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def read_targets(token: str, caregiver_id: str) -> list[Target]:
+    auth = {"Authorization": f"Bearer {token}"}
+    return [
+        Target("patients", f"/api/v1/patients/caregiver/{caregiver_id}", headers=auth),
+        Target("dashboard", f"/api/v1/patients/caregiver/{caregiver_id}/dashboard", headers=auth),
+    ]
+
+
+def server_command(mode: str, port: int) -> tuple[list[str], dict[str, str]]:
+    """Command line and extra environment for a one-process server."""
+    if mode == "wsgi":
+        return (
+            [
+                sys.executable, "-m", "gunicorn", "-c", "python:src.gunicorn_conf",
+                "--access-logfile", "/dev/null",
+            ],
+            {
+                "GUNICORN_WORKER_PROFILE": "sync",
+                "GUNICORN_BIND": f"127.0.0.1:{port}",
+                "GUNICORN_WORKERS": "1",
+                "GUNICORN_THREADS": "1",
+            },
+        )
+    return (
+        [
+            sys.executable, "-m", "uvicorn", "src.asgi:app",
+            "--port", str(port), "--workers", "1", "--no-access-log",
+        ],
+        {},
+    )
+
+
+def run_mode(
+    mode: str, targets: list[Target], port: int, concurrency: int, duration_s: float
+) -> LoadResult:
+    command, extra_env = server_command(mode, port)
+    server = subprocess.Popen(command, cwd=PROJECT_ROOT, env={**os.environ, **extra_env})
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_up(base_url)
+        return run_load(base_url, targets, concurrency=concurrency, duration_s=duration_s)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--modes", nargs="+", default=["wsgi", "asgi"], choices=["wsgi", "asgi"])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=5056)
+    args = parser.parse_args()
+
+    from benchmarks.seed import BENCHMARK_EMAIL
+    from src.infrastructure.database.models.user_model import UserModel
+    from src.infrastructure.database.session import get_db_context
+    from src.infrastructure.security.jwt_handler import JWTHandler
+
+    with get_db_context(read_only=True) as session:
+        caregiver = session.query(UserModel).filter(UserModel.email == BENCHMARK_EMAIL).one()
+        caregiver_id = str(caregiver.id)
+    targets = read_targets(JWTHandler().create_access_token(subject=caregiver_id), caregiver_id)
+
+    results = {
+        mode: run_mode(mode, targets, args.port, args.concurrency, args.duration)
+        for mode in args.modes
+    }
+
+    print(f"\n{'mode':<8}{'route':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+    for mode, result in results.items():
+        for name, stats in result.targets.items():
+            print(
+                f"{mode:<8}{name:<12}{result.throughput(name):>10.1f}"
+                f"{stats.percentile(50):>10.1f}{stats.percentile(95):>10.1f}{stats.errors:>8}"
+            )
+        print(
+            f"{mode:<8}{'total':<12}{result.throughput():>10.1f}"
+            f"  (one process, concurrency {args.concurrency})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
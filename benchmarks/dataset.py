@@ -0,0 +1,375 @@
+"""
+Synthetic dataset generator for scale testing.
+
+Generates caregivers, patients (with valid, unique CPFs), medications and
+appointments in fixed, reproducible amounts: the same ``--seed`` and
+``--anchor-date`` always produce the same rows, including primary keys.
+On PostgreSQL rows are streamed through ``COPY ... FROM STDIN``; other
+databases (SQLite in tests) fall back to batched inserts.
+
+    python -m benchmarks.dataset --database-url postgresql://... --scale full
+    python -m benchmarks.dataset --database-url sqlite:///scale.db --scale small --truncate
+
+The first caregiver logs in with the benchmark credentials, so
+``python -m benchmarks.api --skip-seed`` runs against a generated dataset.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import sys
+import time as timer
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+
+from benchmarks.seed import BENCHMARK_EMAIL, BENCHMARK_PASSWORD, cpf_from_number
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Row counts per table."""
+    caregivers: int
+    patients: int
+    medications: int
+    appointments: int
+
+
+SCALES = {
+    "full": DatasetSpec(
+        caregivers=1_000, patients=1_000_000, medications=10_000_000, appointments=5_000_000
+    ),
+    "medium": DatasetSpec(
+        caregivers=100, patients=100_000, medications=1_000_000, appointments=500_000
+    ),
+    "small": DatasetSpec(caregivers=10, patients=1_000, medications=10_000, appointments=5_000),
+}
+
+# First nine CPF digits of patient 0; stays clear of repeated-digit prefixes
+_CPF_OFFSET = 100_000_000
+_SCHEDULES = {
+    "daily": [time(8, 0)],
+    "twice_daily": [time(8, 0), time(20, 0)],
+    "three_times_daily": [time(8, 0), time(14, 0), time(20, 0)],
+    "as_needed": [time(12, 0)],
+}
+_MEDICATIONS = [
+    ("Losartana", "50mg"), ("Metformina", "850mg"), ("Sinvastatina", "20mg"),
+    ("Omeprazol", "20mg"), ("AAS", "100mg"), ("Levotiroxina", "50mcg"),
+    ("Hidroclorotiazida", "25mg"), ("Atenolol", "50mg"), ("Donepezila", "10mg"),
+    ("Paracetamol", "750mg"), ("Dipirona", "500mg"), ("Vitamina D", "2000UI"),
+]
+_SPECIALTIES = [
+    "Cardiologia", "Geriatria", "Neurologia", "Endocrinologia", "Clínica Geral", "Ortopedia",
+]
+_PAST_STATUSES = ["completed"] * 3 + ["cancelled"]
+
+
+def stable_uuid(seed: int, kind: str, index: int) -> UUID:
+    """Deterministic UUID for row ``index`` of ``kind``, without keeping ids in memory."""
+    digest = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16).digest()
+    return UUID(bytes=digest, version=4)
+
+
+class DatasetGenerator:
+    """Yields rows (tuples in column order) for each table."""
+
+    def __init__(
+        self, spec: DatasetSpec, seed: int = 42, anchor: datetime | None = None
+    ) -> None:
+        from faker import Faker
+
+        self.spec = spec
+        self.seed = seed
+        self.anchor = anchor or datetime.combine(date.today(), time())
+
+        # Faker is too slow per row at this scale: draw pools once, combine with a seeded RNG
+        fake = Faker("pt_BR")
+        fake.seed_instance(seed)
+        self._first_names = [fake.first_name() for _ in range(300)]
+        self._last_names = [fake.last_name() for _ in range(300)]
+        self._streets = [fake.street_address() for _ in range(500)]
+        self._cities = [f"{fake.city()} - {fake.estado_sigla()}" for _ in range(100)]
+        self._doctors = [f"Dr(a). {fake.first_name()} {fake.last_name()}" for _ in range(200)]
+        self._conditions = [
+            "Hipertensão", "Diabetes tipo 2", "Alzheimer", "Artrose", "Osteoporose", None, None,
+        ]
+        self._allergies = ["Penicilina", "Dipirona", "Lactose", None, None, None]
+
+    def caregiver_id(self, index: int) -> UUID:
+        return stable_uuid(self.seed, "caregiver", index)
+
+    def patient_id(self, index: int) -> UUID:
+        return stable_uuid(self.seed, "patient", index)
+
+    def _rng(self, kind: str) -> random.Random:
+        return random.Random(f"{self.seed}:{kind}")
+
+    def _name(self, rng: random.Random) -> str:
+        first, last = self._first_names, self._last_names
+        return f"{rng.choice(first)} {rng.choice(last)} {rng.choice(last)}"
+
+    def _phone(self, rng: random.Random) -> str:
+        return f"({rng.randint(11, 99)}) 9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+
+    def caregivers(self, password_hash: str) -> Iterator[tuple]:
+        rng = self._rng("caregiver")
+        for index in range(self.spec.caregivers):
+            email = BENCHMARK_EMAIL if index == 0 else f"caregiver{index:05d}@example.com"
+            created = self.anchor - timedelta(days=rng.randrange(30, 1000))
+            yield (
+                self.caregiver_id(index), email, password_hash, self._name(rng),
+                "caregiver", True, created, created, None,
+            )
+
+    def patients(self) -> Iterator[tuple]:
+        rng = self._rng("patient")
+        for index in range(self.spec.patients):
+            created = self.anchor - timedelta(days=rng.randrange(1, 1000))
+            yield (
+                self.patient_id(index),
+                self.caregiver_id(index % self.spec.caregivers),
+                self._name(rng),
+                cpf_from_number(_CPF_OFFSET + index),
+                date(1925, 1, 1) + timedelta(days=rng.randrange(365 * 40)),
+                rng.choice(["M", "F"]),
+                f"{rng.choice(self._streets)}, {rng.choice(self._cities)}",
+                self._phone(rng),
+                self._name(rng),
+                self._phone(rng),
+                rng.choice(self._conditions),
+                rng.choice(self._allergies),
+                None,
+                rng.random() < 0.95,
+                created,
+                created,
+            )
+
+    def medications(self) -> Iterator[tuple]:
+        rng = self._rng("medication")
+        for index in range(self.spec.medications):
+            name, dosage = rng.choice(_MEDICATIONS)
+            frequency = rng.choice(list(_SCHEDULES))
+            start = self.anchor - timedelta(days=rng.randrange(0, 720))
+            ended = rng.random() < 0.3
+            created = start - timedelta(days=1)
+            yield (
+                stable_uuid(self.seed, "medication", index),
+                self.patient_id(rng.randrange(self.spec.patients)),
+                name,
+                dosage,
+                frequency,
+                _SCHEDULES[frequency],
+                start,
+                start + timedelta(days=rng.randrange(7, 180)) if ended else None,
+                "Tomar após as refeições" if rng.random() < 0.3 else None,
+                not ended,
+                created,
+                created,
+            )
+
+    def appointments(self) -> Iterator[tuple]:
+        rng = self._rng("appointment")
+        for index in range(self.spec.appointments):
+            when = self.anchor + timedelta(minutes=30 * rng.randrange(-2 * 365 * 48, 90 * 48))
+            status = "scheduled" if when >= self.anchor else rng.choice(_PAST_STATUSES)
+            specialty = rng.choice(_SPECIALTIES)
+            created = min(when, self.anchor) - timedelta(days=rng.randrange(1, 60))
+            yield (
+                stable_uuid(self.seed, "appointment", index),
+                self.patient_id(rng.randrange(self.spec.patients)),
+                f"Consulta - {specialty}",
+                None,
+                when,
+                rng.choice([20, 30, 45, 60]),
+                rng.choice(self._streets),
+                rng.choice(self._doctors),
+                specialty,
+                status,
+                status != "scheduled",
+                created,
+                created,
+            )
+
+
+def _copy_value(value: Any) -> str:
+    """Encode one value in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, list):
+        return "{" + ",".join(_copy_value(item) for item in value) + "}"
+    text = str(value)
+    if any(char in text for char in "\\\t\n\r"):
+        text = (
+            text.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return text
+
+
+def encode_copy_row(row: tuple) -> bytes:
+    """One line of COPY text input."""
+    return ("\t".join(_copy_value(value) for value in row) + "\n").encode()
+
+
+class CopyStream(io.RawIOBase):
+    """File-like view over rows, read lazily by ``copy_expert``."""
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self._lines = (encode_copy_row(row) for row in rows)
+        self._buffer = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while len(self._buffer) < len(target):
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        del self._buffer[:size]
+        return size
+
+
+def _load_table(engine: Engine, table, rows: Iterator[tuple], batch_size: int = 5_000) -> None:
+    columns = [column.name for column in table.columns]
+
+    if engine.dialect.name == "postgresql":
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                cursor.copy_expert(
+                    f"COPY {table.name} ({', '.join(columns)}) FROM STDIN",
+                    CopyStream(rows),
+                )
+            connection.commit()
+        finally:
+            connection.close()
+        return
+
+    with engine.begin() as connection:
+        batch = []
+        for row in rows:
+            batch.append(dict(zip(columns, row, strict=True)))
+            if len(batch) >= batch_size:
+                connection.execute(table.insert(), batch)
+                batch = []
+        if batch:
+            connection.execute(table.insert(), batch)
+
+
+def generate_dataset(
+    engine: Engine,
+    spec: DatasetSpec,
+    seed: int = 42,
+    anchor: datetime | None = None,
+    truncate: bool = False,
+    log=print,
+) -> dict[str, Any]:
+    """Create the schema (if needed), load the dataset and return its manifest."""
+    from src.infrastructure.database.models.appointment_model import AppointmentModel
+    from src.infrastructure.database.models.medication_model import MedicationModel
+    from src.infrastructure.database.models.patient_model import PatientModel
+    from src.infrastructure.database.models.user_model import UserModel
+    from src.infrastructure.database.session import Base
+    from src.infrastructure.security.password_hasher import PasswordHasher
+
+    tables = [
+        UserModel.__table__,
+        PatientModel.__table__,
+        MedicationModel.__table__,
+        AppointmentModel.__table__,
+    ]
+    Base.metadata.create_all(engine, tables=tables)
+    if truncate:
+        with engine.begin() as connection:
+            if engine.dialect.name == "postgresql":
+                connection.exec_driver_sql(f"TRUNCATE {', '.join(t.name for t in tables)} CASCADE")
+            else:
+                for table in reversed(tables):
+                    connection.execute(table.delete())
+
+    generator = DatasetGenerator(spec, seed, anchor)
+    # One bcrypt hash shared by every caregiver; hashing per row would dominate the load
+    password_hash = PasswordHasher().hash(BENCHMARK_PASSWORD)
+
+    for table, rows in (
+        (UserModel.__table__, generator.caregivers(password_hash)),
+        (PatientModel.__table__, generator.patients()),
+        (MedicationModel.__table__, generator.medications()),
+        (AppointmentModel.__table__, generator.appointments()),
+    ):
+        started = timer.perf_counter()
+        _load_table(engine, table, rows)
+        log(f"{table.name}: loaded in {timer.perf_counter() - started:.1f}s")
+
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for table in tables:
+                connection.exec_driver_sql(f"ANALYZE {table.name}")
+
+    return {
+        "seed": seed,
+        "anchor": generator.anchor.isoformat(),
+        "spec": asdict(spec),
+        "caregiver_email": BENCHMARK_EMAIL,
+        "caregiver_id": str(generator.caregiver_id(0)),
+        "patient_id": str(generator.patient_id(0)),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--anchor-date", type=date.fromisoformat, help="reference 'today' (default: today)"
+    )
+    parser.add_argument("--truncate", action="store_true", help="delete existing rows first")
+    parser.add_argument("--manifest", help="write the dataset manifest (JSON) here")
+    args = parser.parse_args(argv)
+
+    # The models import src.config, which validates these on first import
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SECRET_KEY", "dataset")
+    os.environ.setdefault("JWT_SECRET_KEY", "dataset")
+
+    from sqlalchemy import create_engine
+
+    engine = create_engine(args.database_url)
+    anchor = datetime.combine(args.anchor_date, time()) if args.anchor_date else None
+    manifest = generate_dataset(
+        engine, SCALES[args.scale], seed=args.seed, anchor=anchor, truncate=args.truncate,
+        log=lambda message: print(message, file=sys.stderr),
+    )
+    manifest["scale"] = args.scale
+
+    output = json.dumps(manifest, indent=2)
+    if args.manifest:
+        with open(args.manifest, "w") as file:
+            file.write(output + "\n")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Closed-loop HTTP load driver (stdlib only)."""
+import json
+import math
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Target:
+    """One endpoint to exercise."""
+    name: str
+    path: str
+    method: str = "GET"
+    body: dict[str, Any] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class TargetStats:
+    """Latencies and errors recorded for one target."""
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms) + self.errors
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of successful request latencies."""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        rank = min(len(ordered), max(1, math.ceil(p / 100 * len(ordered))))
+        return ordered[rank - 1]
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one load run."""
+    duration_s: float
+    concurrency: int
+    targets: dict[str, TargetStats]
+
+    def throughput(self, name: str | None = None) -> float:
+        """Successful requests per second, for one target or overall."""
+        stats = [self.targets[name]] if name else self.targets.values()
+        return sum(len(s.latencies_ms) for s in stats) / self.duration_s if self.duration_s else 0.0
+
+
+def send(base_url: str, target: Target, timeout: float = 30) -> int:
+    """Send one request and return the status code (reading the full body)."""
+    return fetch(base_url, target, timeout)[0]
+
+
+def fetch(base_url: str, target: Target, timeout: float = 30) -> tuple[int, bytes]:
+    """Send one request and return the status code and body."""
+    data = json.dumps(target.body).encode() if target.body is not None else None
+    headers = {"Accept": "application/json", **target.headers}
+    if data is not None:
+        headers["Content-Type"] = "application/json"
+
+    request = urllib.request.Request(
+        base_url.rstrip("/") + target.path, data=data, headers=headers, method=target.method
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def run_load(
+    base_url: str,
+    targets: list[Target],
+    concurrency: int = 8,
+    duration_s: float = 10,
+    warmup_s: float = 1,
+) -> LoadResult:
+    """
+    Hit ``targets`` round-robin from ``concurrency`` threads for ``duration_s``.
+
+    Each thread waits for its response before sending the next request, so
+    throughput reflects server capacity at that concurrency. Requests sent
+    during the warm-up period are not recorded.
+    """
+    stats = {target.name: TargetStats() for target in targets}
+    lock = threading.Lock()
+    start = time.perf_counter()
+    record_from = start + warmup_s
+    stop_at = record_from + duration_s
+
+    def worker(offset: int) -> None:
+        index = offset
+        while (sent_at := time.perf_counter()) < stop_at:
+            target = targets[index % len(targets)]
+            index += 1
+            try:
+                ok = send(base_url, target) < 400
+            except (OSError, urllib.error.URLError):
+                ok = False
+            elapsed_ms = (time.perf_counter() - sent_at) * 1000
+            if sent_at < record_from:
+                continue
+            with lock:
+                if ok:
+                    stats[target.name].latencies_ms.append(elapsed_ms)
+                else:
+                    stats[target.name].errors += 1
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return LoadResult(duration_s=duration_s, concurrency=concurrency, targets=stats)
+
+
+def wait_until_up(base_url: str, path: str = "/health", timeout_s: float = 30) -> None:
+    """Poll ``path`` until the server answers, or raise TimeoutError."""
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if send(base_url, Target("health", path), timeout=2) < 500:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"{base_url}{path} did not come up within {timeout_s}s")
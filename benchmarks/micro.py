@@ -0,0 +1,447 @@
+"""
+Microbenchmarks for the domain hot paths.
+
+Each case times one pure function (value object validation, the medication
+scheduler, the repository mappers) on a realistically sized input and
+records the per-call minimum and median. Every run is appended to a JSON-lines history
+file, so the effect of an optimisation can be read off the log:
+
+    python -m benchmarks.micro                       # run and record
+    python -m benchmarks.micro --compare             # also diff against the previous run
+    python -m benchmarks.micro -k scheduler          # only cases whose name contains "scheduler"
+
+With ``--compare`` the run fails when a case is more than ``--threshold``
+(10% by default) slower than the previous run recorded on the same host.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_HISTORY = BENCHMARKS_DIR / "results" / "micro-history.jsonl"
+
+CASES: dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def case(name: str):
+    """
+    Register a benchmark case.
+
+    The decorated function does the setup and returns the zero-argument
+    callable that is timed, so fixtures are not part of the measurement.
+    """
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@dataclass
+class Measurement:
+    """Per-call timings of one case, in microseconds."""
+    name: str
+    median_us: float
+    min_us: float
+    loops: int
+    rounds: int
+
+
+def measure(
+    name: str, func: Callable[[], Any], rounds: int = 7, min_time: float = 0.2
+) -> Measurement:
+    """Time ``func`` over ``rounds`` rounds of enough loops to take ``min_time`` seconds each."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    loops = max(1, int(loops * min_time / 0.2))
+    per_call = [total / loops * 1e6 for total in timer.repeat(repeat=rounds, number=loops)]
+    return Measurement(name, statistics.median(per_call), min(per_call), loops, rounds)
+
+
+def compare_runs(
+    current: dict[str, dict[str, float]],
+    previous: dict[str, dict[str, float]],
+    threshold: float = 0.10,
+) -> list[str]:
+    """
+    List cases more than ``threshold`` (a fraction) slower than before.
+
+    Compares the fastest round: the minimum is the least noisy estimate of
+    the code's own cost, the median also carries machine jitter.
+    """
+    slowdowns = []
+    for name, timings in current.items():
+        before = previous.get(name, {}).get("min_us")
+        if not before:
+            continue
+        change = timings["min_us"] / before - 1
+        if change > threshold:
+            slowdowns.append(
+                f"{name}: {timings['min_us']:.2f} us (previous {before:.2f} us, +{change:.0%})"
+            )
+    return slowdowns
+
+
+def load_history(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def append_history(path: Path, entry: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as history:
+        history.write(json.dumps(entry) + "\n")
+
+
+# Cases ---------------------------------------------------------------------
+
+def _cpfs(count: int) -> list[str]:
+    from benchmarks.seed import cpf_from_number
+    return [cpf_from_number(10_000_000 + index * 7919) for index in range(count)]
+
+
+def _medications(count: int, doses_per_day: int = 3):
+    from src.domain.entities.medication import Medication
+
+    start = datetime(2024, 1, 1)
+    patient_id = uuid4()
+    return [
+        Medication(
+            id=uuid4(),
+            patient_id=patient_id,
+            name=f"Medication {index}",
+            dosage="10mg",
+            frequency="three_times_daily",
+            schedule_times=[time((6 + index + 4 * dose) % 24, 0) for dose in range(doses_per_day)],
+            start_date=start,
+            end_date=start + timedelta(days=365) if index % 3 == 0 else None,
+            instructions="Após as refeições",
+            is_active=index % 5 != 0,
+        )
+        for index in range(count)
+    ]
+
+
+def _patient():
+    from src.domain.entities.patient import Patient
+    from src.domain.value_objects.cpf import CPF
+
+    return Patient(
+        id=uuid4(),
+        caregiver_id=uuid4(),
+        full_name="Maria da Silva",
+        cpf=CPF(_cpfs(1)[0]),
+        date_of_birth=date(1940, 8, 15),
+        gender="F",
+        address="Rua Exemplo, 123",
+        phone="(11) 98765-4321",
+        emergency_contact="João da Silva",
+        emergency_phone="(11) 91234-5678",
+        medical_conditions="Hipertensão",
+        allergies="Dipirona",
+    )
+
+
+@case("cpf.is_valid[1000]")
+def _cpf_is_valid():
+    from src.domain.value_objects.cpf import CPF
+
+    cpfs = _cpfs(1000)
+    return lambda: [CPF._is_valid_cpf(cpf) for cpf in cpfs]
+
+
+@case("cpf.construct_formatted[1000]")
+def _cpf_construct():
+    from src.domain.value_objects.cpf import CPF
+
+    cpfs = [f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}" for c in _cpfs(1000)]
+    return lambda: [CPF(cpf) for cpf in cpfs]
+
+
+@case("email.validate[1000]")
+def _email_validate():
+    from src.domain.value_objects.email import Email
+
+    emails = [f"cuidador.{index}@clinica{index % 50}.com.br" for index in range(1000)]
+    return lambda: [Email(email) for email in emails]
+
+
+@case("phone.validate[1000]")
+def _phone_validate():
+    from src.domain.value_objects.phone import Phone
+
+    phones = [f"(11) 9{index:04d}-{index * 7 % 10000:04d}" for index in range(1000)]
+    return lambda: [Phone(phone) for phone in phones]
+
+
+@case("patient.get_age")
+def _patient_get_age():
+    patient = _patient()
+    reference = date(2024, 3, 1)
+    return lambda: patient.get_age(reference)
+
+
+@case("scheduler.daily_schedule[20 meds]")
+def _daily_schedule():
+    from src.domain.services.medication_scheduler import MedicationScheduler
+
+    medications = _medications(20)
+    day = datetime(2024, 6, 1)
+    return lambda: MedicationScheduler.generate_daily_schedule(medications, day)
+
+
+@case("scheduler.medication_conflict[20 meds]")
+def _medication_conflict():
+    from src.domain.services.medication_scheduler import MedicationScheduler
+
+    existing = _medications(20)
+    new = _medications(1)[0]
+    return lambda: MedicationScheduler.check_medication_conflict(existing, new)
+
+
+def _configure_mappers() -> None:
+    # Relationships name each other by string; import every model so the
+    # first mapper use (not the timed loop) pays for configuration
+    from sqlalchemy.orm import configure_mappers
+
+    from src.infrastructure.database.models import (  # noqa: F401
+        appointment_model,
+        medication_model,
+        patient_model,
+        stored_blob_model,
+        user_model,
+    )
+    configure_mappers()
+
+
+@case("repository.patient_to_model")
+def _patient_to_model():
+    from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+        SQLAlchemyPatientRepository,
+    )
+
+    _configure_mappers()
+    patient = _patient()
+    return lambda: SQLAlchemyPatientRepository._to_model(patient)
+
+
+@case("repository.patient_to_entity")
+def _patient_to_entity():
+    from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+        SQLAlchemyPatientRepository,
+    )
+
+    _configure_mappers()
+    model = SQLAlchemyPatientRepository._to_model(_patient())
+    return lambda: SQLAlchemyPatientRepository._to_entity(model)
+
+
+@case("repository.medication_to_entity")
+def _medication_to_entity():
+    from src.infrastructure.database.models.medication_model import MedicationModel
+    from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+        SQLAlchemyPatientRepository,
+    )
+
+    _configure_mappers()
+    medication = _medications(1)[0]
+    model = MedicationModel(**{
+        column: getattr(medication, column)
+        for column in (
+            "id", "patient_id", "name", "dosage", "frequency", "schedule_times",
+            "start_date", "end_date", "instructions", "is_active", "created_at", "updated_at",
+        )
+    })
+    return lambda: SQLAlchemyPatientRepository._medication_to_entity(model)
+
+
+@case("repository.find_by_caregiver[sqlite, 10 patients]")
+def _find_by_caregiver():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from src.domain.value_objects.cpf import CPF
+    from src.infrastructure.database.session import Base
+    from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+        SQLAlchemyPatientRepository,
+    )
+
+    _configure_mappers()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    repository = SQLAlchemyPatientRepository(session)
+    caregiver_id = uuid4()
+    for cpf in _cpfs(10):
+        patient = _patient()
+        patient.caregiver_id, patient.cpf = caregiver_id, CPF(cpf)
+        repository.save(patient)
+    session.commit()
+
+    def find():
+        session.expunge_all()  # load rows, not identity-map hits
+        return repository.find_by_caregiver(caregiver_id)
+    return find
+
+
+def _patient_payload(count: int) -> bytes:
+    caregiver_id = str(uuid4())
+    return json.dumps([
+        {
+            "caregiver_id": caregiver_id,
+            "full_name": f"Patient {index}",
+            "cpf": cpf,
+            "date_of_birth": "1950-05-15",
+            "gender": "F",
+            "address": "Rua Exemplo, 123",
+            "phone": "(11) 98765-4321",
+            "emergency_contact": "João da Silva",
+            "emergency_phone": "(11) 91234-5678",
+            "allergies": "Dipirona",
+        }
+        for index, cpf in enumerate(_cpfs(count))
+    ]).encode()
+
+
+@case("validation.create_patient.handwritten[10k]")
+def _validate_patients_handwritten():
+    # The route's checks before request schemas, kept as the baseline
+    from uuid import UUID
+
+    from src.application.use_cases.patients.create_patient import CreatePatientInput
+
+    payload = _patient_payload(10_000)
+    required_fields = [
+        "caregiver_id", "full_name", "cpf", "date_of_birth", "gender",
+        "address", "phone", "emergency_contact", "emergency_phone",
+    ]
+
+    def validate():
+        inputs = []
+        for data in json.loads(payload):
+            if not all(field in data for field in required_fields):
+                raise ValueError("Missing required fields")
+            inputs.append(CreatePatientInput(
+                caregiver_id=UUID(data["caregiver_id"]),
+                full_name=data["full_name"],
+                cpf=data["cpf"],
+                date_of_birth=datetime.strptime(data["date_of_birth"], "%Y-%m-%d").date(),
+                gender=data["gender"],
+                address=data["address"],
+                phone=data["phone"],
+                emergency_contact=data["emergency_contact"],
+                emergency_phone=data["emergency_phone"],
+                medical_conditions=data.get("medical_conditions"),
+                allergies=data.get("allergies"),
+                observations=data.get("observations"),
+            ))
+        return inputs
+    return validate
+
+
+@case("validation.create_patient.schema[10k]")
+def _validate_patients_schema():
+    from pydantic import TypeAdapter
+
+    from src.presentation.api.v1.schemas.patient_schemas import CreatePatientRequest
+
+    payload = _patient_payload(10_000)
+    adapter = TypeAdapter(list[CreatePatientRequest])
+    return lambda: adapter.validate_json(payload)
+
+
+@case("rate_limit.memory_acquire[3 buckets]")
+def _rate_limit_acquire():
+    from src.infrastructure.rate_limiting.token_bucket import InMemoryTokenBuckets, Limit
+
+    # Generous limits: every call takes the allowed path
+    buckets = InMemoryTokenBuckets()
+    request = [
+        ("auth.login:ip:203.0.113.7", Limit.parse("1000000/second")),
+        ("auth.login:account:" + "a" * 32, Limit.parse("1000000/second")),
+        ("auth.login:route:auth.login", Limit.parse("1000000/second")),
+    ]
+    return lambda: buckets.acquire(request)
+
+
+def run_cases(
+    selected: str | None = None,
+    rounds: int = 7,
+    min_time: float = 0.2,
+) -> list[Measurement]:
+    """Run every registered case whose name contains ``selected``."""
+    return [
+        measure(name, setup(), rounds=rounds, min_time=min_time)
+        for name, setup in CASES.items()
+        if not selected or selected in name
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-k", dest="selected", help="only run cases whose name contains this")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per round")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument(
+        "--compare", action="store_true", help="fail on slowdowns against the previous run"
+    )
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument(
+        "--no-save", action="store_true", help="don't append this run to the history"
+    )
+    args = parser.parse_args(argv)
+
+    # The mappers import src.config; no database is touched
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    previous = load_history(args.history)
+    measurements = run_cases(args.selected, rounds=args.rounds, min_time=args.min_time)
+
+    print(f"{'case':<40}{'median us':>12}{'min us':>12}{'loops':>10}")
+    for m in measurements:
+        print(f"{m.name:<40}{m.median_us:>12.2f}{m.min_us:>12.2f}{m.loops:>10}")
+
+    current = {
+        m.name: {"min_us": round(m.min_us, 3), "median_us": round(m.median_us, 3)}
+        for m in measurements
+    }
+    if not args.no_save:
+        append_history(args.history, {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "results": current,
+        })
+        print(f"run appended to {args.history}")
+
+    if not args.compare:
+        return 0
+    same_host = [entry for entry in previous if entry.get("host") == platform.node()]
+    if not same_host:
+        print("no previous run on this host to compare against")
+        return 0
+
+    slowdowns = compare_runs(current, same_host[-1]["results"], args.threshold)
+    for slowdown in slowdowns:
+        print(f"SLOWDOWN: {slowdown}", file=sys.stderr)
+    return 1 if slowdowns else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Small deterministic dataset for the API benchmarks."""
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+BENCHMARK_EMAIL = "benchmark.caregiver@cuidarplus.com"
+BENCHMARK_PASSWORD = "benchmark-password"
+
+
+@dataclass
+class SeedInfo:
+    """Identifiers the benchmark targets need."""
+    caregiver_id: UUID
+    patient_id: UUID
+    email: str
+    password: str
+
+
+def cpf_from_number(number: int) -> str:
+    """Valid CPF whose first nine digits are ``number`` (zero-padded)."""
+    base = f"{number % 10**9:09d}"
+    if base == base[0] * 9:
+        # Check digits would repeat too, and CPF rejects repeated digits
+        raise ValueError(f"No valid CPF starts with {base}")
+    digits = [int(d) for d in base]
+    for length in (9, 10):
+        total = sum(d * (length + 1 - i) for i, d in enumerate(digits))
+        digits.append((total * 10 % 11) % 10)
+    return "".join(map(str, digits))
+
+
+def seed_database(engine: Engine, patients: int = 200, seed: int = 42) -> SeedInfo:
+    """
+    Create the schema and one caregiver with ``patients`` patients, each
+    with a few medications and appointments.
+    """
+    from src.infrastructure.database.models.appointment_model import AppointmentModel
+    from src.infrastructure.database.models.medication_model import MedicationModel
+    from src.infrastructure.database.models.patient_model import PatientModel
+    from src.infrastructure.database.models.user_model import UserModel
+    from src.infrastructure.database.session import Base
+    from src.infrastructure.security.password_hasher import PasswordHasher
+
+    Base.metadata.create_all(engine)
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+
+    with Session(engine) as session:
+        caregiver = UserModel(
+            id=uuid4(),
+            email=BENCHMARK_EMAIL,
+            password_hash=PasswordHasher().hash(BENCHMARK_PASSWORD),
+            full_name="Benchmark Caregiver",
+            role="caregiver",
+        )
+        session.add(caregiver)
+
+        patient_ids = []
+        for index in range(patients):
+            patient_id = uuid4()
+            patient_ids.append(patient_id)
+            session.add(PatientModel(
+                id=patient_id,
+                caregiver_id=caregiver.id,
+                full_name=f"Patient {index:05d}",
+                cpf=cpf_from_number(10_000_000 + index),
+                date_of_birth=date(1930, 1, 1) + timedelta(days=rng.randrange(365 * 40)),
+                gender=rng.choice(["M", "F"]),
+                address="Rua Exemplo, 123",
+                phone="(11) 98765-4321",
+                emergency_contact="Contato",
+                emergency_phone="(11) 91234-5678",
+            ))
+            for number in range(rng.randint(1, 4)):
+                session.add(MedicationModel(
+                    patient_id=patient_id,
+                    name=f"Medication {number}",
+                    dosage="10mg",
+                    frequency="twice_daily",
+                    schedule_times=[time(8, 0), time(20, 0)],
+                    start_date=now - timedelta(days=rng.randrange(90)),
+                    is_active=rng.random() < 0.8,
+                ))
+            for _ in range(rng.randint(0, 3)):
+                session.add(AppointmentModel(
+                    patient_id=patient_id,
+                    title="Consulta",
+                    appointment_date=now + timedelta(hours=rng.randrange(-24 * 30, 24 * 30)),
+                    duration_minutes=30,
+                    location="Clínica",
+                ))
+        session.commit()
+
+        return SeedInfo(
+            caregiver_id=caregiver.id,
+            patient_id=patient_ids[0],
+            email=BENCHMARK_EMAIL,
+            password=BENCHMARK_PASSWORD,
+        )
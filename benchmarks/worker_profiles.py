@@ -0,0 +1,103 @@
+"""
+Compare gunicorn worker profiles (sync vs gthread) on the existing routes.
+
+Starts gunicorn with ``src/gunicorn_conf.py`` once per profile, drives the
+same routes at the same concurrency, and prints throughput and latency:
+
+    python -m benchmarks.worker_profiles --workers 4 --concurrency 32 --duration 20
+
+Uses DATABASE_URL from the environment; seed it first so the DB-backed
+routes return real rows.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.load import LoadResult, Target, run_load, wait_until_up
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def default_targets(token: str) -> list[Target]:
+    auth = {"Authorization": f"Bearer {token}"}
+    return [
+        Target("health", "/health"),
+        Target("reports", "/api/v1/reports/", headers=auth),
+        Target("patients", "/api/v1/patients/?pageSize=20", headers=auth),
+        Target("inventory", "/api/v1/inventory/?pageSize=20", headers=auth),
+    ]
+
+
+def run_profile(
+    profile: str,
+    targets: list[Target],
+    port: int,
+    workers: int,
+    threads: int,
+    concurrency: int,
+    duration_s: float,
+) -> LoadResult:
+    """Boot gunicorn with ``profile`` and load it."""
+    env = {
+        **os.environ,
+        "GUNICORN_WORKER_PROFILE": profile,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_WORKERS": str(workers),
+        "GUNICORN_THREADS": str(threads),
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", "-c", "python:src.gunicorn_conf",
+            "--access-logfile", "/dev/null",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_up(base_url)
+        return run_load(base_url, targets, concurrency=concurrency, duration_s=duration_s)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--profiles", nargs="+", default=["sync", "gthread"])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=5055)
+    args = parser.parse_args()
+
+    from src.infrastructure.security.jwt_handler import JWTHandler
+
+    targets = default_targets(JWTHandler().create_access_token(subject="benchmark"))
+
+    results = {
+        profile: run_profile(
+            profile, targets, args.port, args.workers, args.threads, args.concurrency, args.duration
+        )
+        for profile in args.profiles
+    }
+
+    print(f"\n{'profile':<10}{'route':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+    for profile, result in results.items():
+        for name, stats in result.targets.items():
+            print(
+                f"{profile:<10}{name:<12}{result.throughput(name):>10.1f}"
+                f"{stats.percentile(50):>10.1f}{stats.percentile(95):>10.1f}{stats.errors:>8}"
+            )
+        print(f"{profile:<10}{'total':<12}{result.throughput():>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
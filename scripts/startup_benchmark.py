@@ -0,0 +1,126 @@
+"""
+Cold start benchmark.
+
+Runs ``create_app()`` in a fresh interpreter under ``python -X importtime``
+and reports total import time, the slowest modules, create_app() wall time
+and peak RSS. Exits non-zero when a budget is exceeded, so it can gate CI:
+
+    python -m scripts.startup_benchmark --max-import-ms 1500 --max-rss-mb 150
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that should only be imported once the database is actually used
+DEFERRED_MODULES = ("psycopg2", "boto3")
+
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+from src.main import create_app
+from src.shared.utils.logger import get_log_pipeline
+app = create_app()
+# Logs are written by a background thread; drain and stop it so no record
+# lands on stdout next to (or inside) the JSON line below
+get_log_pipeline().stop()
+print(json.dumps({
+    "create_app_ms": (time.perf_counter() - started) * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+@dataclass
+class StartupReport:
+    """Result of one cold start."""
+    import_ms: float
+    create_app_ms: float
+    rss_mb: float
+    slowest: list[tuple[str, float]] = field(default_factory=list)
+    loaded_deferred: list[str] = field(default_factory=list)
+
+
+def parse_importtime(stderr: str) -> tuple[float, list[tuple[str, float]]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns the total import time (sum of top-level cumulative times) in ms,
+    and every module with its self time in ms, slowest first.
+    """
+    total_us = 0
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            total_us += int(cumulative_us)
+        modules.append((name.strip(), int(self_us) / 1000))
+    modules.sort(key=lambda module: module[1], reverse=True)
+    return total_us / 1000, modules
+
+
+def measure_startup(top: int = 10, env: dict[str, str] | None = None) -> StartupReport:
+    """Cold-start ``create_app()`` in a subprocess and collect its metrics."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    import_ms, modules = parse_importtime(result.stderr)
+
+    return StartupReport(
+        import_ms=import_ms,
+        create_app_ms=probe["create_app_ms"],
+        rss_mb=probe["rss_mb"],
+        slowest=modules[:top],
+        loaded_deferred=[name for name in DEFERRED_MODULES if name in probe["modules"]],
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to show")
+    parser.add_argument("--max-import-ms", type=float, help="fail above this total import time")
+    parser.add_argument("--max-rss-mb", type=float, help="fail above this peak RSS")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = measure_startup(top=args.top)
+
+    if args.json:
+        print(json.dumps(asdict(report), indent=2))
+    else:
+        print(f"import time:   {report.import_ms:8.1f} ms")
+        print(f"create_app():  {report.create_app_ms:8.1f} ms (includes imports)")
+        print(f"peak RSS:      {report.rss_mb:8.1f} MB")
+        print(f"deferred modules loaded: {', '.join(report.loaded_deferred) or 'none'}")
+        print("\nslowest modules (self time):")
+        for name, self_ms in report.slowest:
+            print(f"  {self_ms:8.2f} ms  {name}")
+
+    failures = []
+    if args.max_import_ms is not None and report.import_ms > args.max_import_ms:
+        failures.append(f"import time {report.import_ms:.1f} ms > {args.max_import_ms} ms")
+    if args.max_rss_mb is not None and report.rss_mb > args.max_rss_mb:
+        failures.append(f"peak RSS {report.rss_mb:.1f} MB > {args.max_rss_mb} MB")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
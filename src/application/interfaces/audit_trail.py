@@ -0,0 +1,38 @@
+"""Audit Trail Interface."""
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID, uuid4
+
+
+@dataclass(frozen=True)
+class PatientAccessEvent:
+    """Someone (``actor_id``) accessed a patient's record (LGPD access log)."""
+    actor_id: UUID | None
+    patient_id: UUID
+    action: str  # 'read', ...
+    route: str
+    request_id: str | None = None
+    ip_address: str | None = None
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+    id: UUID = field(default_factory=uuid4)
+
+
+class AuditTrail(ABC):
+    """
+    Audit Trail Interface (Port).
+
+    ``record`` must be cheap enough to call on every read request:
+    implementations buffer events and persist them in batches.
+    """
+
+    @abstractmethod
+    def record(self, events: Iterable[PatientAccessEvent]) -> None:
+        """Accept events for persistence; may return before they are stored."""
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Persist everything accepted so far."""
+        pass
@@ -0,0 +1,23 @@
+"""Last Login Recorder Interface."""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+
+class LastLoginRecorder(ABC):
+    """
+    Last Login Recorder Interface (Port).
+
+    Takes ``users.last_login`` writes off the login path: implementations
+    may persist them later, within a bounded delay.
+    """
+
+    @abstractmethod
+    def record(self, user_id: UUID, logged_in_at: datetime) -> None:
+        """Note a successful login; may return before it is stored."""
+        pass
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Persist every login noted so far."""
+        pass
@@ -1,45 +1,94 @@
 """Storage Service Interface."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+# Streaming payloads: either a readable binary file object or an iterable of chunks
+StreamSource = BinaryIO | Iterable[bytes]
 
 
 class StorageService(ABC):
     """
     Storage Service Interface (Port).
-    
+
     Infrastructure layer will implement this interface (e.g., S3, local storage).
+
+    The ``bytes``-based methods are kept for small payloads. Large files
+    (exam scans, reports) should go through the streaming methods so that
+    memory per transfer stays bounded by the chunk size.
     """
-    
+
     @abstractmethod
     def upload_file(
         self,
         file_path: str,
         content: bytes,
-        content_type: Optional[str] = None,
+        content_type: str | None = None,
     ) -> str:
         """
         Upload a file and return the URL.
-        
+
         Args:
             file_path: The path/key where the file should be stored
             content: The file content as bytes
             content_type: MIME type of the file
-        
+
+        Returns:
+            URL to access the uploaded file
+        """
+        pass
+
+    @abstractmethod
+    def upload_stream(
+        self,
+        file_path: str,
+        source: StreamSource,
+        content_type: str | None = None,
+    ) -> str:
+        """
+        Upload a file from a file-like object or an iterable of chunks.
+
+        Args:
+            file_path: The path/key where the file should be stored
+            source: Readable binary file object or iterable of byte chunks
+            content_type: MIME type of the file
+
         Returns:
             URL to access the uploaded file
         """
         pass
-    
+
     @abstractmethod
     def download_file(self, file_path: str) -> bytes:
         """Download a file and return its content."""
         pass
-    
+
+    @abstractmethod
+    def download_stream(
+        self,
+        file_path: str,
+        chunk_size: int | None = None,
+    ) -> Iterator[bytes]:
+        """Download a file as an iterator of chunks."""
+        pass
+
+    @abstractmethod
+    def download_range(self, file_path: str, start: int, end: int | None = None) -> bytes:
+        """
+        Download a byte range of a file.
+
+        Args:
+            file_path: The path/key of the file
+            start: First byte offset (inclusive)
+            end: Last byte offset (exclusive); ``None`` reads until the end
+        """
+        pass
+
     @abstractmethod
     def delete_file(self, file_path: str) -> bool:
         """Delete a file."""
         pass
-    
+
     @abstractmethod
     def file_exists(self, file_path: str) -> bool:
         """Check if a file exists."""
@@ -0,0 +1,26 @@
+"""Token Revocation Store Interface."""
+from abc import ABC, abstractmethod
+
+
+class TokenRevocationStore(ABC):
+    """
+    Token Revocation Store Interface (Port).
+
+    Holds the IDs (``jti``, or a refresh token family) of tokens that must
+    no longer be accepted, until the tokens expire on their own.
+    """
+
+    @abstractmethod
+    def revoke(self, token_id: str, expires_at: int) -> bool:
+        """
+        Revoke ``token_id`` until ``expires_at`` (Unix time).
+
+        Returns ``False`` if it was already revoked, so a caller can use
+        revocation as an atomic "use once" check.
+        """
+        pass
+
+    @abstractmethod
+    def is_revoked(self, token_id: str) -> bool:
+        """Whether ``token_id`` is revoked."""
+        pass
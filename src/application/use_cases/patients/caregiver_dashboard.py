@@ -0,0 +1,102 @@
+"""Caregiver Dashboard Use Case."""
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.repositories.patient_repository import PatientRepository
+from src.domain.services.medication_scheduler import MedicationScheduler
+
+
+@dataclass
+class DashboardDose:
+    """A medication dose scheduled for today."""
+    medication_id: UUID
+    medication_name: str
+    dosage: str
+    scheduled_time: datetime
+
+
+@dataclass
+class DashboardAppointment:
+    """Summary of a patient's next appointment."""
+    id: UUID
+    title: str
+    appointment_date: datetime
+    location: str
+    doctor_name: str | None
+
+
+@dataclass
+class PatientDashboardItem:
+    """Dashboard row for a single patient."""
+    id: UUID
+    full_name: str
+    age: int
+    active_medication_count: int
+    todays_doses: list[DashboardDose]
+    next_appointment: DashboardAppointment | None
+
+
+@dataclass
+class CaregiverDashboardOutput:
+    """Output DTO for GetCaregiverDashboard use case."""
+    patients: list[PatientDashboardItem]
+    total: int
+
+
+class GetCaregiverDashboardUseCase:
+    """
+    Use Case: Build the caregiver dashboard.
+
+    All data comes from a single repository call, so the number of queries
+    does not grow with the number of patients.
+    """
+
+    def __init__(self, patient_repository: PatientRepository) -> None:
+        self._patient_repository = patient_repository
+
+    def execute(
+        self, caregiver_id: UUID, now: datetime | None = None
+    ) -> CaregiverDashboardOutput:
+        """
+        Execute the use case.
+
+        Steps:
+        1. Load patients with active medications and next appointment
+        2. Expand today's doses from the medication schedules
+        3. Map to dashboard DTOs
+        """
+
+        # Stored timestamps are naive UTC
+        now = now or datetime.utcnow()
+        snapshots = self._patient_repository.find_care_snapshots_by_caregiver(caregiver_id, now)
+
+        items = []
+        for snapshot in snapshots:
+            schedule = MedicationScheduler.generate_daily_schedule(snapshot.active_medications, now)
+            appointment = snapshot.next_appointment
+
+            items.append(PatientDashboardItem(
+                id=snapshot.patient.id,
+                full_name=snapshot.patient.full_name,
+                age=snapshot.patient.get_age(now.date()),
+                active_medication_count=len(snapshot.active_medications),
+                todays_doses=[
+                    DashboardDose(
+                        medication_id=dose["medication_id"],
+                        medication_name=dose["medication_name"],
+                        dosage=dose["dosage"],
+                        scheduled_time=dose["scheduled_time"],
+                    )
+                    for dose in schedule
+                ],
+                next_appointment=DashboardAppointment(
+                    id=appointment.id,
+                    title=appointment.title,
+                    appointment_date=appointment.appointment_date,
+                    location=appointment.location,
+                    doctor_name=appointment.doctor_name,
+                ) if appointment else None,
+            ))
+
+        return CaregiverDashboardOutput(patients=items, total=len(items))
@@ -1,7 +1,6 @@
 """Create Patient Use Case."""
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional
 from uuid import UUID
 
 from src.domain.entities.patient import Patient
@@ -22,9 +21,9 @@ class CreatePatientInput:
     phone: str
     emergency_contact: str
     emergency_phone: str
-    medical_conditions: Optional[str] = None
-    allergies: Optional[str] = None
-    observations: Optional[str] = None
+    medical_conditions: str | None = None
+    allergies: str | None = None
+    observations: str | None = None
 
 
 @dataclass
@@ -42,7 +41,7 @@ class CreatePatientUseCase:
     """
     Use Case: Create a new patient.
     """
-    
+
     def __init__(
         self,
         patient_repository: PatientRepository,
@@ -50,18 +49,18 @@ class CreatePatientUseCase:
     ) -> None:
         self._patient_repository = patient_repository
         self._user_repository = user_repository
-    
+
     def execute(self, input_dto: CreatePatientInput) -> CreatePatientOutput:
         """
         Execute the use case.
-        
+
         Steps:
         1. Validate caregiver exists
         2. Create patient entity
-        3. Persist patient
+        3. Persist patient unless the CPF is taken (one statement, race-free)
         4. Return output DTO
         """
-        
+
         # Validate caregiver exists
         caregiver = self._user_repository.find_by_id(input_dto.caregiver_id)
         if not caregiver:
@@ -69,7 +68,7 @@ class CreatePatientUseCase:
                 message=f"Caregiver with ID {input_dto.caregiver_id} not found",
                 code="CAREGIVER_NOT_FOUND",
             )
-        
+
         # Create patient entity
         patient = Patient.create(
             caregiver_id=input_dto.caregiver_id,
@@ -85,10 +84,15 @@ class CreatePatientUseCase:
             allergies=input_dto.allergies,
             observations=input_dto.observations,
         )
-        
+
         # Persist patient
-        saved_patient = self._patient_repository.save(patient)
-        
+        saved_patient = self._patient_repository.insert_if_absent(patient)
+        if saved_patient is None:
+            raise ApplicationException(
+                message="Patient with this CPF already exists",
+                code="PATIENT_ALREADY_EXISTS",
+            )
+
         # Return output DTO
         return CreatePatientOutput(
             id=saved_patient.id,
@@ -1,11 +1,11 @@
 """Authenticate User Use Case."""
 from dataclasses import dataclass
-from typing import Optional
 
+from src.application.interfaces.last_login_recorder import LastLoginRecorder
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.value_objects.email import Email
-from src.infrastructure.security.password_hasher import PasswordHasher
 from src.infrastructure.security.jwt_handler import JWTHandler
+from src.infrastructure.security.password_hasher import PasswordHasher
 from src.shared.exceptions.application_exception import ApplicationException
 
 
@@ -20,7 +20,7 @@ class AuthenticateUserInput:
 class AuthenticateUserOutput:
     """Output DTO for AuthenticateUser use case."""
     access_token: str
-    refresh_token: Optional[str]
+    refresh_token: str | None
     token_type: str
     expires_in: int
 
@@ -29,66 +29,71 @@ class AuthenticateUserUseCase:
     """
     Use Case: Authenticate a user and generate JWT tokens.
     """
-    
+
     def __init__(
         self,
         user_repository: UserRepository,
         password_hasher: PasswordHasher,
         jwt_handler: JWTHandler,
+        last_login_recorder: LastLoginRecorder | None = None,
     ) -> None:
         self._user_repository = user_repository
         self._password_hasher = password_hasher
         self._jwt_handler = jwt_handler
-    
+        self._last_login_recorder = last_login_recorder
+
     def execute(self, input_dto: AuthenticateUserInput) -> AuthenticateUserOutput:
         """
         Execute the use case.
-        
+
         Steps:
         1. Find user by email
         2. Verify password
         3. Check if user is active
         4. Generate JWT tokens
-        5. Update last login
+        5. Update last login (deferred when a recorder is given)
         6. Return tokens
         """
-        
+
         # Find user by email
         email = Email(input_dto.email)
         user = self._user_repository.find_by_email(email)
-        
+
         if not user:
             raise ApplicationException(
                 message="Invalid email or password",
                 code="INVALID_CREDENTIALS",
             )
-        
+
         # Verify password
         if not self._password_hasher.verify(input_dto.password, user.password_hash):
             raise ApplicationException(
                 message="Invalid email or password",
                 code="INVALID_CREDENTIALS",
             )
-        
+
         # Check if user is active
         if not user.is_active:
             raise ApplicationException(
                 message="User account is inactive",
                 code="INACTIVE_USER",
             )
-        
+
         # Generate JWT tokens
         access_token = self._jwt_handler.create_access_token(
             subject=str(user.id),
             additional_claims={"email": str(user.email), "role": user.role}
         )
-        
+
         refresh_token = self._jwt_handler.create_refresh_token(subject=str(user.id))
-        
+
         # Update last login
         user.update_last_login()
-        self._user_repository.save(user)
-        
+        if self._last_login_recorder is not None:
+            self._last_login_recorder.record(user.id, user.last_login)
+        else:
+            self._user_repository.save(user)
+
         # Return tokens
         return AuthenticateUserOutput(
             access_token=access_token,
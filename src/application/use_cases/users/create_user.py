@@ -31,10 +31,10 @@ class CreateUserOutput:
 class CreateUserUseCase:
     """
     Use Case: Create a new user.
-    
+
     Orchestrates the user creation process following business rules.
     """
-    
+
     def __init__(
         self,
         user_repository: UserRepository,
@@ -42,30 +42,25 @@ class CreateUserUseCase:
     ) -> None:
         self._user_repository = user_repository
         self._password_hasher = password_hasher
-    
+
     def execute(self, input_dto: CreateUserInput) -> CreateUserOutput:
         """
         Execute the use case.
-        
+
         Steps:
-        1. Validate email uniqueness
+        1. Validate email format
         2. Hash password
         3. Create user entity
-        4. Persist user
+        4. Persist user unless the email is taken (one statement, race-free)
         5. Return output DTO
         """
-        
-        # Validate email uniqueness
-        email = Email(input_dto.email)
-        if self._user_repository.exists_by_email(email):
-            raise ApplicationException(
-                message="User with this email already exists",
-                code="USER_ALREADY_EXISTS",
-            )
-        
+
+        # Validate email format before paying for the hash
+        Email(input_dto.email)
+
         # Hash password
         password_hash = self._password_hasher.hash(input_dto.password)
-        
+
         # Create user entity (business rules applied here)
         user = User.create(
             email=input_dto.email,
@@ -73,10 +68,15 @@ class CreateUserUseCase:
             full_name=input_dto.full_name,
             role=input_dto.role,
         )
-        
-        # Persist user
-        saved_user = self._user_repository.save(user)
-        
+
+        # Persist user; the unique email constraint decides between concurrent signups
+        saved_user = self._user_repository.insert_if_absent(user)
+        if saved_user is None:
+            raise ApplicationException(
+                message="User with this email already exists",
+                code="USER_ALREADY_EXISTS",
+            )
+
         # Return output DTO
         return CreateUserOutput(
             id=saved_user.id,
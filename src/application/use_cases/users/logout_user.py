@@ -0,0 +1,48 @@
+"""Logout User Use Case."""
+import time
+from dataclasses import dataclass
+
+from src.application.interfaces.token_revocation_store import TokenRevocationStore
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.shared.exceptions.application_exception import ApplicationException
+
+
+@dataclass
+class LogoutUserInput:
+    """Input DTO for LogoutUser use case."""
+    user_id: str
+    access_token_id: str | None
+    access_token_expires_at: int
+    refresh_token: str | None = None
+
+
+class LogoutUserUseCase:
+    """
+    Use Case: Revoke the caller's access token and, if given, the family
+    of their refresh token.
+    """
+
+    def __init__(
+        self,
+        jwt_handler: JWTHandler,
+        revocation_store: TokenRevocationStore,
+    ) -> None:
+        self._jwt_handler = jwt_handler
+        self._revocation_store = revocation_store
+
+    def execute(self, input_dto: LogoutUserInput) -> None:
+        """Execute the use case."""
+
+        if input_dto.refresh_token:
+            payload = self._jwt_handler.decode_token(input_dto.refresh_token)
+            if payload.get("type") != "refresh" or payload.get("sub") != input_dto.user_id:
+                raise ApplicationException(message="Invalid refresh token", code="INVALID_TOKEN")
+            if payload.get("fam"):
+                self._revocation_store.revoke(
+                    payload["fam"], int(time.time()) + self._jwt_handler.refresh_token_expires
+                )
+
+        if input_dto.access_token_id:
+            self._revocation_store.revoke(
+                input_dto.access_token_id, input_dto.access_token_expires_at
+            )
@@ -0,0 +1,101 @@
+"""Refresh Tokens Use Case."""
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.interfaces.token_revocation_store import TokenRevocationStore
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.shared.exceptions.application_exception import ApplicationException
+
+
+@dataclass
+class RefreshTokensInput:
+    """Input DTO for RefreshTokens use case."""
+    refresh_token: str
+
+
+@dataclass
+class RefreshTokensOutput:
+    """Output DTO for RefreshTokens use case."""
+    access_token: str
+    refresh_token: str
+    token_type: str
+    expires_in: int
+
+
+class RefreshTokensUseCase:
+    """
+    Use Case: Exchange a refresh token for a new access/refresh token pair.
+
+    Refresh tokens are single use. Presenting one that was already
+    rotated means it leaked: the whole family is revoked, logging out
+    both the attacker and the legitimate user.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        jwt_handler: JWTHandler,
+        revocation_store: TokenRevocationStore,
+    ) -> None:
+        self._user_repository = user_repository
+        self._jwt_handler = jwt_handler
+        self._revocation_store = revocation_store
+
+    def execute(self, input_dto: RefreshTokensInput) -> RefreshTokensOutput:
+        """
+        Execute the use case.
+
+        Steps:
+        1. Decode the refresh token (raises ValueError if invalid or expired)
+        2. Reject revoked families
+        3. Revoke the token; if it already was, revoke its family
+        4. Check the user is still active
+        5. Issue new tokens in the same family
+        """
+
+        payload = self._jwt_handler.decode_token(input_dto.refresh_token)
+        if payload.get("type") != "refresh":
+            raise ApplicationException(message="Invalid token type", code="INVALID_TOKEN_TYPE")
+
+        token_id = payload.get("jti")
+        family_id = payload.get("fam")
+        if not token_id or not family_id:
+            raise ApplicationException(
+                message="Refresh token can no longer be used, please log in again",
+                code="TOKEN_NOT_ROTATABLE",
+            )
+
+        if self._revocation_store.is_revoked(family_id):
+            raise ApplicationException(
+                message="Refresh token has been revoked", code="TOKEN_REVOKED"
+            )
+
+        # Atomic: of two concurrent refreshes with the same token, one wins
+        if not self._revocation_store.revoke(token_id, payload["exp"]):
+            self._revocation_store.revoke(
+                family_id, int(time.time()) + self._jwt_handler.refresh_token_expires
+            )
+            raise ApplicationException(
+                message="Refresh token was already used", code="TOKEN_REUSED"
+            )
+
+        user = self._user_repository.find_by_id(UUID(payload["sub"]))
+        if not user or not user.is_active:
+            raise ApplicationException(message="User account is inactive", code="INACTIVE_USER")
+
+        access_token = self._jwt_handler.create_access_token(
+            subject=str(user.id),
+            additional_claims={"email": str(user.email), "role": user.role}
+        )
+        refresh_token = self._jwt_handler.create_refresh_token(
+            subject=str(user.id), family_id=family_id
+        )
+
+        return RefreshTokensOutput(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="Bearer",
+            expires_in=self._jwt_handler.access_token_expires,
+        )
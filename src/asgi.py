@@ -0,0 +1,26 @@
+"""
+ASGI entry point: the async read API.
+
+Runs next to the WSGI app (``src.main`` under gunicorn), typically behind
+the same proxy with the read paths below routed here:
+
+    uvicorn src.asgi:app --host 0.0.0.0 --port 5001 --workers 2
+
+    GET /health
+    GET /api/v1/users/<user_id>
+    GET /api/v1/patients/caregiver/<caregiver_id>
+    GET /api/v1/patients/caregiver/<caregiver_id>/dashboard
+
+Writes and the remaining routes stay on the WSGI app.
+"""
+from src.presentation.asgi.app import AsyncApp
+from src.presentation.asgi.routes import register_read_routes
+
+
+def create_asgi_app() -> AsyncApp:
+    app = AsyncApp()
+    register_read_routes(app)
+    return app
+
+
+app = create_asgi_app()
@@ -1,7 +1,5 @@
 """Application Configuration."""
-import os
 from functools import lru_cache
-from typing import Optional
 
 from pydantic_settings import BaseSettings
 
@@ -9,68 +7,177 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
-    
+
     Uses Pydantic Settings for validation and type conversion.
     """
-    
+
     # Application
     FLASK_APP: str = "src.main:create_app"
     FLASK_ENV: str = "development"
     SECRET_KEY: str
     API_VERSION: str = "v1"
-    
+
     # Database
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
-    
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds; below typical proxy/NAT idle cut-offs
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 5000
+    DATABASE_LOCK_TIMEOUT_MS: int = 2000
+
+    DATABASE_ECHO: bool = False  # Log every SQL statement (local debugging only)
+
+    # Query tracing (Server-Timing headers and slow-query log)
+    QUERY_TRACING_ENABLED: bool = True
+    QUERY_TRACING_SAMPLE_RATE: float = 1.0
+    QUERY_TRACING_TOP_N: int = 3
+    QUERY_SLOW_THRESHOLD_MS: float = 200
+    QUERY_N_PLUS_ONE_MODE: str = "off"  # 'off', 'log' (staging) or 'raise' (tests)
+    QUERY_N_PLUS_ONE_THRESHOLD: int = 5  # Same statement shape allowed per request
+
+    # Metrics (/metrics, Prometheus text format)
+    METRICS_ENABLED: bool = True
+    # Worker snapshots under gunicorn; defaults to a temp dir
+    METRICS_MULTIPROC_DIR: str | None = None
+    METRICS_FLUSH_INTERVAL: float = 5  # seconds between a worker's snapshots
+    # Bearer token for scrapes; unset serves /metrics openly, without the db_pool_* families
+    METRICS_TOKEN: str | None = None
+
+    # Request profiling (see src/presentation/api/middlewares/profiling.py)
+    PROFILING_ENABLED: bool = False  # Off registers no hooks at all
+    PROFILING_SAMPLE_RATE: float = 0.0  # Fraction of requests profiled without being asked
+    PROFILING_INTERVAL_MS: float = 5
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_PROFILES: int = 200
+    PROFILING_SECRET: str | None = None  # Signs X-Profile tokens; defaults to SECRET_KEY
+
+    # Patient access audit trail (see src/infrastructure/audit)
+    AUDIT_ENABLED: bool = True
+    AUDIT_BATCH_SIZE: int = 500  # Events per bulk INSERT
+    AUDIT_FLUSH_INTERVAL_MS: float = 1000  # Longest an event waits in memory
+    AUDIT_MAX_BUFFER: int = 50000  # Beyond this, events go straight to the spool
+    AUDIT_SPOOL_DIR: str = "audit-spool"  # Batches the database rejected, replayed later
+
+    # users.last_login is written in batches; the stored value lags by at most the interval
+    LAST_LOGIN_FLUSH_INTERVAL: float = 30  # seconds
+    LAST_LOGIN_MAX_PENDING: int = 1000  # Users waiting before an early flush
+
+    # Reverse proxies in front of the app whose X-Forwarded-For entries are trusted
+    # for the client IP (rate limits, audit trail); 0 uses the socket peer address
+    PROXY_FIX_X_FOR: int = 0
+
+    # Rate limiting of login and write requests (token buckets)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "redis"  # 'redis' (shared by workers) or 'memory' (per worker)
+    RATE_LIMIT_MAX_LOCAL_KEYS: int = 100000  # Per-worker buckets kept (fallback and 'memory')
+    # Endpoint, blueprint or '*' -> limit per 'ip', 'account' and 'route'; JSON in the environment
+    RATE_LIMIT_RULES: dict[str, dict[str, str]] = {
+        "auth.login": {
+            "ip": "20/minute", "account": "5/minute burst 10", "route": "1200/minute burst 200",
+        },
+        "auth": {"ip": "60/minute"},
+        "*": {"ip": "300/minute burst 60", "account": "120/minute burst 30"},
+    }
+
+    # Async read API (src/asgi.py); defaults to DATABASE_URL with the asyncio driver
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Read replicas (comma-separated URLs); read-only sessions are routed here
+    DATABASE_REPLICA_URLS: str = ""
+    DATABASE_REPLICA_RETRY_INTERVAL: float = 30  # seconds a failed replica stays out
+
+    # Reporting database pool (long-running /reports queries)
+    REPORTING_DATABASE_URL: str | None = None  # Defaults to DATABASE_URL
+    REPORTING_DATABASE_POOL_SIZE: int = 3
+    REPORTING_DATABASE_MAX_OVERFLOW: int = 2
+    REPORTING_DATABASE_POOL_TIMEOUT: float = 5
+    REPORTING_DATABASE_STATEMENT_TIMEOUT_MS: int = 60000
+    # Report queries run concurrently on threads sharing the reporting pool
+    REPORT_QUERY_WORKERS: int = 4  # Keep within pool size + overflow
+    REPORT_DEADLINE_SECONDS: float = 10
+
+    # Gunicorn (see src/gunicorn_conf.py)
+    GUNICORN_BIND: str = "0.0.0.0:5000"
+    GUNICORN_WORKER_PROFILE: str = "sync"  # 'sync' or 'gthread'
+    GUNICORN_WORKERS: int | None = None  # Defaults to 2 * CPUs + 1
+    GUNICORN_THREADS: int = 4  # Per worker, gthread profile only
+    GUNICORN_TIMEOUT: int = 120
+    GUNICORN_PRELOAD_APP: bool = True
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
-    
+
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRES: int = 3600  # 1 hour
     JWT_REFRESH_TOKEN_EXPIRES: int = 2592000  # 30 days
-    
+
+    # Token revocation (logout, refresh token rotation)
+    TOKEN_REVOCATION_BACKEND: str = "redis"  # 'redis' or 'memory' (single process only)
+    # Seconds other workers may still accept a revoked token
+    TOKEN_REVOCATION_SYNC_INTERVAL: float = 1.0
+    TOKEN_REVOCATION_FILTER_CAPACITY: int = 100000  # Revoked IDs per worker filter before it grows
+    # Fraction of valid tokens checked against Redis
+    TOKEN_REVOCATION_FILTER_ERROR_RATE: float = 0.001
+
     # Email (SMTP)
-    SMTP_HOST: Optional[str] = None
+    SMTP_HOST: str | None = None
     SMTP_PORT: int = 587
-    SMTP_USER: Optional[str] = None
-    SMTP_PASSWORD: Optional[str] = None
-    SMTP_FROM: Optional[str] = None
-    
+    SMTP_USER: str | None = None
+    SMTP_PASSWORD: str | None = None
+    SMTP_FROM: str | None = None
+
     # SMS (Twilio)
-    TWILIO_ACCOUNT_SID: Optional[str] = None
-    TWILIO_AUTH_TOKEN: Optional[str] = None
-    TWILIO_PHONE_NUMBER: Optional[str] = None
-    
+    TWILIO_ACCOUNT_SID: str | None = None
+    TWILIO_AUTH_TOKEN: str | None = None
+    TWILIO_PHONE_NUMBER: str | None = None
+
     # Storage (AWS S3)
-    AWS_ACCESS_KEY_ID: Optional[str] = None
-    AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    AWS_ACCESS_KEY_ID: str | None = None
+    AWS_SECRET_ACCESS_KEY: str | None = None
     AWS_REGION: str = "us-east-1"
-    AWS_BUCKET_NAME: Optional[str] = None
-    
+    AWS_BUCKET_NAME: str | None = None
+    AWS_ENDPOINT_URL: str | None = None  # S3-compatible endpoints (MinIO, R2, ...)
+
+    # Storage
+    STORAGE_BACKEND: str = "local"  # 'local' or 's3'
+    STORAGE_LOCAL_ROOT: str = "storage"
+    STORAGE_CHUNK_SIZE: int = 8 * 1024 * 1024  # 8 MiB (S3 minimum part size is 5 MiB)
+    STORAGE_MULTIPART_THRESHOLD: int = 16 * 1024 * 1024
+    STORAGE_MAX_CONCURRENCY: int = 4
+    STORAGE_DEDUPLICATE: bool = True  # Content-addressed blobs with reference counts
+
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
-    
+
     # Logging
     LOG_LEVEL: str = "INFO"
-    
+    LOG_FORMAT: str = "json"  # 'json' (one object per line) or 'text'
+    LOG_QUEUE_SIZE: int = 10000  # Records beyond this are dropped, never waited for
+    LOG_SAMPLING: str = ""  # Per-logger rates for DEBUG/INFO, e.g. "cuidar_plus.sql=0.1"
+    LOG_REQUESTS: bool = True  # One "request completed" record per request
+
     class Config:
         env_file = ".env"
         case_sensitive = True
-    
+
     def get_cors_origins(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    def get_replica_urls(self) -> list[str]:
+        """Parse read replica URLs from comma-separated string."""
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
 
-@lru_cache()
+@lru_cache
 def get_settings() -> Settings:
     """
     Get cached settings instance.
-    
+
     Using lru_cache ensures we only load settings once.
     """
     return Settings()
@@ -1,38 +1,66 @@
 """Patient Repository Interface."""
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID
 
+from ..entities.appointment import Appointment
+from ..entities.medication import Medication
 from ..entities.patient import Patient
 
 
+@dataclass
+class PatientCareSnapshot:
+    """Read model: a patient with the care data shown on the caregiver dashboard."""
+    patient: Patient
+    active_medications: list[Medication] = field(default_factory=list)
+    next_appointment: Appointment | None = None
+
+
 class PatientRepository(ABC):
     """
     Patient Repository Interface (Port).
-    
+
     Defines the contract for patient persistence operations.
     """
-    
+
     @abstractmethod
     def save(self, patient: Patient) -> Patient:
         """Persist a patient entity."""
         pass
-    
+
+    @abstractmethod
+    def insert_if_absent(self, patient: Patient) -> Patient | None:
+        """Insert a new patient unless the CPF is taken; ``None`` if it is."""
+        pass
+
     @abstractmethod
-    def find_by_id(self, patient_id: UUID) -> Optional[Patient]:
+    def find_by_id(self, patient_id: UUID) -> Patient | None:
         """Find patient by ID."""
         pass
-    
+
     @abstractmethod
     def find_by_caregiver(self, caregiver_id: UUID) -> list[Patient]:
         """Find all patients for a specific caregiver."""
         pass
-    
+
+    @abstractmethod
+    def find_care_snapshots_by_caregiver(
+        self,
+        caregiver_id: UUID,
+        now: datetime,
+    ) -> list[PatientCareSnapshot]:
+        """
+        Load the caregiver's patients with their active medications and next
+        scheduled appointment (after ``now``), in a bounded number of queries.
+        """
+        pass
+
     @abstractmethod
     def delete(self, patient_id: UUID) -> None:
         """Delete patient by ID."""
         pass
-    
+
     @abstractmethod
     def find_all(self, skip: int = 0, limit: int = 100) -> list[Patient]:
         """Find all patients with pagination."""
@@ -1,6 +1,5 @@
 """User Repository Interface."""
 from abc import ABC, abstractmethod
-from typing import Optional
 from uuid import UUID
 
 from ..entities.user import User
@@ -10,36 +9,41 @@ from ..value_objects.email import Email
 class UserRepository(ABC):
     """
     User Repository Interface (Port).
-    
+
     Defines the contract for user persistence operations.
     Infrastructure layer will implement this interface.
     """
-    
+
     @abstractmethod
     def save(self, user: User) -> User:
         """Persist a user entity."""
         pass
-    
+
+    @abstractmethod
+    def insert_if_absent(self, user: User) -> User | None:
+        """Insert a new user unless the email is taken; ``None`` if it is."""
+        pass
+
     @abstractmethod
-    def find_by_id(self, user_id: UUID) -> Optional[User]:
+    def find_by_id(self, user_id: UUID) -> User | None:
         """Find user by ID."""
         pass
-    
+
     @abstractmethod
-    def find_by_email(self, email: Email) -> Optional[User]:
+    def find_by_email(self, email: Email) -> User | None:
         """Find user by email."""
         pass
-    
+
     @abstractmethod
     def exists_by_email(self, email: Email) -> bool:
         """Check if user exists by email."""
         pass
-    
+
     @abstractmethod
     def delete(self, user_id: UUID) -> None:
         """Delete user by ID."""
         pass
-    
+
     @abstractmethod
     def find_all(self, skip: int = 0, limit: int = 100) -> list[User]:
         """Find all users with pagination."""
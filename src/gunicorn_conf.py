@@ -0,0 +1,72 @@
+"""
+Gunicorn configuration.
+
+Usage:
+    gunicorn -c python:src.gunicorn_conf
+
+The app is preloaded in the master process so workers share its imported
+code (copy-on-write) and boot faster. Database engines are created lazily,
+but anything the master did open before forking is discarded in
+``post_fork`` so no two processes ever share a connection socket.
+
+Worker profiles (GUNICORN_WORKER_PROFILE):
+    sync     one request at a time per worker process
+    gthread  GUNICORN_THREADS requests per worker; keep DATABASE_POOL_SIZE
+             (+ overflow) at least as large as the thread count
+
+Workers publish metric snapshots to METRICS_MULTIPROC_DIR, so /metrics
+reports all workers whichever one serves the scrape.
+"""
+import multiprocessing
+import os
+import tempfile
+
+from src.config import get_settings
+from src.infrastructure.metrics.multiprocess import enable_multiprocess
+
+settings = get_settings()
+
+WORKER_PROFILES = {
+    "sync": {"worker_class": "sync", "threads": 1},
+    "gthread": {"worker_class": "gthread", "threads": settings.GUNICORN_THREADS},
+}
+
+if settings.GUNICORN_WORKER_PROFILE not in WORKER_PROFILES:
+    raise ValueError(
+        f"Invalid GUNICORN_WORKER_PROFILE: {settings.GUNICORN_WORKER_PROFILE}. "
+        f"Must be one of {list(WORKER_PROFILES)}"
+    )
+
+_profile = WORKER_PROFILES[settings.GUNICORN_WORKER_PROFILE]
+
+wsgi_app = "src.main:create_app()"
+bind = settings.GUNICORN_BIND
+workers = settings.GUNICORN_WORKERS or multiprocessing.cpu_count() * 2 + 1
+worker_class = _profile["worker_class"]
+threads = _profile["threads"]
+timeout = settings.GUNICORN_TIMEOUT
+preload_app = settings.GUNICORN_PRELOAD_APP
+# The app logs one structured record per request (LOG_REQUESTS)
+accesslog = None
+
+metrics_dir = settings.METRICS_MULTIPROC_DIR or os.path.join(
+    tempfile.gettempdir(), "cuidar-plus-metrics"
+)
+_metrics = enable_multiprocess(metrics_dir, settings.METRICS_FLUSH_INTERVAL)
+
+
+def on_starting(server):
+    """Drop worker snapshots left over from a previous master."""
+    _metrics.clear()
+
+
+def post_fork(server, worker):
+    """Give each worker fresh pools instead of the master's connections."""
+    from src.infrastructure.database.session import engines
+
+    engines.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """An exited worker's gauges no longer describe anything live."""
+    _metrics.mark_process_dead(worker.pid)
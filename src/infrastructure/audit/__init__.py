@@ -0,0 +1 @@
+"""Audit trail package."""
@@ -0,0 +1,161 @@
+"""Buffered Audit Trail - batches access events per worker."""
+import atexit
+import os
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
+
+from src.application.interfaces.audit_trail import AuditTrail, PatientAccessEvent
+from src.config import get_settings
+from src.infrastructure.audit.spool import AuditSpool
+from src.infrastructure.audit.sqlalchemy_audit_store import SQLAlchemyAuditSink
+from src.infrastructure.database.session import OLTP, engines
+from src.shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("cuidar_plus.audit")
+
+# Spooled batches replayed per flush, so a backlog drains without stalling new events
+REPLAY_BATCHES_PER_FLUSH = 10
+
+
+class BufferedAuditTrail(AuditTrail):
+    """
+    Keeps events in memory and writes them in bulk from a background thread.
+
+    The thread flushes when ``batch_size`` events are waiting or every
+    ``flush_interval_ms``, whichever comes first. A batch the sink rejects
+    goes to the spool and is replayed after the next successful write. If
+    the buffer grows past ``max_buffer`` (the sink is hanging rather than
+    failing), the caller spills it to the spool itself instead of letting
+    it grow without bound.
+    """
+
+    def __init__(
+        self,
+        sink: SQLAlchemyAuditSink,
+        spool: AuditSpool,
+        batch_size: int = 500,
+        flush_interval_ms: float = 1000,
+        max_buffer: int = 50000,
+    ) -> None:
+        self.sink = sink
+        self.spool = spool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_buffer = max_buffer
+        self._buffer: list[PatientAccessEvent] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        # Leftovers from a previous run are replayed on the first flush
+        self._spool_pending = True
+
+    def record(self, events: Iterable[PatientAccessEvent]) -> None:
+        overflow: list[PatientAccessEvent] = []
+        with self._lock:
+            self._buffer.extend(events)
+            size = len(self._buffer)
+            if size > self.max_buffer:
+                overflow, self._buffer = self._buffer, []
+
+        if overflow:
+            logger.warning(f"Audit buffer over {self.max_buffer} events, spooling to disk")
+            self._spool(overflow)
+            return
+
+        self._ensure_thread()
+        if size >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+
+            if batch:
+                try:
+                    self.sink.write(batch)
+                except Exception as e:
+                    logger.error(f"Audit write of {len(batch)} events failed, spooling: {e}")
+                    self._spool(batch)
+                    return
+
+            if self._spool_pending:
+                self._replay()
+
+    def stop(self) -> None:
+        """Stop the flusher thread and write out what is buffered."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        self.flush()
+
+    def after_fork(self) -> None:
+        # The parent flushes its own buffer; the child starts empty, with
+        # fresh locks (the old ones may have been held mid-fork) and no thread
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None or self._stopping:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Audit flush failed: {e}")
+
+    def _spool(self, events: list[PatientAccessEvent]) -> None:
+        try:
+            self.spool.write(events)
+        except OSError as e:
+            logger.critical(f"Could not spool {len(events)} audit events, they are lost: {e}")
+            return
+        self._spool_pending = True
+
+    def _replay(self) -> None:
+        pending = self.spool.pending()
+        for path in pending[:REPLAY_BATCHES_PER_FLUSH]:
+            claimed = self.spool.claim(path)
+            if claimed is None:
+                continue
+            try:
+                self.sink.write(self.spool.load(claimed))
+            except Exception as e:
+                logger.warning(f"Replaying spooled audit batch {path.name} failed: {e}")
+                self.spool.release(claimed)
+                return
+            self.spool.remove(claimed)
+        self._spool_pending = len(pending) > REPLAY_BATCHES_PER_FLUSH
+
+
+@lru_cache
+def get_audit_trail() -> BufferedAuditTrail:
+    """The worker's audit trail, writing through the OLTP engine."""
+    trail = BufferedAuditTrail(
+        sink=SQLAlchemyAuditSink(lambda: engines.get_engine(OLTP)),
+        spool=AuditSpool(settings.AUDIT_SPOOL_DIR),
+        batch_size=settings.AUDIT_BATCH_SIZE,
+        flush_interval_ms=settings.AUDIT_FLUSH_INTERVAL_MS,
+        max_buffer=settings.AUDIT_MAX_BUFFER,
+    )
+    atexit.register(trail.stop)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=trail.after_fork)
+    return trail
@@ -0,0 +1,115 @@
+"""Crash-safe spool for audit events that could not be written to the database."""
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from src.application.interfaces.audit_trail import PatientAccessEvent
+
+
+def event_to_dict(event: PatientAccessEvent) -> dict:
+    return {
+        "id": str(event.id),
+        "actor_id": str(event.actor_id) if event.actor_id else None,
+        "patient_id": str(event.patient_id),
+        "action": event.action,
+        "route": event.route,
+        "request_id": event.request_id,
+        "ip_address": event.ip_address,
+        "occurred_at": event.occurred_at.isoformat(),
+    }
+
+
+def event_from_dict(data: dict) -> PatientAccessEvent:
+    return PatientAccessEvent(
+        id=UUID(data["id"]),
+        actor_id=UUID(data["actor_id"]) if data["actor_id"] else None,
+        patient_id=UUID(data["patient_id"]),
+        action=data["action"],
+        route=data["route"],
+        request_id=data["request_id"],
+        ip_address=data["ip_address"],
+        occurred_at=datetime.fromisoformat(data["occurred_at"]),
+    )
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AuditSpool:
+    """
+    Batches of events as JSON-lines files in ``directory``.
+
+    Each batch is written to a temporary file, fsynced and renamed into
+    place, so a crash leaves either a complete batch or none. Any worker
+    can replay a batch: it first claims the file by renaming it, and a
+    claim held by a process that no longer exists is taken over.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def write(self, events: list[PatientAccessEvent]) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        name = f"{stamp}-{os.getpid()}-{uuid4().hex[:8]}.jsonl"
+        tmp = self.directory / f".{name}.tmp"
+        with tmp.open("w") as spool_file:
+            for event in events:
+                spool_file.write(json.dumps(event_to_dict(event)) + "\n")
+            spool_file.flush()
+            os.fsync(spool_file.fileno())
+        path = self.directory / name
+        os.replace(tmp, path)
+        self._sync_directory()
+        return path
+
+    def pending(self) -> list[Path]:
+        """Batches waiting for replay, oldest first (including abandoned claims)."""
+        if not self.directory.exists():
+            return []
+        paths = sorted(self.directory.glob("*.jsonl"))
+        for claimed in sorted(self.directory.glob("*.jsonl.claimed-*")):
+            pid = int(claimed.name.rsplit("-", 1)[1])
+            if not _pid_alive(pid):
+                paths.append(claimed)
+        return paths
+
+    def claim(self, path: Path) -> Path | None:
+        """Take ownership of a batch; ``None`` if another worker got it first."""
+        base = path.name.split(".claimed-")[0]
+        claimed = path.with_name(f"{base}.claimed-{os.getpid()}")
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            return None
+        return claimed
+
+    @staticmethod
+    def load(path: Path) -> list[PatientAccessEvent]:
+        with path.open() as spool_file:
+            return [event_from_dict(json.loads(line)) for line in spool_file if line.strip()]
+
+    def release(self, claimed: Path) -> None:
+        """Give a claimed batch back, e.g. when its replay failed."""
+        base = claimed.name.split(".claimed-")[0]
+        os.replace(claimed, claimed.with_name(base))
+
+    def remove(self, claimed: Path) -> None:
+        claimed.unlink(missing_ok=True)
+
+    def _sync_directory(self) -> None:
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
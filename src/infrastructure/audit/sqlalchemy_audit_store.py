@@ -0,0 +1,165 @@
+"""SQLAlchemy storage for the patient access audit trail."""
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import and_, insert, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from src.application.interfaces.audit_trail import PatientAccessEvent
+from src.infrastructure.database.models.audit_event_model import PatientAccessEventModel
+
+TABLE = PatientAccessEventModel.__table__
+
+
+def _month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{TABLE.name}_y{month.year}m{month.month:02d}"
+
+
+def ensure_partitions(connection: Connection, months: set[date]) -> None:
+    """Create the monthly partitions of ``patient_access_events`` that are missing (PostgreSQL)."""
+    for month in sorted(months):
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+            f"PARTITION OF {TABLE.name} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        ))
+
+
+class SQLAlchemyAuditSink:
+    """
+    Writes batches of access events with one multi-row ``INSERT``.
+
+    Rows are inserted with ``ON CONFLICT DO NOTHING`` (``OR IGNORE`` on
+    SQLite), so replaying a spooled batch that was partly written already
+    is harmless. On PostgreSQL the monthly partitions a batch needs are
+    created on first use in each process.
+    """
+
+    def __init__(self, get_engine: Callable[[], Engine]) -> None:
+        self._get_engine = get_engine
+        self._partitions: set[date] = set()
+
+    def write(self, events: list[PatientAccessEvent]) -> None:
+        if not events:
+            return
+        engine = self._get_engine()
+        rows = [
+            {
+                "id": event.id,
+                "occurred_at": event.occurred_at,
+                "actor_id": event.actor_id,
+                "patient_id": event.patient_id,
+                "action": event.action,
+                "route": event.route,
+                "request_id": event.request_id,
+                "ip_address": event.ip_address,
+            }
+            for event in events
+        ]
+
+        with engine.begin() as connection:
+            if engine.dialect.name == "postgresql":
+                months = {_month_start(event.occurred_at) for event in events} - self._partitions
+                if months:
+                    ensure_partitions(connection, months)
+                    self._partitions |= months
+                statement = pg_insert(TABLE).on_conflict_do_nothing()
+            elif engine.dialect.name == "sqlite":
+                statement = insert(TABLE).prefix_with("OR IGNORE")
+            else:
+                statement = insert(TABLE)
+            connection.execute(statement, rows)
+
+
+@dataclass(frozen=True)
+class AuditEventPage:
+    """One page of access events, newest first."""
+    events: list[PatientAccessEvent]
+    next_cursor: str | None
+
+
+def encode_cursor(event: PatientAccessEvent) -> str:
+    return f"{event.occurred_at.isoformat()}_{event.id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    occurred_at, event_id = cursor.rsplit("_", 1)
+    return datetime.fromisoformat(occurred_at), UUID(event_id)
+
+
+class SQLAlchemyAuditEventReader:
+    """Query API over the access events for auditors."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def find_events(
+        self,
+        patient_id: UUID | None = None,
+        actor_id: UUID | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> AuditEventPage:
+        """
+        Events matching the filters, newest first.
+
+        Pages are keyset-paginated on ``(occurred_at, id)``: pass the
+        returned ``next_cursor`` to get the following page. Bounding
+        ``since``/``until`` lets PostgreSQL skip whole partitions.
+        """
+        query = select(PatientAccessEventModel)
+        if patient_id is not None:
+            query = query.where(PatientAccessEventModel.patient_id == patient_id)
+        if actor_id is not None:
+            query = query.where(PatientAccessEventModel.actor_id == actor_id)
+        if since is not None:
+            query = query.where(PatientAccessEventModel.occurred_at >= since)
+        if until is not None:
+            query = query.where(PatientAccessEventModel.occurred_at < until)
+        if cursor is not None:
+            occurred_at, event_id = decode_cursor(cursor)
+            query = query.where(or_(
+                PatientAccessEventModel.occurred_at < occurred_at,
+                and_(
+                    PatientAccessEventModel.occurred_at == occurred_at,
+                    PatientAccessEventModel.id < event_id,
+                ),
+            ))
+
+        models = self._session.scalars(
+            query.order_by(
+                PatientAccessEventModel.occurred_at.desc(),
+                PatientAccessEventModel.id.desc(),
+            ).limit(limit + 1)
+        ).all()
+
+        events = [self._to_event(model) for model in models[:limit]]
+        next_cursor = encode_cursor(events[-1]) if len(models) > limit else None
+        return AuditEventPage(events=events, next_cursor=next_cursor)
+
+    @staticmethod
+    def _to_event(model: PatientAccessEventModel) -> PatientAccessEvent:
+        return PatientAccessEvent(
+            id=model.id,
+            actor_id=model.actor_id,
+            patient_id=model.patient_id,
+            action=model.action,
+            route=model.route,
+            request_id=model.request_id,
+            ip_address=model.ip_address,
+            occurred_at=model.occurred_at,
+        )
@@ -0,0 +1,95 @@
+"""Async database sessions for the ASGI read API."""
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.config import get_settings
+from src.infrastructure.database.n_plus_one import watch_engine
+from src.infrastructure.database.query_tracing import instrument_engine
+
+settings = get_settings()
+
+# Sync driver -> asyncio driver of the same database
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """``DATABASE_URL`` with its driver swapped for the asyncio one."""
+    parsed = make_url(url)
+    if parsed.get_dialect().is_async:
+        return url
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for {backend!r}")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    The process's async engine, created on first use.
+
+    Pool sizing and timeouts follow the OLTP engine. Query tracing and
+    N+1 detection hook into the underlying sync engine, as for WSGI.
+    """
+    url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    kwargs: dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+    if not url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        )
+    if url.startswith("postgresql"):
+        kwargs["connect_args"] = {
+            "server_settings": {
+                "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT_MS),
+                "lock_timeout": str(settings.DATABASE_LOCK_TIMEOUT_MS),
+            },
+        }
+
+    engine = create_async_engine(url, **kwargs)
+    instrument_engine(engine.sync_engine)
+    watch_engine(engine.sync_engine)
+    return engine
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(get_async_engine(), expire_on_commit=False)
+
+
+@asynccontextmanager
+async def async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    A read-only session: flushing raises, and the transaction is rolled
+    back at the end.
+    """
+    async with get_async_sessionmaker()() as session:
+        session.sync_session.info["read_only"] = True
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled connections (ASGI lifespan shutdown)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
@@ -0,0 +1,55 @@
+"""Single-statement inserts that skip rows violating a unique constraint."""
+from typing import Any
+
+from sqlalchemy import Table, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.session import Base
+
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def insert_if_absent(session: Session, model: Base, conflict_column: str) -> Any | None:
+    """
+    ``INSERT ... ON CONFLICT (conflict_column) DO NOTHING RETURNING id``.
+
+    One round trip, and race-free: of two concurrent inserts with the same
+    value, exactly one gets its primary key back. Returns the new row's
+    primary key, or ``None`` if the value already exists. Dialects without
+    ``ON CONFLICT`` use a plain INSERT in a SAVEPOINT instead.
+    """
+    table = model.__table__
+    values = {column.key: getattr(model, column.key) for column in table.columns}
+
+    insert = _DIALECT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is None:
+        return _insert_in_savepoint(session, table, values, conflict_column)
+
+    statement = insert(table).values(values).on_conflict_do_nothing(
+        index_elements=[conflict_column]
+    ).returning(*table.primary_key.columns)
+    return session.execute(statement).scalar_one_or_none()
+
+
+def _insert_in_savepoint(
+    session: Session,
+    table: Table,
+    values: dict[str, Any],
+    conflict_column: str,
+) -> Any | None:
+    """Unique violations roll back only the savepoint; other integrity errors propagate."""
+    try:
+        with session.begin_nested():
+            session.execute(table.insert().values(values))
+    except IntegrityError:
+        column = table.columns[conflict_column]
+        if session.execute(select(column).where(column == values[conflict_column])).first() is None:
+            raise
+        return None
+    (primary_key,) = table.primary_key.columns
+    return values[primary_key.key]
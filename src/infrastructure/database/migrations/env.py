@@ -5,17 +5,24 @@ This script is called by Alembic when running migrations.
 """
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
-
 from alembic import context
+from sqlalchemy import engine_from_config, pool
 
 from src.config import get_settings
+
+# Imported so their tables are registered on Base.metadata
+from src.infrastructure.database.models.appointment_model import AppointmentModel  # noqa: F401
+from src.infrastructure.database.models.audit_event_model import (  # noqa: F401
+    PatientAccessEventModel,
+)
+from src.infrastructure.database.models.medication_model import MedicationModel  # noqa: F401
+from src.infrastructure.database.models.patient_model import PatientModel  # noqa: F401
+from src.infrastructure.database.models.stored_blob_model import (  # noqa: F401
+    StoredBlobModel,
+    StoredFileModel,
+)
+from src.infrastructure.database.models.user_model import UserModel  # noqa: F401
 from src.infrastructure.database.session import Base
-from src.infrastructure.database.models.user_model import UserModel
-from src.infrastructure.database.models.patient_model import PatientModel
-from src.infrastructure.database.models.medication_model import MedicationModel
-from src.infrastructure.database.models.appointment_model import AppointmentModel
 
 # Load settings
 settings = get_settings()
@@ -58,7 +65,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, 
+            connection=connection,
             target_metadata=target_metadata
         )
 
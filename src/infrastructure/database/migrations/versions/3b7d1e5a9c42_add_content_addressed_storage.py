@@ -0,0 +1,41 @@
+"""add_content_addressed_storage
+
+Revision ID: 3b7d1e5a9c42
+Revises: 918216d05e2a
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3b7d1e5a9c42'
+down_revision = '918216d05e2a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stored_blobs',
+        sa.Column('digest', sa.String(length=64), primary_key=True),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('content_type', sa.String(length=255), nullable=True),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        'stored_files',
+        sa.Column('file_path', sa.String(length=1024), primary_key=True),
+        sa.Column(
+            'digest', sa.String(length=64), sa.ForeignKey('stored_blobs.digest'), nullable=False
+        ),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_stored_files_digest', 'stored_files', ['digest'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stored_files_digest', table_name='stored_files')
+    op.drop_table('stored_files')
+    op.drop_table('stored_blobs')
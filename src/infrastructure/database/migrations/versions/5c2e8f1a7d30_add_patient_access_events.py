@@ -0,0 +1,84 @@
+"""add_patient_access_events
+
+Revision ID: 5c2e8f1a7d30
+Revises: 3b7d1e5a9c42
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from datetime import date
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8f1a7d30'
+down_revision = '3b7d1e5a9c42'
+branch_labels = None
+depends_on = None
+
+
+def _months_from_now(count: int) -> list[date]:
+    today = date.today()
+    months = []
+    year, month = today.year, today.month
+    for _ in range(count):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def upgrade() -> None:
+    op.create_table(
+        'patient_access_events',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('occurred_at', sa.DateTime(), nullable=False),
+        sa.Column('actor_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('action', sa.String(length=20), nullable=False),
+        sa.Column('route', sa.String(length=255), nullable=False),
+        sa.Column('request_id', sa.String(length=128), nullable=True),
+        sa.Column('ip_address', sa.String(length=45), nullable=True),
+        sa.PrimaryKeyConstraint('id', 'occurred_at'),
+        postgresql_partition_by='RANGE (occurred_at)',
+    )
+    op.create_index(
+        'ix_patient_access_events_patient_occurred', 'patient_access_events',
+        ['patient_id', 'occurred_at'], unique=False,
+    )
+    op.create_index(
+        'ix_patient_access_events_actor_occurred', 'patient_access_events',
+        ['actor_id', 'occurred_at'], unique=False,
+    )
+
+    # The application creates later months on first write; these cover the rollout
+    months = _months_from_now(4)
+    for start, end in zip(months[:-1], months[1:], strict=True):
+        op.execute(
+            f"CREATE TABLE patient_access_events_y{start.year}m{start.month:02d} "
+            f"PARTITION OF patient_access_events "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    # Append-only: rows are never changed or deleted (retention drops whole partitions)
+    op.execute("""
+        CREATE FUNCTION patient_access_events_append_only() RETURNS trigger AS $$
+        BEGIN
+            RAISE EXCEPTION 'patient_access_events is append-only';
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER patient_access_events_append_only
+        BEFORE UPDATE OR DELETE ON patient_access_events
+        FOR EACH ROW EXECUTE FUNCTION patient_access_events_append_only()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER patient_access_events_append_only ON patient_access_events")
+    op.execute("DROP FUNCTION patient_access_events_append_only()")
+    # Dropping the partitioned table drops its partitions too
+    op.drop_index('ix_patient_access_events_actor_occurred', table_name='patient_access_events')
+    op.drop_index('ix_patient_access_events_patient_occurred', table_name='patient_access_events')
+    op.drop_table('patient_access_events')
@@ -3,10 +3,10 @@ from datetime import datetime
 from uuid import uuid4
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..session import Base
+from ..types import GUID
 
 
 class AppointmentModel(Base):
@@ -14,8 +14,8 @@ class AppointmentModel(Base):
 
     __tablename__ = "appointments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False, index=True)
+    id = Column(GUID, primary_key=True, default=uuid4)
+    patient_id = Column(GUID, ForeignKey("patients.id"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     appointment_date = Column(DateTime, nullable=False, index=True)
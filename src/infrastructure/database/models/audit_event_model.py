@@ -0,0 +1,39 @@
+"""Audit SQLAlchemy Models."""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Index, String
+
+from ..session import Base
+from ..types import GUID
+
+
+class PatientAccessEventModel(Base):
+    """
+    Append-only log of patient record accesses.
+
+    On PostgreSQL the table is range-partitioned by month on
+    ``occurred_at`` (see the migration); the partition key must be part
+    of the primary key, hence the composite key.
+    """
+
+    __tablename__ = "patient_access_events"
+    __table_args__ = (
+        Index("ix_patient_access_events_patient_occurred", "patient_id", "occurred_at"),
+        Index("ix_patient_access_events_actor_occurred", "actor_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+    id = Column(GUID, primary_key=True)
+    occurred_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    actor_id = Column(GUID, nullable=True)
+    patient_id = Column(GUID, nullable=False)
+    action = Column(String(20), nullable=False)
+    route = Column(String(255), nullable=False)
+    request_id = Column(String(128), nullable=True)
+    ip_address = Column(String(45), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PatientAccessEvent(actor={self.actor_id}, patient={self.patient_id}, "
+            f"action={self.action})>"
+        )
@@ -2,33 +2,33 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text, ARRAY, Time
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
 from sqlalchemy.orm import relationship
 
 from ..session import Base
+from ..types import GUID, TimeList
 
 
 class MedicationModel(Base):
     """SQLAlchemy model for Medication entity."""
-    
+
     __tablename__ = "medications"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False, index=True)
+
+    id = Column(GUID, primary_key=True, default=uuid4)
+    patient_id = Column(GUID, ForeignKey("patients.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     dosage = Column(String(100), nullable=False)
     frequency = Column(String(50), nullable=False)
-    schedule_times = Column(ARRAY(Time), nullable=False)
+    schedule_times = Column(TimeList, nullable=False)
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=True)
     instructions = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    
+
     # Relationships
     patient = relationship("PatientModel", backref="medications")
-    
+
     def __repr__(self) -> str:
         return f"<Medication(id={self.id}, name={self.name}, patient_id={self.patient_id})>"
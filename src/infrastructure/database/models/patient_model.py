@@ -3,10 +3,10 @@ from datetime import datetime
 from uuid import uuid4
 
 from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from ..session import Base
+from ..types import GUID
 
 
 class PatientModel(Base):
@@ -14,8 +14,8 @@ class PatientModel(Base):
 
     __tablename__ = "patients"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    caregiver_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(GUID, primary_key=True, default=uuid4)
+    caregiver_id = Column(GUID, ForeignKey("users.id"), nullable=False, index=True)
     full_name = Column(String(255), nullable=False)
     cpf = Column(String(11), unique=True, nullable=False, index=True)
     date_of_birth = Column(Date, nullable=False)
@@ -0,0 +1,38 @@
+"""Content-addressed blob SQLAlchemy Models."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+
+from ..session import Base
+
+
+class StoredBlobModel(Base):
+    """A unique piece of content stored once under its SHA-256 digest."""
+
+    __tablename__ = "stored_blobs"
+
+    digest = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String(255), nullable=True)
+    ref_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<StoredBlob(digest={self.digest}, size={self.size}, refs={self.ref_count})>"
+
+
+class StoredFileModel(Base):
+    """A logical file path pointing to a stored blob."""
+
+    __tablename__ = "stored_files"
+
+    file_path = Column(String(1024), primary_key=True)
+    digest = Column(String(64), ForeignKey("stored_blobs.digest"), nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    blob = relationship("StoredBlobModel")
+
+    def __repr__(self) -> str:
+        return f"<StoredFile(file_path={self.file_path}, digest={self.digest})>"
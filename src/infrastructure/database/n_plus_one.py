@@ -0,0 +1,105 @@
+"""N+1 Query Detector - flags the same statement shape repeating within a request."""
+import re
+import threading
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.config import get_settings
+from src.shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("cuidar_plus.sql")
+
+# Placeholder lists such as "IN (?, ?, ?)" or "IN (%(id_1)s, %(id_2)s)" collapse to one shape
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+MODES = ("off", "log", "raise")
+
+
+class NPlusOneQueryError(RuntimeError):
+    """Raised when the same statement shape runs more often than allowed."""
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape, independent of bound values."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+@dataclass
+class QueryShapeCounter:
+    """Statement shapes executed within one detection scope."""
+    threshold: int
+    mode: str
+    shapes: Counter = field(default_factory=Counter)
+    # Copied contexts (e.g. report query threads) share the request's counter
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def total(self) -> int:
+        return sum(self.shapes.values())
+
+    def record(self, statement: str) -> None:
+        shape = normalize_statement(statement)
+        with self._lock:
+            self.shapes[shape] += 1
+            count = self.shapes[shape]
+
+        # Report once per shape, when it first crosses the threshold
+        if count != self.threshold + 1:
+            return
+
+        message = (
+            f"Possible N+1 query: statement ran more than {self.threshold} times "
+            f"in one request: {shape[:500]}"
+        )
+        if self.mode == "raise":
+            raise NPlusOneQueryError(message)
+        logger.warning(message)
+
+
+_current_counter: ContextVar[QueryShapeCounter | None] = ContextVar(
+    "query_shape_counter", default=None
+)
+
+
+def start_detection(threshold: int | None = None, mode: str | None = None) -> Token:
+    """Start counting statement shapes for the current context (request or test)."""
+    mode = mode or settings.QUERY_N_PLUS_ONE_MODE
+    if mode not in MODES:
+        raise ValueError(f"Invalid N+1 detection mode: {mode}")
+
+    counter = None
+    if mode != "off":
+        counter = QueryShapeCounter(
+            threshold=threshold if threshold is not None else settings.QUERY_N_PLUS_ONE_THRESHOLD,
+            mode=mode,
+        )
+    return _current_counter.set(counter)
+
+
+def end_detection(token: Token) -> QueryShapeCounter | None:
+    """Stop counting and return the shapes seen since ``start_detection``."""
+    counter = _current_counter.get()
+    _current_counter.reset(token)
+    return counter
+
+
+def watch_engine(engine: Engine) -> None:
+    """Attach the shape-counting listener to an engine."""
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.record(statement)
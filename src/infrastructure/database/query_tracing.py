@@ -0,0 +1,100 @@
+"""Query instrumentation - per-request query counts, DB time and slow statements."""
+import heapq
+import random
+import threading
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.config import get_settings
+from src.shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("cuidar_plus.sql")
+
+
+@dataclass
+class QueryStats:
+    """Database activity of a single traced unit of work (usually a request)."""
+    count: int = 0
+    total_ms: float = 0.0
+    top_n: int = 3
+    # Min-heap of (duration_ms, sequence, statement) keeping the slowest statements
+    _slowest: list[tuple[float, int, str]] = field(default_factory=list)
+    # Copied contexts (e.g. report query threads) share the request's stats
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            entry = (duration_ms, self.count, statement)
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, entry)
+            elif duration_ms > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest(self) -> list[tuple[float, str]]:
+        """Slowest statements, slowest first."""
+        return [(ms, stmt) for ms, _, stmt in sorted(self._slowest, reverse=True)]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_trace(sample_rate: float | None = None) -> Token:
+    """
+    Start collecting query stats for the current context.
+
+    Only a ``sample_rate`` fraction of calls is traced; the others get no
+    stats object and pay only for the slow-query check.
+    """
+    rate = settings.QUERY_TRACING_SAMPLE_RATE if sample_rate is None else sample_rate
+    sampled = rate >= 1 or random.random() < rate
+    stats = QueryStats(top_n=settings.QUERY_TRACING_TOP_N) if sampled else None
+    return _current_stats.set(stats)
+
+
+def end_trace(token: Token) -> QueryStats | None:
+    """Stop tracing and return the stats collected since ``start_trace``."""
+    stats = _current_stats.get()
+    _current_stats.reset(token)
+    return stats
+
+
+def current_stats() -> QueryStats | None:
+    """Stats of the trace active in this context, if sampled."""
+    return _current_stats.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the timing listeners to an engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    start_times = conn.info.get("query_start_times")
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration_ms)
+
+    if duration_ms >= settings.QUERY_SLOW_THRESHOLD_MS:
+        logger.warning(f"Slow query ({duration_ms:.1f} ms): {' '.join(statement.split())[:500]}")
@@ -0,0 +1,207 @@
+"""Report Executor - runs a report's independent queries concurrently."""
+import contextvars
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.infrastructure.database.session import REPORTING, EngineRegistry, close_session, engines
+
+settings = get_settings()
+
+ReportQuery = Callable[[Session], Any]
+
+
+class ReportDeadlineError(Exception):
+    """The report's queries did not all finish before its deadline."""
+
+    def __init__(self, deadline_s: float, timings_ms: dict[str, float]) -> None:
+        super().__init__(f"Report queries did not finish within {deadline_s:g}s")
+        self.deadline_s = deadline_s
+        self.timings_ms = timings_ms  # queries that did finish
+
+
+@dataclass(frozen=True)
+class ReportResult:
+    """Query results by name, with each query's wall time."""
+    values: dict[str, Any]
+    timings_ms: dict[str, float]
+    elapsed_ms: float
+
+
+class QueryWatchdog:
+    """
+    Interrupts a connection's running statement at the deadline.
+
+    ``Timer.cancel()`` cannot stop a callback that already started, so
+    the interrupt runs under a lock and only while the query is still
+    running: once ``disarm`` returns, the connection is never interrupted.
+    """
+
+    def __init__(self, interrupt: Callable[[], Any], timeout_s: float) -> None:
+        self._interrupt = interrupt
+        self._lock = threading.Lock()
+        self._done = False
+        self._timer = threading.Timer(timeout_s, self._fire)
+        self._timer.daemon = True
+
+    @classmethod
+    def start(cls, session: Session, timeout_s: float) -> "QueryWatchdog | None":
+        """Arm a watchdog for the session's connection, if the driver can interrupt it."""
+        dbapi_connection = session.connection().connection.dbapi_connection
+        interrupt = (
+            getattr(dbapi_connection, "interrupt", None)  # sqlite3
+            or getattr(dbapi_connection, "cancel", None)  # psycopg, oracledb
+        )
+        if interrupt is None:
+            return None
+        watchdog = cls(interrupt, timeout_s)
+        watchdog._timer.start()
+        return watchdog
+
+    def disarm(self) -> None:
+        """Mark the query done; waits for an interrupt already in progress."""
+        with self._lock:
+            self._done = True
+        self._timer.cancel()
+
+    def _fire(self) -> None:
+        with self._lock:
+            if not self._done:
+                self._interrupt()
+
+
+class ReportExecutor:
+    """
+    Runs independent queries at once, each in its own session (so on its
+    own pooled connection), and waits for all of them up to a deadline.
+
+    A report then takes as long as its slowest query instead of the sum.
+    Threads are shared by all reports of the process and capped at
+    ``max_workers``, which should not exceed the engine's pool: queries
+    of concurrent reports queue for a thread instead of timing out on a
+    pool checkout. On PostgreSQL each query's ``statement_timeout`` is
+    the time left until the deadline, so a late query is cancelled by the
+    server rather than holding its connection; on other dialects a timer
+    interrupts the connection's running statement at the deadline, where
+    the driver supports it (``interrupt()``/``cancel()``).
+    """
+
+    def __init__(
+        self,
+        registry: EngineRegistry,
+        engine_name: str = REPORTING,
+        max_workers: int = 4,
+    ) -> None:
+        self._registry = registry
+        self._engine_name = engine_name
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def run(self, queries: dict[str, ReportQuery], deadline_s: float) -> ReportResult:
+        """
+        Run every query and return their results by name.
+
+        Raises ``ReportDeadlineError`` when any is still running after
+        ``deadline_s`` seconds; the first query error is re-raised as is.
+        """
+        started = time.perf_counter()
+        deadline = time.monotonic() + deadline_s
+        timings_ms: dict[str, float] = {}
+        pool = self._get_pool()
+
+        # Each query runs in a copy of the caller's context, so query
+        # tracing and log fields still attribute it to this request
+        futures: dict[Future, str] = {
+            pool.submit(
+                contextvars.copy_context().run, self._run_query, name, query, deadline, timings_ms
+            ): name
+            for name, query in queries.items()
+        }
+        done, pending = wait(futures, timeout=deadline_s, return_when=FIRST_EXCEPTION)
+
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                self._cancel(pending)
+                if time.monotonic() >= deadline:
+                    # Cancelled by its statement timeout or watchdog
+                    raise ReportDeadlineError(deadline_s, dict(timings_ms)) from error
+                raise error
+        if pending:
+            self._cancel(pending)
+            raise ReportDeadlineError(deadline_s, dict(timings_ms))
+
+        return ReportResult(
+            values={futures[future]: future.result() for future in done},
+            timings_ms={name: timings_ms[name] for name in queries},
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        # Created on first use, so a pre-fork master never owns the threads
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="report-query"
+                    )
+        return self._pool
+
+    def _run_query(
+        self,
+        name: str,
+        query: ReportQuery,
+        deadline: float,
+        timings_ms: dict[str, float],
+    ) -> Any:
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            raise TimeoutError(f"Report query {name!r} never started before the deadline")
+
+        started = time.perf_counter()
+        session = self._registry.open_session(self._engine_name, read_only=True)
+        watchdog = None
+        try:
+            if session.get_bind().dialect.name == "postgresql":
+                session.execute(text(f"SET LOCAL statement_timeout = {remaining_ms}"))
+            else:
+                watchdog = QueryWatchdog.start(session, remaining_ms / 1000)
+            try:
+                result = query(session)
+            finally:
+                # Before the connection goes back to the pool
+                if watchdog is not None:
+                    watchdog.disarm()
+            session.rollback()
+        finally:
+            close_session(session)
+        timings_ms[name] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    @staticmethod
+    def _cancel(pending: set[Future]) -> None:
+        # Not-yet-started queries are dropped; running ones stop at their statement
+        # timeout or watchdog
+        for future in pending:
+            future.cancel()
+
+
+@lru_cache
+def get_report_executor() -> ReportExecutor:
+    """The process's report executor, on the reporting engine."""
+    return ReportExecutor(engines, REPORTING, max_workers=settings.REPORT_QUERY_WORKERS)
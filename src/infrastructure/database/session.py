@@ -1,39 +1,373 @@
 """Database session management."""
+import itertools
+import threading
+import time
+from collections.abc import Generator
 from contextlib import contextmanager
-from typing import Generator
+from dataclasses import dataclass, replace
+from typing import Any
 
-from sqlalchemy import create_engine
+from flask import g, has_app_context
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from src.config import get_settings
+from src.infrastructure.database.n_plus_one import watch_engine
+from src.infrastructure.database.query_tracing import instrument_engine
+from src.shared.utils.logger import app_logger
 
 settings = get_settings()
 
-# Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    echo=settings.FLASK_ENV == "development",
-)
+# Engine names: route-level code picks the pool matching its workload
+OLTP = "oltp"
+REPORTING = "reporting"
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """Connection pool and timeout configuration for one named engine."""
+    url: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    statement_timeout_ms: int
+    lock_timeout_ms: int
+
+
+class PoolMetrics:
+    """Checkout wait-time statistics for one connection pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            if seconds > self.max_wait:
+                self.max_wait = seconds
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.total_wait, 6),
+                "wait_seconds_max": round(self.max_wait, 6),
+                "wait_seconds_avg": round(self.total_wait / self.checkouts, 6)
+                if self.checkouts else 0.0,
+            }
+
+
+# Keyed by pool logging name, which survives Pool.recreate() on engine.dispose()
+_pool_metrics: dict[str, PoolMetrics] = {}
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    def _do_get(self) -> Any:
+        metrics = _pool_metrics.get(self._orig_logging_name)
+        if metrics is None:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.record_timeout()
+            raise
+        metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def get_engine_profiles() -> dict[str, EngineProfile]:
+    """
+    Build the engine profiles from settings.
+
+    The OLTP pool serves auth and CRUD: short statement timeouts, larger pool.
+    The reporting pool is small and fails fast on checkout, so slow report
+    queries queue among themselves instead of starving OLTP connections.
+    """
+    return {
+        OLTP: EngineProfile(
+            url=settings.DATABASE_URL,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+            statement_timeout_ms=settings.DATABASE_STATEMENT_TIMEOUT_MS,
+            lock_timeout_ms=settings.DATABASE_LOCK_TIMEOUT_MS,
+        ),
+        REPORTING: EngineProfile(
+            url=settings.REPORTING_DATABASE_URL or settings.DATABASE_URL,
+            pool_size=settings.REPORTING_DATABASE_POOL_SIZE,
+            max_overflow=settings.REPORTING_DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.REPORTING_DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+            statement_timeout_ms=settings.REPORTING_DATABASE_STATEMENT_TIMEOUT_MS,
+            lock_timeout_ms=settings.DATABASE_LOCK_TIMEOUT_MS,
+        ),
+    }
+
+
+def build_engine(name: str, profile: EngineProfile) -> Engine:
+    """Create an engine for a profile, registering its pool metrics."""
+    kwargs: dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": profile.pool_pre_ping,
+    }
+
+    # In-memory SQLite (tests) uses a singleton pool that takes no sizing options
+    if not _is_memory_sqlite(profile.url):
+        logging_name = f"{name}-{len(_pool_metrics)}"
+        _pool_metrics[logging_name] = PoolMetrics()
+        kwargs.update(
+            poolclass=TimedQueuePool,
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+            pool_recycle=profile.pool_recycle,
+            pool_logging_name=logging_name,
+        )
+
+    if profile.url.startswith("postgresql"):
+        # Applied once per physical connection, not per checkout
+        kwargs["connect_args"] = {
+            "options": (
+                f"-c statement_timeout={profile.statement_timeout_ms} "
+                f"-c lock_timeout={profile.lock_timeout_ms}"
+            ),
+        }
+
+    engine = create_engine(profile.url, **kwargs)
+    instrument_engine(engine)
+    watch_engine(engine)
+    return engine
+
+
+class ReplicaSet:
+    """
+    Round-robin selection over read replicas.
+
+    A replica that fails to hand out a connection is skipped for
+    ``retry_interval`` seconds, after which it is tried again.
+    """
+
+    def __init__(self, urls: list[str], retry_interval: float) -> None:
+        self.urls = urls
+        self._retry_interval = retry_interval
+        self._down_until = [0.0] * len(urls)
+        self._counter = itertools.count()
+
+    def candidates(self) -> list[int]:
+        """Healthy replica indexes, starting from the next one in rotation."""
+        if not self.urls:
+            return []
+        start = next(self._counter) % len(self.urls)
+        now = time.monotonic()
+        order = [(start + offset) % len(self.urls) for offset in range(len(self.urls))]
+        return [index for index in order if self._down_until[index] <= now]
+
+    def mark_down(self, index: int) -> None:
+        self._down_until[index] = time.monotonic() + self._retry_interval
+
+
+class EngineRegistry:
+    """
+    Named engines, created on first use.
+
+    Read-only sessions are routed to the replicas (if any), using the pool
+    profile of the requested engine name. Once a request has written to the
+    primary, its later read-only sessions stay on the primary so it reads
+    its own writes.
+
+    Usage:
+        with get_db_context(REPORTING, read_only=True) as session:
+            ...
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, EngineProfile] | None = None,
+        replica_urls: list[str] | None = None,
+        replica_retry_interval: float | None = None,
+    ) -> None:
+        self._profiles = profiles if profiles is not None else get_engine_profiles()
+        self._engines: dict[str, Engine] = {}
+        self._sessionmakers: dict[str, sessionmaker] = {}
+        self._lock = threading.Lock()
+        self._replicas = ReplicaSet(
+            replica_urls if replica_urls is not None else settings.get_replica_urls(),
+            replica_retry_interval
+            if replica_retry_interval is not None else settings.DATABASE_REPLICA_RETRY_INTERVAL,
+        )
+
+    def get_engine(self, name: str = OLTP) -> Engine:
+        """Return the engine for ``name``, creating it on first use."""
+        engine = self._engines.get(name)
+        if engine is not None:
+            return engine
+
+        if name not in self._profiles:
+            raise ValueError(f"Unknown database engine: {name}")
+
+        with self._lock:
+            if name not in self._engines:
+                self._engines[name] = build_engine(name, self._profiles[name])
+            return self._engines[name]
+
+    def get_replica_engine(self, name: str, index: int) -> Engine:
+        """Return the engine for replica ``index`` using the profile of ``name``."""
+        key = f"{name}@replica{index}"
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+
+        if name not in self._profiles:
+            raise ValueError(f"Unknown database engine: {name}")
+
+        with self._lock:
+            if key not in self._engines:
+                profile = replace(self._profiles[name], url=self._replicas.urls[index])
+                self._engines[key] = build_engine(key, profile)
+            return self._engines[key]
+
+    def open_session(self, name: str = OLTP, read_only: bool = False) -> Session:
+        """
+        Open a session on the engine ``name``.
+
+        Read-only sessions go to the next healthy replica, unless the current
+        request already wrote to the primary. Replicas are health-checked by
+        checking out a connection (with pre-ping); a failing replica is taken
+        out of rotation and the next one, or the primary, is used instead.
+        """
+        if read_only and not is_primary_sticky():
+            for index in self._replicas.candidates():
+                replica = self.get_replica_engine(name, index)
+                try:
+                    connection = replica.connect()
+                except DBAPIError as e:
+                    self._replicas.mark_down(index)
+                    app_logger.warning(f"Read replica {index} unavailable, skipping: {e}")
+                    continue
+
+                session = Session(bind=connection, autoflush=False)
+                session.info.update(read_only=True, replica=index, connection=connection)
+                return session
+
+        session = self.get_sessionmaker(name)()
+        session.info["read_only"] = read_only
+        return session
+
+    def get_sessionmaker(self, name: str = OLTP) -> sessionmaker:
+        """Return the session factory bound to the engine ``name``."""
+        factory = self._sessionmakers.get(name)
+        if factory is None:
+            factory = sessionmaker(autocommit=False, autoflush=False, bind=self.get_engine(name))
+            self._sessionmakers[name] = factory
+        return factory
+
+    def pool_metrics(self) -> dict[str, dict[str, Any]]:
+        """Checkout wait times and current pool usage, per engine."""
+        result = {}
+        for name, engine in list(self._engines.items()):
+            pool = engine.pool
+            metrics = _pool_metrics.get(getattr(pool, "_orig_logging_name", None))
+            stats = metrics.snapshot() if metrics else {}
+            if isinstance(pool, QueuePool):
+                stats.update(
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    overflow=pool.overflow(),
+                )
+            result[name] = stats
+        return result
+
+    def dispose(self, close: bool = True) -> None:
+        """
+        Drop the pooled connections of every engine created so far.
+
+        In a freshly forked worker, pass ``close=False``: the inherited
+        connections belong to the parent and must be discarded without
+        being closed, so the worker starts with empty pools of its own.
+        """
+        for engine in list(self._engines.values()):
+            engine.dispose(close=close)
+
+
+def is_primary_sticky() -> bool:
+    """Whether the current request has written to the primary."""
+    return has_app_context() and g.get("db_primary_sticky", False)
+
+
+@event.listens_for(Session, "before_flush")
+def _guard_read_only(session: Session, flush_context: Any, instances: Any) -> None:
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("Cannot write through a read-only database session")
+
+
+@event.listens_for(Session, "after_flush")
+def _stick_to_primary(session: Session, flush_context: Any) -> None:
+    # Read-your-writes: later read-only sessions in this request use the primary
+    if has_app_context():
+        g.db_primary_sticky = True
+
+
+def close_session(session: Session) -> None:
+    """Close a session and release the replica connection it was bound to."""
+    session.close()
+    connection = session.info.pop("connection", None)
+    if connection is not None:
+        connection.close()
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and (url.endswith(":memory:") or url in ("sqlite://", "sqlite:///"))
+
+
+engines = EngineRegistry()
+
+
+def __getattr__(name: str) -> Any:
+    # Default OLTP engine and session factory, created on first access so that
+    # importing this module neither loads the DB driver nor builds a pool
+    if name == "engine":
+        return engines.get_engine(OLTP)
+    if name == "SessionLocal":
+        return engines.get_sessionmaker(OLTP)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Create declarative base
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(engine_name: str = OLTP, read_only: bool = False) -> Generator[Session, None, None]:
     """
     Dependency injection for database sessions.
-    
+
     Usage:
         with get_db() as session:
             # use session
     """
-    db = SessionLocal()
+    db = engines.open_session(engine_name, read_only)
     try:
         yield db
         db.commit()
@@ -41,13 +375,20 @@ def get_db() -> Generator[Session, None, None]:
         db.rollback()
         raise
     finally:
-        db.close()
+        close_session(db)
 
 
 @contextmanager
-def get_db_context() -> Generator[Session, None, None]:
-    """Context manager for database sessions."""
-    db = SessionLocal()
+def get_db_context(
+    engine_name: str = OLTP,
+    read_only: bool = False,
+) -> Generator[Session, None, None]:
+    """
+    Context manager for database sessions on the named engine.
+
+    With ``read_only=True`` the session may be served by a read replica.
+    """
+    db = engines.open_session(engine_name, read_only)
     try:
         yield db
         db.commit()
@@ -55,9 +396,14 @@ def get_db_context() -> Generator[Session, None, None]:
         db.rollback()
         raise
     finally:
-        db.close()
+        close_session(db)
+
+
+def get_pool_metrics() -> dict[str, dict[str, Any]]:
+    """Pool checkout metrics for all engines in use."""
+    return engines.pool_metrics()
 
 
 def init_db() -> None:
     """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=engines.get_engine(OLTP))
@@ -0,0 +1,64 @@
+"""Portable column types."""
+import json
+import uuid
+from datetime import time
+
+from sqlalchemy import ARRAY, LargeBinary, Text, Time
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.types import TypeDecorator
+
+
+class GUID(TypeDecorator):
+    """
+    ``uuid.UUID`` values.
+
+    Native ``UUID`` on PostgreSQL; other dialects store the 16 raw bytes,
+    which sort in the same order as PostgreSQL sorts UUIDs.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return uuid.UUID(bytes=bytes(value))
+
+
+class TimeList(TypeDecorator):
+    """
+    List of ``time`` values.
+
+    Native ``TIME[]`` on PostgreSQL; other dialects (SQLite in tests) store
+    a JSON array of ISO strings.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(Time))
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return json.dumps([t.isoformat() for t in value])
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return [time.fromisoformat(t) for t in json.loads(value)]
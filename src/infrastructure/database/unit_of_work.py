@@ -0,0 +1,75 @@
+"""Request-scoped Unit of Work."""
+
+from flask import g, has_app_context
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.session import OLTP, EngineRegistry, close_session, engines
+
+
+class UnitOfWork:
+    """
+    Lazily opened sessions sharing one transaction boundary.
+
+    A session (and therefore a pooled connection) is only acquired the first
+    time ``session()`` is called, so work that never touches the database
+    costs nothing. There is at most one session per engine and access mode;
+    once a writable session exists, read-only callers on the same engine
+    reuse it to see their own uncommitted writes.
+    """
+
+    def __init__(self, registry: EngineRegistry | None = None) -> None:
+        self._registry = registry or engines
+        self._sessions: dict[tuple[str, bool], Session] = {}
+
+    def session(self, engine_name: str = OLTP, read_only: bool = False) -> Session:
+        """Return the session for ``engine_name``, opening it on first use."""
+        if read_only and (engine_name, False) in self._sessions:
+            return self._sessions[(engine_name, False)]
+
+        key = (engine_name, read_only)
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._registry.open_session(engine_name, read_only)
+            self._sessions[key] = session
+        return session
+
+    @property
+    def active(self) -> bool:
+        """Whether any session was opened."""
+        return bool(self._sessions)
+
+    def commit(self) -> None:
+        """Commit every open session."""
+        for session in self._sessions.values():
+            session.commit()
+
+    def rollback(self) -> None:
+        """Roll back every open session."""
+        for session in self._sessions.values():
+            session.rollback()
+
+    def close(self) -> None:
+        """Close every session and return their connections to the pool."""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            close_session(session)
+
+
+def current_unit_of_work() -> UnitOfWork:
+    """The unit of work bound to the current Flask app context."""
+    if not has_app_context():
+        raise RuntimeError("No request unit of work outside of an application context")
+
+    uow = g.get("unit_of_work")
+    if uow is None:
+        uow = g.unit_of_work = UnitOfWork()
+    return uow
+
+
+def get_session(engine_name: str = OLTP, read_only: bool = False) -> Session:
+    """
+    Session for the current request.
+
+    Opened on first use; committed or rolled back when the request ends.
+    """
+    return current_unit_of_work().session(engine_name, read_only)
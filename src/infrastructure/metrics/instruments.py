@@ -0,0 +1,119 @@
+"""Application metrics."""
+from src.infrastructure.metrics.multiprocess import get_multiprocess_collector
+from src.infrastructure.metrics.registry import MetricFamily, MetricsRegistry, render
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Request latency by route",
+    ("method", "blueprint", "route"),
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "Requests by route and status code",
+    ("method", "blueprint", "route", "status"),
+)
+BCRYPT_IN_FLIGHT = registry.gauge(
+    "bcrypt_operations_in_flight",
+    "bcrypt hashes and verifications running or waiting for a CPU",
+    ("operation",),
+)
+BCRYPT_DURATION = registry.histogram(
+    "bcrypt_duration_seconds",
+    "bcrypt hash and verification time",
+    ("operation",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0, 5.0),
+)
+JWT_VERIFICATIONS = registry.counter(
+    "jwt_verifications_total",
+    "Access and refresh token verifications by result",
+    ("result",),
+)
+RATE_LIMITED = registry.counter(
+    "http_requests_rate_limited_total",
+    "Requests rejected with 429 by rate limit rule",
+    ("rule",),
+)
+CACHE_LOOKUPS = registry.counter(
+    "cache_lookups_total",
+    "Cache lookups by cache and result (hit or miss)",
+    ("cache", "result"),
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.inc(cache, "hit" if hit else "miss")
+
+
+# Connection pool internals; only rendered for authenticated scrapes
+POOL_FAMILY_PREFIX = "db_pool_"
+
+
+def _pool_families() -> list[MetricFamily]:
+    from src.infrastructure.database.session import get_pool_metrics
+
+    gauges = {
+        "size": "Configured pool size",
+        "checked_out": "Connections currently checked out",
+        "overflow": "Connections open beyond the pool size",
+    }
+    counters = {
+        "checkouts": ("db_pool_checkouts_total", "Connection checkouts"),
+        "timeouts": (
+            "db_pool_checkout_timeouts_total", "Checkouts that timed out waiting for a connection"
+        ),
+        "wait_seconds_total": (
+            "db_pool_checkout_wait_seconds_total", "Time spent waiting for a connection"
+        ),
+    }
+    families = {
+        key: MetricFamily(f"{POOL_FAMILY_PREFIX}{key}", "gauge", help, ("engine",))
+        for key, help in gauges.items()
+    }
+    families.update({
+        key: MetricFamily(name, "counter", help, ("engine",))
+        for key, (name, help) in counters.items()
+    })
+    for engine, stats in get_pool_metrics().items():
+        for key, family in families.items():
+            if key in stats:
+                family.values[(engine,)] = [float(stats[key])]
+    return list(families.values())
+
+
+def _log_families() -> list[MetricFamily]:
+    from src.shared.utils.logger import get_log_pipeline
+
+    handler = get_log_pipeline().handler
+    dropped = MetricFamily(
+        "log_records_dropped_total", "counter", "Log records dropped because the queue was full"
+    )
+    depth = MetricFamily("log_queue_depth", "gauge", "Log records waiting for the writer thread")
+    dropped.values[()] = [float(handler.dropped)]
+    depth.values[()] = [float(handler.queue.qsize())]
+    return [dropped, depth]
+
+
+registry.register_collector(_pool_families)
+registry.register_collector(_log_families)
+
+
+def render_metrics(include_pools: bool = True) -> str:
+    """This process's metrics or, under gunicorn, every worker's."""
+    collector = get_multiprocess_collector()
+    if collector is None:
+        families = registry.collect()
+    else:
+        collector.flush(registry)
+        families = collector.collect()
+    if not include_pools:
+        families = [f for f in families if not f.name.startswith(POOL_FAMILY_PREFIX)]
+    return render(families)
+
+
+def flush_metrics() -> None:
+    """Publish this worker's snapshot if it is due (no-op in a single process)."""
+    collector = get_multiprocess_collector()
+    if collector is not None:
+        collector.maybe_flush(registry)
@@ -0,0 +1,112 @@
+"""
+Multi-process aggregation for gunicorn workers.
+
+Each worker writes a snapshot of its metrics to ``<dir>/metrics-<pid>.json``
+(at most every ``flush_interval`` seconds, and whenever it serves a
+scrape). The worker that serves ``/metrics`` merges all snapshots, so the
+scrape covers every worker. Counters and histograms of exited workers are
+kept, so totals never go backwards; their gauges are dropped.
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+from src.infrastructure.metrics.registry import MetricFamily, MetricsRegistry
+
+
+def _to_json(family: MetricFamily) -> dict:
+    return {
+        "type": family.type,
+        "help": family.help,
+        "labelnames": list(family.labelnames),
+        "buckets": list(family.buckets),
+        "values": [[list(labels), values] for labels, values in family.values.items()],
+    }
+
+
+def _from_json(name: str, data: dict) -> MetricFamily:
+    return MetricFamily(
+        name=name,
+        type=data["type"],
+        help=data["help"],
+        labelnames=tuple(data["labelnames"]),
+        buckets=tuple(data["buckets"]),
+        values={tuple(labels): values for labels, values in data["values"]},
+    )
+
+
+class MultiProcessCollector:
+    """Snapshot files of all workers sharing ``directory``."""
+
+    def __init__(self, directory: str | Path, flush_interval: float = 5.0) -> None:
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self._last_flush = float("-inf")
+
+    def _path(self, pid: int) -> Path:
+        return self.directory / f"metrics-{pid}.json"
+
+    def flush(self, registry: MetricsRegistry) -> None:
+        """Write this process's snapshot."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        snapshot = {family.name: _to_json(family) for family in registry.collect()}
+        path = self._path(os.getpid())
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(snapshot))
+        os.replace(tmp, path)
+        self._last_flush = time.monotonic()
+
+    def maybe_flush(self, registry: MetricsRegistry) -> None:
+        """Flush if the last snapshot is older than ``flush_interval``."""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush(registry)
+
+    def collect(self) -> list[MetricFamily]:
+        """Merge the snapshots of every worker."""
+        merged: dict[str, MetricFamily] = {}
+        for path in sorted(self.directory.glob("metrics-*.json")):
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # replaced or removed while reading
+            for name, data in snapshot.items():
+                family = _from_json(name, data)
+                if name in merged:
+                    merged[name].merge(family)
+                else:
+                    merged[name] = family
+        return list(merged.values())
+
+    def mark_process_dead(self, pid: int) -> None:
+        """Keep an exited worker's counters and histograms, drop its gauges."""
+        path = self._path(pid)
+        try:
+            snapshot = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        kept = {name: data for name, data in snapshot.items() if data["type"] != "gauge"}
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(kept))
+        os.replace(tmp, path)
+
+    def clear(self) -> None:
+        """Remove snapshots left over from a previous run."""
+        for path in self.directory.glob("metrics-*"):
+            path.unlink(missing_ok=True)
+
+
+_collector: MultiProcessCollector | None = None
+
+
+def enable_multiprocess(
+    directory: str | Path, flush_interval: float = 5.0
+) -> MultiProcessCollector:
+    """Switch ``/metrics`` to cross-worker aggregation (called from the gunicorn config)."""
+    global _collector
+    _collector = MultiProcessCollector(directory, flush_interval)
+    return _collector
+
+
+def get_multiprocess_collector() -> MultiProcessCollector | None:
+    return _collector
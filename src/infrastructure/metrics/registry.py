@@ -0,0 +1,219 @@
+"""
+In-process metrics registry rendered in the Prometheus text format.
+
+Recording is lock-free: every thread writes to its own shard of a metric
+(a dict only that thread mutates), and shards are summed when the metrics
+are collected. The only lock is taken once per thread and metric, when
+the shard is created.
+"""
+import bisect
+import math
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+@dataclass
+class MetricFamily:
+    """
+    Collected values of one metric.
+
+    ``values`` maps label values to a list of numbers: ``[value]`` for
+    counters and gauges, per-bucket counts (not cumulative, ``+Inf`` last)
+    followed by the sum for histograms.
+    """
+    name: str
+    type: str  # 'counter', 'gauge' or 'histogram'
+    help: str
+    labelnames: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = ()
+    values: dict[LabelValues, list[float]] = field(default_factory=dict)
+
+    def merge(self, other: "MetricFamily") -> None:
+        """Add ``other``'s values into this family (same metric from another shard or process)."""
+        for labels, values in other.values.items():
+            current = self.values.get(labels)
+            if current is None:
+                self.values[labels] = list(values)
+            else:
+                for index, value in enumerate(values):
+                    current[index] += value
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: list[dict[LabelValues, list[float]]] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict[LabelValues, list[float]]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _cell(self, labels: LabelValues, width: int) -> list[float]:
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            if len(labels) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+            cell = shard[labels] = [0.0] * width
+        return cell
+
+    def collect(self) -> MetricFamily:
+        family = self._family()
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # list() copies in one step; the owning thread may be adding labels
+            for labels, values in list(shard.items()):
+                current = family.values.setdefault(labels, [0.0] * len(values))
+                for index, value in enumerate(values):
+                    current[index] += value
+        return family
+
+    def _family(self) -> MetricFamily:
+        return MetricFamily(self.name, self.type, self.help, self.labelnames)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels, 1)[0] += amount
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down (e.g. work in flight). Gauges that are
+    read from somewhere else at scrape time are registered as collectors.
+    """
+    type = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels, 1)[0] += amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels, 1)[0] -= amount
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        # len(buckets) + 1 counts (the last is +Inf), then the sum
+        cell = self._cell(labels, len(self.buckets) + 2)
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def _family(self) -> MetricFamily:
+        return MetricFamily(self.name, self.type, self.help, self.labelnames, self.buckets)
+
+
+class MetricsRegistry:
+    """Metrics of this process, plus collectors evaluated at scrape time."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[MetricFamily]]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """Add a callable returning families computed at scrape time (e.g. pool usage)."""
+        self._collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        families = [metric.collect() for metric in list(self._metrics.values())]
+        for collector in self._collectors:
+            families.extend(collector())
+        return families
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(int(value)) if value == int(value) else repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(
+    names: Iterable[str], values: Iterable[str], extra: tuple[str, str] | None = None
+) -> str:
+    pairs = list(zip(names, values, strict=True))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def render(families: Iterable[MetricFamily]) -> str:
+    """Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for family in sorted(families, key=lambda f: f.name):
+        lines.append(f"# HELP {family.name} {family.help}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for labels, values in sorted(family.values.items()):
+            label_text = _labels(family.labelnames, labels)
+            if family.type != "histogram":
+                lines.append(f"{family.name}{label_text} {_format_value(values[0])}")
+                continue
+            cumulative = 0.0
+            # Bucket counts, then the +Inf count; the sum comes last
+            for bound, count in zip((*family.buckets, math.inf), values[:-1], strict=True):
+                cumulative += count
+                le = ("le", _format_value(bound) if math.isinf(bound) else repr(float(bound)))
+                bucket_labels = _labels(family.labelnames, labels, le)
+                lines.append(f"{family.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            lines.append(f"{family.name}_sum{label_text} {_format_value(values[-1])}")
+            lines.append(f"{family.name}_count{label_text} {_format_value(cumulative)}")
+    return "\n".join(lines) + "\n"
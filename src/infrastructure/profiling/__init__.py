@@ -0,0 +1 @@
+"""Request profiling package."""
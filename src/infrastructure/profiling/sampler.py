@@ -0,0 +1,132 @@
+"""Statistical stack sampler for a single thread."""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import FrameType
+from typing import Any
+
+# (function, file, first line); first line rather than the current line so
+# samples of one function aggregate into one flamegraph frame
+Frame = tuple[str, str, int]
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    if filename.startswith(_PROJECT_ROOT):
+        return os.path.relpath(filename, _PROJECT_ROOT)
+    for path in sys.path:
+        if path and filename.startswith(path + os.sep):
+            return filename[len(path) + 1:]
+    return filename
+
+
+@dataclass
+class Profile:
+    """Stack samples of one request."""
+    id: str
+    name: str
+    interval_ms: float
+    duration_ms: float = 0.0
+    stacks: Counter = field(default_factory=Counter)  # root-first tuple of Frame -> samples
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def to_collapsed(self) -> str:
+        """Brendan Gregg's collapsed format: ``root;child;leaf <count>`` per line."""
+        lines = []
+        for stack, count in self.stacks.most_common():
+            names = ";".join(
+                f"{func} ({path}:{line})".replace(";", ",") for func, path, line in stack
+            )
+            lines.append(f"{names} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """Sampled profile in the speedscope file format (https://www.speedscope.app)."""
+        frames: list[dict[str, Any]] = []
+        index: dict[Frame, int] = {}
+        samples, weights = [], []
+        for stack, count in self.stacks.most_common():
+            sample = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    func, path, line = frame
+                    frames.append({"name": func, "file": path, "line": line})
+                sample.append(index[frame])
+            samples.append(sample)
+            weights.append(round(count * self.interval_ms, 3))
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "cuidar-plus",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": self.name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(self.duration_ms, 3),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+
+class StackSampler:
+    """
+    Sample the call stack of one thread from a background thread.
+
+    Every ``interval_ms`` the sampler reads the target thread's current
+    frame through ``sys._current_frames()`` and counts the stack. The
+    profiled thread runs unmodified (no ``sys.setprofile`` hook), so the
+    cost is bounded by the sampling rate rather than by the call count.
+    """
+
+    def __init__(
+        self, profile: Profile, thread_id: int | None = None, max_depth: int = 128
+    ) -> None:
+        self.profile = profile
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.max_depth = max_depth
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.profile.duration_ms = (time.perf_counter() - self._started) * 1000
+        return self.profile
+
+    def _run(self) -> None:
+        interval = self.profile.interval_ms / 1000
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            self.profile.stacks[self._walk(frame)] += 1
+
+    def _walk(self, frame: FrameType | None) -> tuple[Frame, ...]:
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            stack.append((code.co_name, _short_path(code.co_filename), code.co_firstlineno))
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
@@ -0,0 +1,134 @@
+"""Profile storage, the admin toggle and signed per-request tokens."""
+import hashlib
+import hmac
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from src.config import get_settings
+from src.infrastructure.profiling.sampler import Profile
+
+settings = get_settings()
+
+_PROFILE_ID = re.compile(r"^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$")
+_TOGGLE_FILE = "toggle.json"
+
+
+@dataclass
+class ProfilingToggle:
+    """Admin switch: profile every request under ``path_prefix`` until ``expires_at``."""
+    path_prefix: str
+    expires_at: float
+
+    def matches(self, path: str, now: float | None = None) -> bool:
+        return (now or time.time()) < self.expires_at and path.startswith(self.path_prefix)
+
+
+class ProfileStore:
+    """
+    Profiles on the local filesystem, one ``.speedscope.json`` and one
+    ``.collapsed`` file each; the oldest are pruned beyond ``max_profiles``.
+
+    The toggle lives in the same directory, so every gunicorn worker on
+    the host sees it.
+    """
+
+    def __init__(self, root: str | Path, max_profiles: int = 200) -> None:
+        self.root = Path(root)
+        self.max_profiles = max_profiles
+
+    @staticmethod
+    def is_valid_id(profile_id: str) -> bool:
+        return bool(_PROFILE_ID.match(profile_id))
+
+    def save(self, profile: Profile) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._write(f"{profile.id}.speedscope.json", json.dumps(profile.to_speedscope()))
+        self._write(f"{profile.id}.collapsed", profile.to_collapsed())
+        self._prune()
+
+    def list(self) -> list[dict[str, Any]]:
+        """Stored profiles, newest first."""
+        profiles = []
+        for path in sorted(self.root.glob("*.speedscope.json"), reverse=True):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # pruned or half-written by another worker
+            profile = data["profiles"][0]
+            profiles.append({
+                "id": path.name.removesuffix(".speedscope.json"),
+                "name": data["name"],
+                "duration_ms": profile["endValue"],
+                "samples": len(profile["samples"]),
+            })
+        return profiles
+
+    def path(self, profile_id: str, fmt: str = "speedscope") -> Path | None:
+        """File of a stored profile in ``speedscope`` or ``collapsed`` format."""
+        if not self.is_valid_id(profile_id) or fmt not in ("speedscope", "collapsed"):
+            return None
+        suffix = ".speedscope.json" if fmt == "speedscope" else ".collapsed"
+        path = self.root / f"{profile_id}{suffix}"
+        return path if path.exists() else None
+
+    def get_toggle(self) -> ProfilingToggle | None:
+        try:
+            toggle = ProfilingToggle(**json.loads((self.root / _TOGGLE_FILE).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        return toggle if toggle.expires_at > time.time() else None
+
+    def set_toggle(self, toggle: ProfilingToggle | None) -> None:
+        if toggle is None:
+            (self.root / _TOGGLE_FILE).unlink(missing_ok=True)
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._write(_TOGGLE_FILE, json.dumps(asdict(toggle)))
+
+    def _write(self, name: str, content: str) -> None:
+        # Write-then-rename, so readers never see a partial file
+        tmp = self.root / f".{name}.tmp"
+        tmp.write_text(content)
+        os.replace(tmp, self.root / name)
+
+    def _prune(self) -> None:
+        profiles = sorted(self.root.glob("*.speedscope.json"))
+        for path in profiles[:max(0, len(profiles) - self.max_profiles)]:
+            profile_id = path.name.removesuffix(".speedscope.json")
+            path.unlink(missing_ok=True)
+            (self.root / f"{profile_id}.collapsed").unlink(missing_ok=True)
+
+
+def new_profile_id() -> str:
+    """Sortable id: UTC timestamp plus a random suffix."""
+    return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime())}-{uuid4().hex[:8]}"
+
+
+@lru_cache
+def get_profile_store() -> ProfileStore:
+    return ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_PROFILES)
+
+
+def profile_token_secret() -> str:
+    return settings.PROFILING_SECRET or settings.SECRET_KEY
+
+
+def sign_profile_token(secret: str, expires_at: int) -> str:
+    """Token for the ``X-Profile`` request header, valid until ``expires_at`` (unix time)."""
+    message = f"profile:{expires_at}".encode()
+    signature = hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+    return f"{expires_at}.{signature}"
+
+
+def verify_profile_token(secret: str, token: str, now: float | None = None) -> bool:
+    expires_at = token.partition(".")[0]
+    if not expires_at.isdigit() or int(expires_at) < (now or time.time()):
+        return False
+    return hmac.compare_digest(sign_profile_token(secret, int(expires_at)), token)
@@ -0,0 +1,59 @@
+"""Rate limiter with an in-process fallback."""
+import time
+from functools import lru_cache
+
+import redis
+
+from src.config import get_settings
+from src.infrastructure.rate_limiting.redis_token_buckets import RedisTokenBuckets
+from src.infrastructure.rate_limiting.token_bucket import Decision, InMemoryTokenBuckets, Limit
+from src.shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("cuidar_plus.rate_limit")
+
+
+class RateLimiter:
+    """
+    Shared buckets when available, per-process buckets otherwise.
+
+    When the shared backend fails, requests are limited by the local
+    buckets (per worker, so looser) for ``retry_interval`` seconds before
+    the shared backend is tried again: limiting never fails open, and an
+    outage costs one failed call per interval, not one per request.
+    """
+
+    def __init__(
+        self,
+        shared: RedisTokenBuckets | None,
+        local: InMemoryTokenBuckets,
+        retry_interval: float = 5.0,
+    ) -> None:
+        self.shared = shared
+        self.local = local
+        self.retry_interval = retry_interval
+        self._shared_down_until = 0.0
+
+    def acquire(self, buckets: list[tuple[str, Limit]]) -> Decision:
+        if self.shared is not None and time.monotonic() >= self._shared_down_until:
+            try:
+                return self.shared.acquire(buckets)
+            except redis.RedisError as e:
+                self._shared_down_until = time.monotonic() + self.retry_interval
+                logger.warning(f"Rate limit backend unavailable, using per-worker limits: {e}")
+        return self.local.acquire(buckets)
+
+
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """The worker's rate limiter, backed as ``RATE_LIMIT_BACKEND`` says."""
+    local = InMemoryTokenBuckets(max_keys=settings.RATE_LIMIT_MAX_LOCAL_KEYS)
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return RateLimiter(None, local)
+
+    client = redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=0.2,
+        socket_connect_timeout=0.2,
+    )
+    return RateLimiter(RedisTokenBuckets(client), local)
@@ -0,0 +1,68 @@
+"""Token buckets shared by all workers, in Redis."""
+from typing import Any
+
+from src.infrastructure.rate_limiting.token_bucket import Decision, Limit
+
+# KEYS: one hash per bucket. ARGV: capacity and refill rate (tokens/ms) per bucket.
+# Refills every bucket using the Redis clock, then takes a token from each
+# only if all of them have one; returns {allowed, retry_after_ms}.
+ACQUIRE_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local levels = {}
+local retry_ms = 0
+
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local bucket = redis.call('HMGET', KEYS[i], 'tokens', 'updated')
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated = tonumber(bucket[2]) or now_ms
+    tokens = math.min(capacity, tokens + math.max(0, now_ms - updated) * rate)
+    if tokens < 1 then
+        retry_ms = math.max(retry_ms, (1 - tokens) / rate)
+    end
+    levels[i] = tokens
+end
+
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local tokens = levels[i]
+    if retry_ms == 0 then
+        tokens = tokens - 1
+    end
+    redis.call('HSET', KEYS[i], 'tokens', tostring(tokens), 'updated', now_ms)
+    -- Drop the bucket once it would be full again anyway
+    redis.call('PEXPIRE', KEYS[i], math.ceil((capacity - tokens) / rate) + 1000)
+end
+
+return {retry_ms == 0 and 1 or 0, tostring(retry_ms)}
+"""
+
+
+class RedisTokenBuckets:
+    """
+    Buckets as Redis hashes, updated by one Lua script per request.
+
+    The script checks and takes tokens from all of a request's buckets
+    atomically, in one round trip, and uses the Redis server's clock so
+    app hosts need not agree on the time. Buckets of one request must
+    hash to the same slot if Redis runs as a cluster.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "ratelimit") -> None:
+        self._client = client
+        self._prefix = key_prefix
+        self._acquire = client.register_script(ACQUIRE_SCRIPT)
+
+    def acquire(self, buckets: list[tuple[str, Limit]]) -> Decision:
+        """Take a token from every bucket, or from none if any is empty."""
+        args: list[float] = []
+        for _, limit in buckets:
+            args += [limit.capacity, limit.rate / 1000]
+        allowed, retry_ms = self._acquire(
+            keys=[f"{self._prefix}:{key}" for key, _ in buckets],
+            args=args,
+        )
+        return Decision(bool(int(allowed)), float(retry_ms) / 1000)
@@ -0,0 +1,79 @@
+"""Token buckets: limit definitions and the in-process implementation."""
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+_LIMIT = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour)\s*(?:burst\s+(\d+))?\s*$")
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Refill ``rate`` tokens per second up to ``capacity``; each request takes one."""
+    capacity: int
+    rate: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "Limit":
+        """
+        Parse ``"<count>/<second|minute|hour>"``, optionally followed by
+        ``"burst <n>"``; without it the bucket holds ``count`` tokens.
+        ``"5/minute burst 10"`` allows 10 requests at once, then 5 a minute.
+        """
+        match = _LIMIT.match(spec)
+        if match is None:
+            raise ValueError(f"Invalid rate limit: {spec!r}")
+        count, period, burst = match.groups()
+        return cls(capacity=int(burst or count), rate=int(count) / _PERIODS[period])
+
+
+@dataclass(frozen=True)
+class Decision:
+    """Outcome of taking one token from every bucket of a request."""
+    allowed: bool
+    retry_after: float = 0.0  # seconds until every bucket has a token again
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class InMemoryTokenBuckets:
+    """
+    Buckets in this process only.
+
+    Used when Redis is unavailable, and on its own in development. Limits
+    are per worker, so the effective limit is multiplied by the number of
+    workers. The least recently used buckets are dropped beyond
+    ``max_keys``; a dropped bucket comes back full.
+    """
+
+    def __init__(self, max_keys: int = 100000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, buckets: list[tuple[str, Limit]]) -> Decision:
+        """Take a token from every bucket, or from none if any is empty."""
+        now = time.monotonic()
+        with self._lock:
+            levels = []
+            retry_after = 0.0
+            for key, limit in buckets:
+                tokens, updated = self._buckets.get(key, (limit.capacity, now))
+                tokens = min(limit.capacity, tokens + (now - updated) * limit.rate)
+                if tokens < 1:
+                    retry_after = max(retry_after, (1 - tokens) / limit.rate)
+                levels.append(tokens)
+
+            allowed = retry_after == 0.0
+            for (key, _), tokens in zip(buckets, levels, strict=True):
+                self._buckets[key] = (tokens - 1 if allowed else tokens, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return Decision(allowed, retry_after)
@@ -0,0 +1,46 @@
+"""Async Repositories - the repository ports driven from async code."""
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domain.repositories.patient_repository import PatientRepository
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Repositories:
+    """The repository ports bound to one session."""
+    patients: PatientRepository
+    users: UserRepository
+
+
+class AsyncRepositories:
+    """
+    Runs work against the SQLAlchemy repositories on an ``AsyncSession``.
+
+    The work runs on the session's sync facade (``run_sync``): the
+    repositories, their queries and the use cases on top are the ones the
+    WSGI app uses, while every statement awaits the asyncio driver, so
+    the event loop serves other requests while the database works.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def run(self, work: Callable[[Repositories], T]) -> T:
+        """Call ``work`` with the repositories and return its result."""
+        def bound(session: Session) -> T:
+            return work(Repositories(
+                patients=SQLAlchemyPatientRepository(session),
+                users=SQLAlchemyUserRepository(session),
+            ))
+        return await self._session.run_sync(bound)
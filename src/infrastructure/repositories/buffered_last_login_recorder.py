@@ -0,0 +1,169 @@
+"""Buffered Last Login Recorder - coalesces last_login writes per worker."""
+import atexit
+import os
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
+
+from sqlalchemy import DateTime, bindparam, column, or_, update, values
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Update
+
+from src.application.interfaces.last_login_recorder import LastLoginRecorder
+from src.config import get_settings
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.session import OLTP, engines
+from src.infrastructure.database.types import GUID
+from src.shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("cuidar_plus.last_login")
+
+USERS = UserModel.__table__
+
+
+class BufferedLastLoginRecorder(LastLoginRecorder):
+    """
+    Keeps the latest login per user in memory and writes them all with
+    one statement from a background thread.
+
+    Repeated logins of the same account (shared facility logins) collapse
+    into a single row. ``last_login`` in the database lags by at most
+    ``flush_interval`` seconds, or less once ``max_pending`` users are
+    waiting. A stored value is never moved backwards, so workers flushing
+    in any order converge on the latest login.
+    """
+
+    def __init__(
+        self,
+        get_engine: Callable[[], Engine],
+        flush_interval: float = 30,
+        max_pending: int = 1000,
+    ) -> None:
+        self._get_engine = get_engine
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[UUID, datetime] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def record(self, user_id: UUID, logged_in_at: datetime) -> None:
+        with self._lock:
+            previous = self._pending.get(user_id)
+            if previous is None or previous < logged_in_at:
+                self._pending[user_id] = logged_in_at
+            size = len(self._pending)
+
+        self._ensure_thread()
+        if size >= self.max_pending:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+
+            try:
+                self._write(pending)
+            except Exception as e:
+                logger.warning(
+                    f"Writing last_login for {len(pending)} users failed, retrying later: {e}"
+                )
+                with self._lock:
+                    for user_id, logged_in_at in pending.items():
+                        newer = self._pending.get(user_id)
+                        if newer is None or newer < logged_in_at:
+                            self._pending[user_id] = logged_in_at
+
+    def stop(self) -> None:
+        """Stop the flusher thread and write out what is pending."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 5)
+            self._thread = None
+        self.flush()
+
+    def after_fork(self) -> None:
+        # Pending logins belong to the parent; the child starts empty
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def _write(self, pending: dict[UUID, datetime]) -> None:
+        engine = self._get_engine()
+        with engine.begin() as connection:
+            if engine.dialect.name == "postgresql":
+                connection.execute(build_batch_update(pending))
+            else:
+                # SQLite cannot alias a VALUES list's columns: one executemany instead
+                statement = update(USERS).where(
+                    USERS.c.id == bindparam("user_id"),
+                    or_(
+                        USERS.c.last_login.is_(None),
+                        USERS.c.last_login < bindparam("logged_in_at"),
+                    ),
+                ).values(last_login=bindparam("logged_in_at"))
+                connection.execute(statement, [
+                    {"user_id": user_id, "logged_in_at": logged_in_at}
+                    for user_id, logged_in_at in pending.items()
+                ])
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None or self._stopping:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="last-login-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"last_login flush failed: {e}")
+
+
+def build_batch_update(pending: dict[UUID, datetime]) -> Update:
+    """
+    ``UPDATE users SET last_login = logins.last_login FROM (VALUES ...) AS logins``
+    for every pending user, skipping rows that already hold a later login.
+    """
+    logins = values(
+        column("id", GUID),
+        column("last_login", DateTime),
+        name="logins",
+    ).data(list(pending.items()))
+
+    return update(USERS).where(
+        USERS.c.id == logins.c.id,
+        or_(USERS.c.last_login.is_(None), USERS.c.last_login < logins.c.last_login),
+    ).values(last_login=logins.c.last_login)
+
+
+@lru_cache
+def get_last_login_recorder() -> BufferedLastLoginRecorder:
+    """The worker's last_login recorder, writing through the OLTP engine."""
+    recorder = BufferedLastLoginRecorder(
+        lambda: engines.get_engine(OLTP),
+        flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL,
+        max_pending=settings.LAST_LOGIN_MAX_PENDING,
+    )
+    atexit.register(recorder.stop)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=recorder.after_fork)
+    return recorder
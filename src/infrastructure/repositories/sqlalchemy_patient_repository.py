@@ -1,55 +1,135 @@
 """SQLAlchemy Patient Repository Implementation."""
-from typing import Optional
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session, selectinload
 
+from src.domain.entities.appointment import Appointment
+from src.domain.entities.medication import Medication
 from src.domain.entities.patient import Patient
-from src.domain.repositories.patient_repository import PatientRepository
+from src.domain.repositories.patient_repository import PatientCareSnapshot, PatientRepository
 from src.domain.value_objects.cpf import CPF
+from src.infrastructure.database.insert_if_absent import insert_if_absent
+from src.infrastructure.database.models.appointment_model import AppointmentModel
+from src.infrastructure.database.models.medication_model import MedicationModel
 from src.infrastructure.database.models.patient_model import PatientModel
 
 
 class SQLAlchemyPatientRepository(PatientRepository):
     """SQLAlchemy implementation of PatientRepository."""
-    
+
     def __init__(self, session: Session) -> None:
         self._session = session
-    
+
     def save(self, patient: Patient) -> Patient:
         """Persist patient to database."""
         patient_model = self._to_model(patient)
         self._session.merge(patient_model)
         self._session.flush()
         return self._to_entity(patient_model)
-    
-    def find_by_id(self, patient_id: UUID) -> Optional[Patient]:
+
+    def insert_if_absent(self, patient: Patient) -> Patient | None:
+        """Insert patient in one statement; ``None`` if the CPF already exists."""
+        inserted_id = insert_if_absent(self._session, self._to_model(patient), "cpf")
+        return patient if inserted_id is not None else None
+
+    def find_by_id(self, patient_id: UUID) -> Patient | None:
         """Find patient by ID."""
         patient_model = self._session.query(PatientModel).filter(
             PatientModel.id == patient_id
         ).first()
-        
+
         return self._to_entity(patient_model) if patient_model else None
-    
+
     def find_by_caregiver(self, caregiver_id: UUID) -> list[Patient]:
         """Find all patients for a specific caregiver."""
         patient_models = self._session.query(PatientModel).filter(
             PatientModel.caregiver_id == caregiver_id
         ).all()
-        
+
         return [self._to_entity(model) for model in patient_models]
-    
+
+    def find_care_snapshots_by_caregiver(
+        self,
+        caregiver_id: UUID,
+        now: datetime,
+    ) -> list[PatientCareSnapshot]:
+        """
+        Find the caregiver's patients with their care data in three queries.
+
+        1. patients of the caregiver
+        2. their active medications (``selectinload``, one ``IN`` query)
+        3. each patient's next scheduled appointment (grouped ``MIN`` subquery)
+        """
+        patient_models = self._session.query(PatientModel).options(
+            selectinload(
+                PatientModel.medications.and_(MedicationModel.is_active.is_(True))
+            )
+        ).filter(
+            PatientModel.caregiver_id == caregiver_id
+        ).order_by(PatientModel.full_name).all()
+
+        next_appointments = self._find_next_appointments(
+            [model.id for model in patient_models], now
+        )
+
+        return [
+            PatientCareSnapshot(
+                patient=self._to_entity(model),
+                active_medications=[
+                    self._medication_to_entity(medication)
+                    for medication in model.medications
+                ],
+                next_appointment=next_appointments.get(model.id),
+            )
+            for model in patient_models
+        ]
+
     def delete(self, patient_id: UUID) -> None:
         """Delete patient by ID."""
         self._session.query(PatientModel).filter(
             PatientModel.id == patient_id
         ).delete()
-    
+
     def find_all(self, skip: int = 0, limit: int = 100) -> list[Patient]:
         """Find all patients with pagination."""
         patient_models = self._session.query(PatientModel).offset(skip).limit(limit).all()
         return [self._to_entity(model) for model in patient_models]
-    
+
+    def _find_next_appointments(
+        self,
+        patient_ids: list[UUID],
+        now: datetime,
+    ) -> dict[UUID, Appointment]:
+        """Earliest upcoming scheduled appointment per patient, in one query."""
+        if not patient_ids:
+            return {}
+
+        upcoming = and_(
+            AppointmentModel.patient_id.in_(patient_ids),
+            AppointmentModel.status == "scheduled",
+            AppointmentModel.appointment_date >= now,
+        )
+        next_dates = select(
+            AppointmentModel.patient_id,
+            func.min(AppointmentModel.appointment_date).label("next_date"),
+        ).where(upcoming).group_by(AppointmentModel.patient_id).subquery()
+
+        appointment_models = self._session.query(AppointmentModel).join(
+            next_dates,
+            and_(
+                AppointmentModel.patient_id == next_dates.c.patient_id,
+                AppointmentModel.appointment_date == next_dates.c.next_date,
+            ),
+        ).filter(upcoming).order_by(AppointmentModel.id).all()
+
+        # Ties on the same timestamp keep the first row per patient
+        next_appointments: dict[UUID, Appointment] = {}
+        for model in appointment_models:
+            next_appointments.setdefault(model.patient_id, self._appointment_to_entity(model))
+        return next_appointments
+
     @staticmethod
     def _to_model(patient: Patient) -> PatientModel:
         """Convert domain entity to database model."""
@@ -71,7 +151,7 @@ class SQLAlchemyPatientRepository(PatientRepository):
             created_at=patient.created_at,
             updated_at=patient.updated_at,
         )
-    
+
     @staticmethod
     def _to_entity(model: PatientModel) -> Patient:
         """Convert database model to domain entity."""
@@ -93,3 +173,40 @@ class SQLAlchemyPatientRepository(PatientRepository):
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
+
+    @staticmethod
+    def _medication_to_entity(model: MedicationModel) -> Medication:
+        """Convert medication model to domain entity."""
+        return Medication(
+            id=model.id,
+            patient_id=model.patient_id,
+            name=model.name,
+            dosage=model.dosage,
+            frequency=model.frequency,
+            schedule_times=list(model.schedule_times),
+            start_date=model.start_date,
+            end_date=model.end_date,
+            instructions=model.instructions,
+            is_active=model.is_active,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+    @staticmethod
+    def _appointment_to_entity(model: AppointmentModel) -> Appointment:
+        """Convert appointment model to domain entity."""
+        return Appointment(
+            id=model.id,
+            patient_id=model.patient_id,
+            title=model.title,
+            description=model.description,
+            appointment_date=model.appointment_date,
+            duration_minutes=model.duration_minutes,
+            location=model.location,
+            doctor_name=model.doctor_name,
+            specialty=model.specialty,
+            status=model.status,
+            reminder_sent=model.reminder_sent,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
@@ -1,5 +1,4 @@
 """SQLAlchemy User Repository Implementation."""
-from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -7,59 +6,65 @@ from sqlalchemy.orm import Session
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.value_objects.email import Email
+from src.infrastructure.database.insert_if_absent import insert_if_absent
 from src.infrastructure.database.models.user_model import UserModel
 
 
 class SQLAlchemyUserRepository(UserRepository):
     """
     SQLAlchemy implementation of UserRepository.
-    
+
     Adapts domain entities to database models.
     """
-    
+
     def __init__(self, session: Session) -> None:
         self._session = session
-    
+
     def save(self, user: User) -> User:
         """Persist user to database."""
         user_model = self._to_model(user)
         self._session.merge(user_model)
         self._session.flush()
         return self._to_entity(user_model)
-    
-    def find_by_id(self, user_id: UUID) -> Optional[User]:
+
+    def insert_if_absent(self, user: User) -> User | None:
+        """Insert user in one statement; ``None`` if the email already exists."""
+        inserted_id = insert_if_absent(self._session, self._to_model(user), "email")
+        return user if inserted_id is not None else None
+
+    def find_by_id(self, user_id: UUID) -> User | None:
         """Find user by ID."""
         user_model = self._session.query(UserModel).filter(
             UserModel.id == user_id
         ).first()
-        
+
         return self._to_entity(user_model) if user_model else None
-    
-    def find_by_email(self, email: Email) -> Optional[User]:
+
+    def find_by_email(self, email: Email) -> User | None:
         """Find user by email."""
         user_model = self._session.query(UserModel).filter(
             UserModel.email == str(email)
         ).first()
-        
+
         return self._to_entity(user_model) if user_model else None
-    
+
     def exists_by_email(self, email: Email) -> bool:
         """Check if user exists by email."""
         return self._session.query(UserModel).filter(
             UserModel.email == str(email)
         ).count() > 0
-    
+
     def delete(self, user_id: UUID) -> None:
         """Delete user by ID."""
         self._session.query(UserModel).filter(
             UserModel.id == user_id
         ).delete()
-    
+
     def find_all(self, skip: int = 0, limit: int = 100) -> list[User]:
         """Find all users with pagination."""
         user_models = self._session.query(UserModel).offset(skip).limit(limit).all()
         return [self._to_entity(model) for model in user_models]
-    
+
     @staticmethod
     def _to_model(user: User) -> UserModel:
         """Convert domain entity to database model."""
@@ -74,7 +79,7 @@ class SQLAlchemyUserRepository(UserRepository):
             updated_at=user.updated_at,
             last_login=user.last_login,
         )
-    
+
     @staticmethod
     def _to_entity(model: UserModel) -> User:
         """Convert database model to domain entity."""
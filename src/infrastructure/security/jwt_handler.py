@@ -1,10 +1,12 @@
 """JWT Token Handler."""
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any
+from uuid import uuid4
 
 import jwt
 
 from src.config import get_settings
+from src.infrastructure.metrics.instruments import JWT_VERIFICATIONS
 
 settings = get_settings()
 
@@ -13,64 +15,75 @@ class JWTHandler:
     """
     JWT token creation and validation.
     """
-    
+
     def __init__(self) -> None:
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expires = settings.JWT_ACCESS_TOKEN_EXPIRES
         self.refresh_token_expires = settings.JWT_REFRESH_TOKEN_EXPIRES
-    
+
     def create_access_token(
-        self, 
-        subject: str, 
-        additional_claims: Optional[Dict[str, Any]] = None
+        self,
+        subject: str,
+        additional_claims: dict[str, Any] | None = None
     ) -> str:
         """Create an access token."""
         expires_delta = timedelta(seconds=self.access_token_expires)
         expire = datetime.utcnow() + expires_delta
-        
+
         to_encode = {
             "sub": subject,
             "exp": expire,
             "iat": datetime.utcnow(),
+            "jti": uuid4().hex,
             "type": "access",
         }
-        
+
         if additional_claims:
             to_encode.update(additional_claims)
-        
+
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
-    
-    def create_refresh_token(self, subject: str) -> str:
-        """Create a refresh token."""
+
+    def create_refresh_token(self, subject: str, family_id: str | None = None) -> str:
+        """
+        Create a refresh token.
+
+        Tokens rotated from one login share a ``fam`` (family) claim, so a
+        whole chain can be revoked at once; a new login starts a new family.
+        """
         expires_delta = timedelta(seconds=self.refresh_token_expires)
         expire = datetime.utcnow() + expires_delta
-        
+
         to_encode = {
             "sub": subject,
             "exp": expire,
             "iat": datetime.utcnow(),
+            "jti": uuid4().hex,
+            "fam": family_id or uuid4().hex,
             "type": "refresh",
         }
-        
+
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
-    
-    def decode_token(self, token: str) -> Dict[str, Any]:
+
+    def decode_token(self, token: str) -> dict[str, Any]:
         """Decode and validate a token."""
         try:
             payload = jwt.decode(
-                token, 
-                self.secret_key, 
+                token,
+                self.secret_key,
                 algorithms=[self.algorithm]
             )
+            JWT_VERIFICATIONS.inc("valid")
             return payload
-        except jwt.ExpiredSignatureError:
-            raise ValueError("Token has expired")
-        except jwt.JWTError:
-            raise ValueError("Invalid token")
-    
+        except jwt.ExpiredSignatureError as e:
+            JWT_VERIFICATIONS.inc("expired")
+            raise ValueError("Token has expired") from e
+        except jwt.InvalidTokenError as e:
+            JWT_VERIFICATIONS.inc("invalid")
+            raise ValueError("Invalid token") from e
+
     def get_subject(self, token: str) -> str:
         """Extract subject from token."""
         payload = self.decode_token(token)
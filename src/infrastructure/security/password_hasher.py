@@ -1,23 +1,43 @@
 """Password Hashing Utility."""
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import bcrypt
 
+from src.infrastructure.metrics.instruments import BCRYPT_DURATION, BCRYPT_IN_FLIGHT
+
+
+@contextmanager
+def _measure(operation: str) -> Iterator[None]:
+    """Count a bcrypt operation as in flight and time it."""
+    BCRYPT_IN_FLIGHT.inc(operation)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        BCRYPT_DURATION.observe(time.perf_counter() - started, operation)
+        BCRYPT_IN_FLIGHT.dec(operation)
+
 
 class PasswordHasher:
     """
     Password hashing and verification using bcrypt.
     """
-    
+
     def hash(self, password: str) -> str:
         """Hash a plain password."""
         # Bcrypt has a 72 byte limit
         password_bytes = password[:72].encode('utf-8')
         salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
+        with _measure("hash"):
+            hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
-    
+
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a plain password against a hash."""
         password_bytes = plain_password[:72].encode('utf-8')
         hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        with _measure("verify"):
+            return bcrypt.checkpw(password_bytes, hashed_bytes)
 
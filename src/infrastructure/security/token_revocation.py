@@ -0,0 +1,173 @@
+"""Token revocation stores."""
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+import redis
+
+from src.application.interfaces.token_revocation_store import TokenRevocationStore
+from src.config import get_settings
+from src.infrastructure.security.bloom_filter import BloomFilter
+from src.shared.utils.logger import setup_logger
+
+settings = get_settings()
+logger = setup_logger("cuidar_plus.token_revocation")
+
+# Revocations stay in the change log this long; a worker that has not
+# synced for longer rebuilds its filter from scratch
+LOG_RETENTION_SECONDS = 3600
+# Overlap between incremental syncs, covering clock skew between app hosts
+CLOCK_SKEW_SECONDS = 30
+
+
+class InMemoryTokenRevocationStore(TokenRevocationStore):
+    """Per-process store for tests and single-process development."""
+
+    # Expired entries are dropped every this many revocations
+    PURGE_EVERY = 1000
+
+    def __init__(self) -> None:
+        self._revoked: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._revocations = 0
+
+    def revoke(self, token_id: str, expires_at: int) -> bool:
+        now = time.time()
+        with self._lock:
+            if self._revoked.get(token_id, 0) > now:
+                return False
+            self._revoked[token_id] = expires_at
+            self._revocations += 1
+            if self._revocations % self.PURGE_EVERY == 0:
+                self._revoked = {key: exp for key, exp in self._revoked.items() if exp > now}
+            return True
+
+    def is_revoked(self, token_id: str) -> bool:
+        return self._revoked.get(token_id, 0) > time.time()
+
+
+class RedisTokenRevocationStore(TokenRevocationStore):
+    """
+    Revocations in Redis, screened by a Bloom filter in each worker.
+
+    Each revoked ID is a key with a TTL matching the token's expiry, so a
+    definitive check is one ``EXISTS``. Most tokens are not revoked, and
+    for those the local filter answers without a network call; only
+    filter hits (revoked tokens plus ``error_rate`` false positives) go to
+    Redis. Workers pull new revocations into their filter at most every
+    ``sync_interval`` seconds, which bounds how long another worker may
+    still accept a freshly revoked token. ``revoke`` itself always goes to
+    Redis, so its "already revoked" answer is exact.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        sync_interval: float = 1.0,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        key_prefix: str = "revoked",
+    ) -> None:
+        self._client = client
+        self.sync_interval = sync_interval
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._prefix = key_prefix
+        self._log_key = f"{key_prefix}:log"
+        self._expiry_key = f"{key_prefix}:expiry"
+        self._filter = BloomFilter(capacity, error_rate)
+        self._synced_at: float | None = None
+        self._next_sync = 0.0
+        self._sync_lock = threading.Lock()
+
+    def revoke(self, token_id: str, expires_at: int) -> bool:
+        now = time.time()
+        pipe = self._client.pipeline(transaction=True)
+        pipe.set(self._key(token_id), 1, ex=max(1, int(expires_at - now)), nx=True)
+        pipe.zadd(self._log_key, {token_id: now})
+        pipe.zremrangebyscore(self._log_key, "-inf", now - LOG_RETENTION_SECONDS)
+        pipe.zadd(self._expiry_key, {token_id: expires_at})
+        newly_revoked = pipe.execute()[0]
+
+        self._add(token_id)
+        return bool(newly_revoked)
+
+    def is_revoked(self, token_id: str) -> bool:
+        self._maybe_sync()
+        if token_id not in self._filter:
+            return False
+        return bool(self._client.exists(self._key(token_id)))
+
+    def after_fork(self) -> None:
+        # The sync lock may have been held by another thread mid-fork
+        self._sync_lock = threading.Lock()
+
+    def _key(self, token_id: str) -> str:
+        return f"{self._prefix}:{token_id}"
+
+    def _add(self, token_id: str) -> None:
+        if token_id not in self._filter:
+            self._filter.add(token_id)
+
+    def _maybe_sync(self) -> None:
+        if time.monotonic() < self._next_sync:
+            return
+        # One thread syncs; the others keep using the current filter
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() < self._next_sync:
+                return
+            self._next_sync = time.monotonic() + self.sync_interval
+            self._sync()
+        except redis.RedisError as e:
+            logger.warning(f"Token revocation sync failed, using the previous filter: {e}")
+        finally:
+            self._sync_lock.release()
+
+    def _sync(self) -> None:
+        now = time.time()
+        max_age = LOG_RETENTION_SECONDS - CLOCK_SKEW_SECONDS
+        stale = self._synced_at is None or now - self._synced_at > max_age
+        if stale or self._filter.full:
+            self._rebuild(now)
+        else:
+            for token_id in self._client.zrangebyscore(
+                self._log_key, self._synced_at - CLOCK_SKEW_SECONDS, "+inf"
+            ):
+                self._add(token_id)
+        self._synced_at = now
+
+    def _rebuild(self, now: float) -> None:
+        """Replace the filter with one holding every unexpired revocation."""
+        self._client.zremrangebyscore(self._expiry_key, "-inf", now)
+        token_ids = self._client.zrange(self._expiry_key, 0, -1)
+        rebuilt = BloomFilter(max(self.capacity, 2 * len(token_ids)), self.error_rate)
+        for token_id in token_ids:
+            rebuilt.add(token_id)
+        self._filter = rebuilt
+
+
+@lru_cache
+def get_token_revocation_store() -> TokenRevocationStore:
+    """The revocation store selected by ``TOKEN_REVOCATION_BACKEND``."""
+    if settings.TOKEN_REVOCATION_BACKEND == "memory":
+        return InMemoryTokenRevocationStore()
+
+    client = redis.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_timeout=1,
+        socket_connect_timeout=1,
+    )
+    store = RedisTokenRevocationStore(
+        client,
+        sync_interval=settings.TOKEN_REVOCATION_SYNC_INTERVAL,
+        capacity=settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+        error_rate=settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+    )
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=store.after_fork)
+    return store
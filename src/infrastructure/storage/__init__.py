@@ -0,0 +1 @@
+"""Storage service implementations package."""
@@ -0,0 +1,259 @@
+"""Content-addressed, deduplicating StorageService decorator."""
+import hashlib
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+from src.application.interfaces.storage_service import StorageService, StreamSource
+from src.config import get_settings
+from src.infrastructure.storage.streaming import iter_chunks
+
+settings = get_settings()
+
+
+class StripedLocks:
+    """A fixed set of process-local locks, picked by digest."""
+
+    def __init__(self, stripes: int = 64) -> None:
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __call__(self, digest: str) -> threading.Lock:
+        return self._locks[int(digest[:8], 16) % len(self._locks)]
+
+
+class BlobIndex(ABC):
+    """
+    Metadata index mapping logical file paths to content digests.
+
+    Keeps one reference count per digest so a blob is only removed from the
+    backend once no file path points to it anymore.
+    """
+
+    @abstractmethod
+    def lock(self, digest: str) -> AbstractContextManager[None]:
+        """
+        Serialise work on ``digest`` across everyone sharing this index.
+
+        Held around the existence check, the backend upload or delete and
+        the index update, so one worker cannot delete a blob that another
+        worker has just decided to reuse.
+        """
+        pass
+
+    @abstractmethod
+    def resolve(self, file_path: str) -> str | None:
+        """Return the digest stored under ``file_path``, if any."""
+        pass
+
+    @abstractmethod
+    def has_blob(self, digest: str) -> bool:
+        """Check if a blob with ``digest`` is referenced by at least one path."""
+        pass
+
+    @abstractmethod
+    def link(
+        self,
+        file_path: str,
+        digest: str,
+        size: int,
+        content_type: str | None = None,
+    ) -> str | None:
+        """
+        Point ``file_path`` at ``digest``, incrementing its reference count.
+
+        Returns the previous digest of ``file_path`` if overwriting it
+        dropped that blob's reference count to zero.
+        """
+        pass
+
+    @abstractmethod
+    def unlink(self, file_path: str) -> tuple[bool, str | None]:
+        """
+        Remove ``file_path`` from the index.
+
+        Returns ``(found, orphaned_digest)`` where ``orphaned_digest`` is set
+        when the blob is no longer referenced.
+        """
+        pass
+
+    @abstractmethod
+    def forget(self, digest: str) -> None:
+        """Drop the metadata of an unreferenced blob."""
+        pass
+
+
+class InMemoryBlobIndex(BlobIndex):
+    """Process-local BlobIndex, for tests and single-worker setups."""
+
+    def __init__(self) -> None:
+        self._files: dict[str, str] = {}
+        self._refs: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._digest_locks = StripedLocks()
+
+    @contextmanager
+    def lock(self, digest: str) -> Iterator[None]:
+        with self._digest_locks(digest):
+            yield
+
+    def resolve(self, file_path: str) -> str | None:
+        return self._files.get(file_path)
+
+    def has_blob(self, digest: str) -> bool:
+        return self._refs.get(digest, 0) > 0
+
+    def link(
+        self,
+        file_path: str,
+        digest: str,
+        size: int,
+        content_type: str | None = None,
+    ) -> str | None:
+        with self._lock:
+            previous = self._files.get(file_path)
+            if previous == digest:
+                return None
+            self._files[file_path] = digest
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+            return self._release(previous) if previous else None
+
+    def unlink(self, file_path: str) -> tuple[bool, str | None]:
+        with self._lock:
+            digest = self._files.pop(file_path, None)
+            if digest is None:
+                return False, None
+            return True, self._release(digest)
+
+    def forget(self, digest: str) -> None:
+        with self._lock:
+            if self._refs.get(digest, 0) <= 0:
+                self._refs.pop(digest, None)
+
+    def _release(self, digest: str) -> str | None:
+        self._refs[digest] -= 1
+        return digest if self._refs[digest] <= 0 else None
+
+
+class DeduplicatingStorageService(StorageService):
+    """
+    StorageService decorator that stores each distinct content only once.
+
+    Content is hashed (SHA-256) while it is streamed into a spool file, so
+    duplicates are detected before anything is sent to the backend and a
+    repeated upload costs no backend transfer at all. Blobs live under
+    ``blobs/<aa>/<digest>``; logical paths and reference counts are kept in
+    a BlobIndex, which also answers ``file_exists`` without a backend call.
+
+    Upload/delete of the same digest are serialised by ``BlobIndex.lock``,
+    which spans all workers when the index is shared (see
+    SQLAlchemyBlobIndex).
+    """
+
+    def __init__(
+        self,
+        backend: StorageService,
+        index: BlobIndex,
+        chunk_size: int | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        self._backend = backend
+        self._index = index
+        self._base_url = base_url.rstrip("/") if base_url else None
+        self._chunk_size = chunk_size or settings.STORAGE_CHUNK_SIZE
+
+    def upload_file(
+        self,
+        file_path: str,
+        content: bytes,
+        content_type: str | None = None,
+    ) -> str:
+        """Store an in-memory payload, skipping the backend if it is a duplicate."""
+        digest = hashlib.sha256(content).hexdigest()
+
+        with self._index.lock(digest):
+            if not self._index.has_blob(digest):
+                self._backend.upload_file(self.blob_key(digest), content, content_type)
+            orphan = self._index.link(file_path, digest, len(content), content_type)
+
+        self._collect(orphan)
+        return self._url_for(file_path)
+
+    def upload_stream(
+        self,
+        file_path: str,
+        source: StreamSource,
+        content_type: str | None = None,
+    ) -> str:
+        """Hash while spooling the stream, then upload only unseen content."""
+        hasher = hashlib.sha256()
+        size = 0
+
+        # Spools to disk beyond one chunk, so memory stays bounded by the chunk size
+        with tempfile.SpooledTemporaryFile(max_size=self._chunk_size) as spool:
+            for chunk in iter_chunks(source, self._chunk_size):
+                hasher.update(chunk)
+                spool.write(chunk)
+                size += len(chunk)
+
+            digest = hasher.hexdigest()
+            with self._index.lock(digest):
+                if not self._index.has_blob(digest):
+                    spool.seek(0)
+                    self._backend.upload_stream(self.blob_key(digest), spool, content_type)
+                orphan = self._index.link(file_path, digest, size, content_type)
+
+        self._collect(orphan)
+        return self._url_for(file_path)
+
+    def download_file(self, file_path: str) -> bytes:
+        """Download the blob behind ``file_path``."""
+        return self._backend.download_file(self._key_for(file_path))
+
+    def download_stream(
+        self,
+        file_path: str,
+        chunk_size: int | None = None,
+    ) -> Iterator[bytes]:
+        """Stream the blob behind ``file_path``."""
+        return self._backend.download_stream(self._key_for(file_path), chunk_size)
+
+    def download_range(self, file_path: str, start: int, end: int | None = None) -> bytes:
+        """Read a byte range of the blob behind ``file_path``."""
+        return self._backend.download_range(self._key_for(file_path), start, end)
+
+    def delete_file(self, file_path: str) -> bool:
+        """Drop a reference; the blob is deleted once nothing references it."""
+        found, orphan = self._index.unlink(file_path)
+        self._collect(orphan)
+        return found
+
+    def file_exists(self, file_path: str) -> bool:
+        """Index lookup; no backend round trip."""
+        return self._index.resolve(file_path) is not None
+
+    @staticmethod
+    def blob_key(digest: str) -> str:
+        """Backend key for a digest (fanned out to keep directories small)."""
+        return f"blobs/{digest[:2]}/{digest}"
+
+    def _key_for(self, file_path: str) -> str:
+        digest = self._index.resolve(file_path)
+        if digest is None:
+            raise FileNotFoundError(file_path)
+        return self.blob_key(digest)
+
+    def _collect(self, orphan: str | None) -> None:
+        """Delete an unreferenced blob unless an upload re-linked it meanwhile."""
+        if not orphan:
+            return
+        with self._index.lock(orphan):
+            if not self._index.has_blob(orphan):
+                self._backend.delete_file(self.blob_key(orphan))
+                self._index.forget(orphan)
+
+    def _url_for(self, file_path: str) -> str:
+        # Files are addressed by logical path; the blob key is an internal detail
+        key = file_path.lstrip("/")
+        return f"{self._base_url}/{key}" if self._base_url else key
@@ -0,0 +1,31 @@
+"""Storage service factory."""
+from src.application.interfaces.storage_service import StorageService
+from src.config import get_settings
+
+settings = get_settings()
+
+
+def create_storage_service() -> StorageService:
+    """
+    Create the storage backend selected by ``STORAGE_BACKEND``.
+
+    With ``STORAGE_DEDUPLICATE`` enabled the backend is wrapped in the
+    content-addressed store, indexed in the database.
+    """
+    backend = settings.STORAGE_BACKEND.lower()
+
+    if backend == "local":
+        from src.infrastructure.storage.local_storage import LocalStorageService
+        storage: StorageService = LocalStorageService()
+    elif backend == "s3":
+        from src.infrastructure.storage.s3_storage import S3StorageService
+        storage = S3StorageService()
+    else:
+        raise ValueError(f"Invalid storage backend: {settings.STORAGE_BACKEND}")
+
+    if settings.STORAGE_DEDUPLICATE:
+        from src.infrastructure.storage.deduplicating_storage import DeduplicatingStorageService
+        from src.infrastructure.storage.sqlalchemy_blob_index import SQLAlchemyBlobIndex
+        storage = DeduplicatingStorageService(storage, SQLAlchemyBlobIndex())
+
+    return storage
@@ -0,0 +1,221 @@
+"""S3-compatible Storage Implementation."""
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from src.application.interfaces.storage_service import StorageService, StreamSource
+from src.config import get_settings
+from src.infrastructure.storage.streaming import iter_chunks
+
+settings = get_settings()
+
+_NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound"}
+
+
+class S3StorageService(StorageService):
+    """
+    S3 (and S3-compatible, e.g. MinIO) implementation of StorageService.
+
+    Payloads larger than the multipart threshold are sent as multipart
+    uploads. Parts are uploaded in parallel, but at most
+    ``max_concurrency`` parts are in flight at any time, so peak memory is
+    bounded by ``chunk_size * max_concurrency`` regardless of file size.
+    """
+
+    def __init__(
+        self,
+        bucket: str | None = None,
+        client: Any = None,
+        chunk_size: int | None = None,
+        multipart_threshold: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        self._bucket = bucket or settings.AWS_BUCKET_NAME
+        if not self._bucket:
+            raise ValueError("AWS_BUCKET_NAME is required for S3 storage")
+
+        self._client = client or self._create_client()
+        self._chunk_size = chunk_size or settings.STORAGE_CHUNK_SIZE
+        self._multipart_threshold = multipart_threshold or settings.STORAGE_MULTIPART_THRESHOLD
+        self._max_concurrency = max(1, max_concurrency or settings.STORAGE_MAX_CONCURRENCY)
+
+    def upload_file(
+        self,
+        file_path: str,
+        content: bytes,
+        content_type: str | None = None,
+    ) -> str:
+        """Upload an in-memory payload."""
+        if len(content) < self._multipart_threshold:
+            self._put_object(file_path, content, content_type)
+            return self._url_for(file_path)
+        return self.upload_stream(file_path, [content], content_type)
+
+    def upload_stream(
+        self,
+        file_path: str,
+        source: StreamSource,
+        content_type: str | None = None,
+    ) -> str:
+        """
+        Upload a stream, switching to a parallel multipart upload once the
+        payload is known to exceed the multipart threshold.
+        """
+        chunks = iter_chunks(source, self._chunk_size)
+
+        # Buffer only up to the threshold to decide between a single PUT and multipart
+        head: list[bytes] = []
+        buffered = 0
+        for chunk in chunks:
+            head.append(chunk)
+            buffered += len(chunk)
+            if buffered >= self._multipart_threshold:
+                break
+        else:
+            self._put_object(file_path, b"".join(head), content_type)
+            return self._url_for(file_path)
+
+        self._multipart_upload(file_path, head, chunks, content_type)
+        return self._url_for(file_path)
+
+    def download_file(self, file_path: str) -> bytes:
+        """Download a whole object."""
+        return self._get_object(file_path)["Body"].read()
+
+    def download_stream(
+        self,
+        file_path: str,
+        chunk_size: int | None = None,
+    ) -> Iterator[bytes]:
+        """Stream an object in chunks."""
+        body = self._get_object(file_path)["Body"]
+        return self._read_chunks(body, chunk_size or self._chunk_size)
+
+    def download_range(self, file_path: str, start: int, end: int | None = None) -> bytes:
+        """Download ``[start, end)`` with an HTTP range request."""
+        if start < 0 or (end is not None and end < start):
+            raise ValueError(f"Invalid byte range: {start}-{end}")
+        if end == start:
+            return b""
+
+        byte_range = f"bytes={start}-{end - 1}" if end is not None else f"bytes={start}-"
+        return self._get_object(file_path, Range=byte_range)["Body"].read()
+
+    def delete_file(self, file_path: str) -> bool:
+        """Delete an object."""
+        self._client.delete_object(Bucket=self._bucket, Key=file_path)
+        return True
+
+    def file_exists(self, file_path: str) -> bool:
+        """Check if an object exists with a HEAD request."""
+        try:
+            self._client.head_object(Bucket=self._bucket, Key=file_path)
+            return True
+        except Exception as e:
+            if self._is_not_found(e):
+                return False
+            raise
+
+    def _multipart_upload(
+        self,
+        file_path: str,
+        head: list[bytes],
+        rest: Iterator[bytes],
+        content_type: str | None,
+    ) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        upload_id = self._client.create_multipart_upload(
+            Bucket=self._bucket, Key=file_path, **extra
+        )["UploadId"]
+
+        parts: list[dict] = []
+        in_flight: set[Future] = set()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+                part_number = 0
+                for chunk in self._chain(head, rest):
+                    part_number += 1
+                    in_flight.add(executor.submit(
+                        self._upload_part, file_path, upload_id, part_number, chunk
+                    ))
+                    # Back-pressure: don't read more chunks than we can upload
+                    if len(in_flight) >= self._max_concurrency:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        parts.extend(future.result() for future in done)
+
+                parts.extend(future.result() for future in in_flight)
+
+            parts.sort(key=lambda part: part["PartNumber"])
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=file_path,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=file_path, UploadId=upload_id
+            )
+            raise
+
+    def _upload_part(self, file_path: str, upload_id: str, part_number: int, chunk: bytes) -> dict:
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=file_path,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=chunk,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _put_object(self, file_path: str, content: bytes, content_type: str | None) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        self._client.put_object(Bucket=self._bucket, Key=file_path, Body=content, **extra)
+
+    def _get_object(self, file_path: str, **kwargs: Any) -> dict:
+        try:
+            return self._client.get_object(Bucket=self._bucket, Key=file_path, **kwargs)
+        except Exception as e:
+            if self._is_not_found(e):
+                raise FileNotFoundError(file_path) from e
+            raise
+
+    @staticmethod
+    def _chain(head: list[bytes], rest: Iterator[bytes]) -> Iterator[bytes]:
+        while head:
+            yield head.pop(0)
+        yield from rest
+
+    @staticmethod
+    def _read_chunks(body: Any, chunk_size: int) -> Iterator[bytes]:
+        try:
+            while chunk := body.read(chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        response = getattr(error, "response", None) or {}
+        return str(response.get("Error", {}).get("Code")) in _NOT_FOUND_CODES
+
+    def _url_for(self, file_path: str) -> str:
+        if settings.AWS_ENDPOINT_URL:
+            return f"{settings.AWS_ENDPOINT_URL.rstrip('/')}/{self._bucket}/{file_path}"
+        return f"https://{self._bucket}.s3.{settings.AWS_REGION}.amazonaws.com/{file_path}"
+
+    @staticmethod
+    def _create_client() -> Any:
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImportError("boto3 is required for S3 storage (pip install boto3)") from e
+
+        return boto3.client(
+            "s3",
+            region_name=settings.AWS_REGION,
+            endpoint_url=settings.AWS_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
@@ -0,0 +1,129 @@
+"""SQLAlchemy BlobIndex Implementation."""
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models.stored_blob_model import StoredBlobModel, StoredFileModel
+from src.infrastructure.database.session import get_db_context
+from src.infrastructure.storage.deduplicating_storage import BlobIndex, StripedLocks
+
+
+class SQLAlchemyBlobIndex(BlobIndex):
+    """
+    Database-backed BlobIndex shared by all workers.
+
+    Every mutation runs in its own short transaction and locks the rows it
+    touches (``SELECT ... FOR UPDATE``), so reference counts stay exact under
+    concurrent uploads and deletes.
+
+    ``lock`` takes a PostgreSQL transaction-level advisory lock on the
+    digest, held by its own session for the whole block, so the backend
+    upload or delete is serialised across workers and hosts; that block
+    uses a second pooled connection for the index queries inside it. Other
+    dialects only get the process-local lock (SQLite is single-host).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]] = get_db_context,
+    ) -> None:
+        self._session_factory = session_factory
+        self._local_locks = StripedLocks()
+
+    @contextmanager
+    def lock(self, digest: str) -> Iterator[None]:
+        with self._local_locks(digest), self._session_factory() as session:
+            if session.get_bind().dialect.name == "postgresql":
+                # Released when the session's transaction ends
+                session.execute(select(func.pg_advisory_xact_lock(self.advisory_key(digest))))
+            yield
+
+    @staticmethod
+    def advisory_key(digest: str) -> int:
+        """Signed 64-bit advisory lock key for a hex digest (its first 60 bits)."""
+        return int(digest[:15], 16)
+
+    def resolve(self, file_path: str) -> str | None:
+        with self._session_factory() as session:
+            return session.query(StoredFileModel.digest).filter(
+                StoredFileModel.file_path == file_path
+            ).scalar()
+
+    def has_blob(self, digest: str) -> bool:
+        with self._session_factory() as session:
+            ref_count = session.query(StoredBlobModel.ref_count).filter(
+                StoredBlobModel.digest == digest
+            ).scalar()
+            return bool(ref_count and ref_count > 0)
+
+    def link(
+        self,
+        file_path: str,
+        digest: str,
+        size: int,
+        content_type: str | None = None,
+    ) -> str | None:
+        try:
+            return self._link(file_path, digest, size, content_type)
+        except IntegrityError:
+            # Another worker inserted the same blob or path first; the rows exist now
+            return self._link(file_path, digest, size, content_type)
+
+    def unlink(self, file_path: str) -> tuple[bool, str | None]:
+        with self._session_factory() as session:
+            stored_file = session.get(StoredFileModel, file_path, with_for_update=True)
+            if stored_file is None:
+                return False, None
+            digest = stored_file.digest
+            session.delete(stored_file)
+            session.flush()
+            return True, self._release(session, digest)
+
+    def forget(self, digest: str) -> None:
+        with self._session_factory() as session:
+            session.query(StoredBlobModel).filter(
+                StoredBlobModel.digest == digest,
+                StoredBlobModel.ref_count <= 0,
+            ).delete(synchronize_session=False)
+
+    def _link(
+        self,
+        file_path: str,
+        digest: str,
+        size: int,
+        content_type: str | None,
+    ) -> str | None:
+        with self._session_factory() as session:
+            stored_file = session.get(StoredFileModel, file_path, with_for_update=True)
+            if stored_file is not None and stored_file.digest == digest:
+                return None
+
+            blob = session.get(StoredBlobModel, digest, with_for_update=True)
+            if blob is None:
+                blob = StoredBlobModel(
+                    digest=digest, size=size, content_type=content_type, ref_count=0
+                )
+                session.add(blob)
+            blob.ref_count += 1
+
+            orphan = None
+            if stored_file is None:
+                session.add(StoredFileModel(file_path=file_path, digest=digest))
+            else:
+                previous = stored_file.digest
+                stored_file.digest = digest
+                orphan = self._release(session, previous)
+
+            session.flush()
+            return orphan
+
+    @staticmethod
+    def _release(session: Session, digest: str) -> str | None:
+        blob = session.get(StoredBlobModel, digest, with_for_update=True)
+        if blob is None:
+            return None
+        blob.ref_count -= 1
+        return digest if blob.ref_count <= 0 else None
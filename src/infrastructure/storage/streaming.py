@@ -0,0 +1,36 @@
+"""Chunking helpers shared by the storage backends."""
+from collections.abc import Iterator
+
+from src.application.interfaces.storage_service import StreamSource
+
+
+def iter_chunks(source: StreamSource, chunk_size: int) -> Iterator[bytes]:
+    """
+    Re-chunk a file object or an iterable of bytes into ``chunk_size`` pieces.
+
+    Every chunk except the last one has exactly ``chunk_size`` bytes, which is
+    what multipart uploads require. At most one chunk is buffered at a time.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be greater than 0")
+
+    if hasattr(source, "read"):
+        pieces: Iterator[bytes] = iter(lambda: source.read(chunk_size), b"")
+    else:
+        pieces = iter(source)
+
+    buffer = bytearray()
+    for piece in pieces:
+        if not piece:
+            continue
+        if not buffer and len(piece) == chunk_size:
+            # Fast path: already the right size, avoid copying into the buffer
+            yield bytes(piece)
+            continue
+        buffer += piece
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+
+    if buffer:
+        yield bytes(buffer)
@@ -1,18 +1,40 @@
 """Application Entry Point - Flask App Factory."""
-from flask import Flask, jsonify, render_template, request
+from importlib import import_module
+
+from flask import Blueprint, Flask, jsonify, render_template, request
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 from src.config import get_settings
 from src.presentation.api.middlewares.error_handler import register_error_handlers
-from src.presentation.api.v1.routes.auth_routes import auth_bp
-from src.presentation.api.v1.routes.inventory_routes import inventory_bp
-from src.presentation.api.v1.routes.patient_routes import patient_bp
-from src.presentation.api.v1.routes.reports_routes import reports_bp
-from src.presentation.api.v1.routes.user_routes import user_bp
+from src.presentation.api.middlewares.metrics import register_metrics
+from src.presentation.api.middlewares.n_plus_one import register_n_plus_one_detection
+from src.presentation.api.middlewares.profiling import register_profiling
+from src.presentation.api.middlewares.query_tracing import register_query_tracing
+from src.presentation.api.middlewares.rate_limit import register_rate_limiting
+from src.presentation.api.middlewares.request_logging import register_request_logging
+from src.presentation.api.middlewares.unit_of_work import register_unit_of_work
 from src.shared.utils.logger import app_logger
 
 settings = get_settings()
 
+# Imported by create_app() rather than at module import, together with the
+# use cases, repositories and models they pull in
+BLUEPRINTS = (
+    "src.presentation.api.v1.routes.auth_routes:auth_bp",
+    "src.presentation.api.v1.routes.user_routes:user_bp",
+    "src.presentation.api.v1.routes.patient_routes:patient_bp",
+    "src.presentation.api.v1.routes.inventory_routes:inventory_bp",
+    "src.presentation.api.v1.routes.reports_routes:reports_bp",
+    "src.presentation.api.v1.routes.admin_routes:admin_bp",
+)
+
+
+def load_blueprint(path: str) -> Blueprint:
+    """Import a blueprint given as ``"package.module:attribute"``."""
+    module_name, attribute = path.split(":")
+    return getattr(import_module(module_name), attribute)
+
 
 def create_app() -> Flask:
     """
@@ -26,18 +48,38 @@ def create_app() -> Flask:
     app.config["SECRET_KEY"] = settings.SECRET_KEY
     app.config["DEBUG"] = settings.FLASK_ENV == "development"
 
+    # Client IP from X-Forwarded-For, counting only the trusted proxy hops
+    if settings.PROXY_FIX_X_FOR:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=settings.PROXY_FIX_X_FOR)
+
     # CORS
     CORS(app, origins=settings.get_cors_origins(), supports_credentials=True)
 
     # Register error handlers
     register_error_handlers(app)
 
+    # Request IDs and structured request logs
+    register_request_logging(app)
+
+    # Per-route latency histograms and /metrics
+    register_metrics(app)
+
+    # Token buckets for login and writes; rejected requests never reach the DB
+    register_rate_limiting(app)
+
+    # Per-request query tracing (Server-Timing)
+    register_query_tracing(app)
+    register_n_plus_one_detection(app)
+
+    # On-demand stack profiles (off unless PROFILING_ENABLED)
+    register_profiling(app)
+
+    # One lazily opened DB session per request, committed on success
+    register_unit_of_work(app)
+
     # Register blueprints
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(user_bp)
-    app.register_blueprint(patient_bp)
-    app.register_blueprint(inventory_bp)
-    app.register_blueprint(reports_bp)
+    for path in BLUEPRINTS:
+        app.register_blueprint(load_blueprint(path))
 
     # Health check endpoint
     @app.route("/health", methods=["GET"])
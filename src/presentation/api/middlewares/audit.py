@@ -0,0 +1,42 @@
+"""Audit Middleware - records who read which patient's data."""
+from collections.abc import Iterable
+from uuid import UUID
+
+from flask import g, request
+
+from src.application.interfaces.audit_trail import PatientAccessEvent
+from src.config import get_settings
+from src.infrastructure.audit.buffered_audit_trail import get_audit_trail
+
+settings = get_settings()
+
+
+def record_patient_access(patient_ids: Iterable[UUID], action: str = "read") -> None:
+    """
+    Record that the authenticated user accessed these patients.
+
+    Call after the data has been loaded, from a route protected by
+    ``require_auth``. Events are buffered and written in bulk, so this
+    adds no database round trip to the request.
+    """
+    if not settings.AUDIT_ENABLED:
+        return
+
+    try:
+        actor_id = UUID(request.user_id)
+    except (AttributeError, TypeError, ValueError):
+        actor_id = None
+    route = request.url_rule.rule if request.url_rule is not None else request.path
+    events = [
+        PatientAccessEvent(
+            actor_id=actor_id,
+            patient_id=patient_id,
+            action=action,
+            route=route,
+            request_id=g.get("request_id"),
+            ip_address=request.remote_addr,
+        )
+        for patient_id in patient_ids
+    ]
+    if events:
+        get_audit_trail().record(events)
@@ -0,0 +1,64 @@
+"""Metrics Middleware - per-route latency and the /metrics endpoint."""
+import hmac
+import time
+
+from flask import Flask, Response, g, jsonify, request
+
+from src.config import get_settings
+from src.infrastructure.metrics.instruments import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    flush_metrics,
+    render_metrics,
+)
+
+settings = get_settings()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def register_metrics(app: Flask) -> None:
+    """
+    Record request latency per blueprint and route, and serve every
+    metric at ``/metrics`` in the Prometheus text format.
+
+    Routes are labelled by their rule (``/api/v1/patients/<patient_id>``),
+    not the requested path, so label cardinality stays bounded. With
+    ``METRICS_TOKEN`` set, scrapes must send it as a bearer token and also
+    get the connection pool gauges; without it the pools are left out.
+    """
+    if not settings.METRICS_ENABLED:
+        return
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response: Response) -> Response:
+        started = g.pop("request_started", None)
+        if started is None:
+            return response
+
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        blueprint = request.blueprint or ""
+        elapsed = time.perf_counter() - started
+        HTTP_REQUEST_DURATION.observe(elapsed, request.method, blueprint, route)
+        HTTP_REQUESTS.inc(request.method, blueprint, route, str(response.status_code))
+        flush_metrics()
+        return response
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics():
+        """Prometheus scrape endpoint."""
+        token = settings.METRICS_TOKEN
+        if token and not _is_scrape_token(token):
+            return jsonify({"error": "Invalid metrics token"}), 401
+        return Response(
+            render_metrics(include_pools=bool(token)), mimetype=None, content_type=CONTENT_TYPE
+        )
+
+
+def _is_scrape_token(token: str) -> bool:
+    header = request.headers.get("Authorization", "")
+    return hmac.compare_digest(header.encode(), f"Bearer {token}".encode())
@@ -0,0 +1,35 @@
+"""N+1 Detection Middleware - one detection scope per request."""
+from flask import Flask, Response, g
+
+from src.config import get_settings
+from src.infrastructure.database.n_plus_one import end_detection, start_detection
+
+settings = get_settings()
+
+
+def register_n_plus_one_detection(app: Flask) -> None:
+    """
+    Count statement shapes per request.
+
+    ``QUERY_N_PLUS_ONE_MODE=log`` (staging) logs repeated shapes,
+    ``raise`` (tests) fails the request. ``off`` registers nothing.
+    """
+    if settings.QUERY_N_PLUS_ONE_MODE == "off":
+        return
+
+    @app.before_request
+    def start_n_plus_one_detection():
+        g.n_plus_one_token = start_detection()
+
+    @app.after_request
+    def end_n_plus_one_detection(response: Response) -> Response:
+        token = g.pop("n_plus_one_token", None)
+        if token is not None:
+            end_detection(token)
+        return response
+
+    @app.teardown_request
+    def reset_n_plus_one_detection(exc: BaseException | None = None) -> None:
+        token = g.pop("n_plus_one_token", None)
+        if token is not None:
+            end_detection(token)
@@ -0,0 +1,115 @@
+"""Profiling Middleware - statistical stack profiles of selected requests."""
+import random
+import time
+
+from flask import Flask, Response, g, request
+
+from src.config import get_settings
+from src.infrastructure.metrics.instruments import record_cache_lookup
+from src.infrastructure.profiling.sampler import Profile, StackSampler
+from src.infrastructure.profiling.store import (
+    ProfileStore,
+    ProfilingToggle,
+    get_profile_store,
+    new_profile_id,
+    profile_token_secret,
+    verify_profile_token,
+)
+from src.shared.utils.logger import app_logger
+
+settings = get_settings()
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# How long a worker trusts its last read of the admin toggle
+TOGGLE_CACHE_SECONDS = 1.0
+
+
+class ToggleCache:
+    """The admin profiling toggle, re-read from the store at most once per TOGGLE_CACHE_SECONDS."""
+
+    def __init__(self, store: ProfileStore) -> None:
+        self._store = store
+        self._checked_at = float("-inf")
+        self._toggle: ProfilingToggle | None = None
+
+    def get(self) -> ProfilingToggle | None:
+        now = time.monotonic()
+        stale = now - self._checked_at > TOGGLE_CACHE_SECONDS
+        record_cache_lookup("profiling_toggle", hit=not stale)
+        if stale:
+            self._toggle = self._store.get_toggle()
+            self._checked_at = now
+        return self._toggle
+
+
+def should_profile(toggles: ToggleCache) -> bool:
+    """Signed header, matching admin toggle or random sample - see ``register_profiling``."""
+    token = request.headers.get(PROFILE_HEADER)
+    if token and verify_profile_token(profile_token_secret(), token):
+        return True
+
+    toggle = toggles.get()
+    if toggle is not None and toggle.matches(request.path):
+        return True
+
+    rate = settings.PROFILING_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+def save_profile(store: ProfileStore, profile: Profile) -> None:
+    """Store a finished profile; a full or read-only disk only costs a warning."""
+    try:
+        store.save(profile)
+    except OSError as e:
+        app_logger.warning(f"Could not store profile {profile.id}: {e}")
+        return
+    app_logger.info(
+        f"Profile {profile.id} stored: {profile.name} "
+        f"({profile.duration_ms:.1f} ms, {profile.samples} samples)"
+    )
+
+
+def register_profiling(app: Flask) -> None:
+    """
+    Profile a request when any of these holds:
+
+    - it carries a valid signed ``X-Profile`` header (minted by an admin),
+    - an admin toggle covers its path (``PUT /api/v1/admin/profiling``),
+    - it falls in the ``PROFILING_SAMPLE_RATE`` random sample.
+
+    Profiled responses carry ``X-Profile-Id``; the profile is fetched from
+    ``/api/v1/admin/profiles/<id>``. With ``PROFILING_ENABLED`` off no hook
+    is registered, so unprofiled deployments pay nothing.
+    """
+    if not settings.PROFILING_ENABLED:
+        return
+
+    store = get_profile_store()
+    toggles = ToggleCache(store)
+
+    @app.before_request
+    def start_profiling():
+        if not should_profile(toggles):
+            return
+        profile = Profile(
+            id=new_profile_id(),
+            name=f"{request.method} {request.path}",
+            interval_ms=settings.PROFILING_INTERVAL_MS,
+        )
+        g.profiler = StackSampler(profile)
+        g.profiler.start()
+
+    @app.after_request
+    def add_profile_id(response: Response) -> Response:
+        sampler = g.get("profiler")
+        if sampler is not None:
+            response.headers[PROFILE_ID_HEADER] = sampler.profile.id
+        return response
+
+    @app.teardown_request
+    def stop_profiling(exc: BaseException | None = None) -> None:
+        sampler = g.pop("profiler", None)
+        if sampler is not None:
+            save_profile(store, sampler.stop())
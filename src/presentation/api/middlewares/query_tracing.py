@@ -0,0 +1,48 @@
+"""Query Tracing Middleware - exposes per-request DB stats as Server-Timing."""
+from flask import Flask, Response, g
+
+from src.config import get_settings
+from src.infrastructure.database.query_tracing import QueryStats, end_trace, start_trace
+
+settings = get_settings()
+
+
+def register_query_tracing(app: Flask) -> None:
+    """
+    Trace database activity per request.
+
+    Sampled responses carry a ``Server-Timing`` header, e.g.:
+        Server-Timing: db;dur=12.4;desc="7 queries", db-slowest;dur=8.1
+    """
+    if not settings.QUERY_TRACING_ENABLED:
+        return
+
+    @app.before_request
+    def start_query_trace():
+        g.query_trace_token = start_trace()
+
+    @app.after_request
+    def add_server_timing(response: Response) -> Response:
+        token = g.pop("query_trace_token", None)
+        if token is None:
+            return response
+
+        stats = end_trace(token)
+        if stats is not None:
+            response.headers.add("Server-Timing", server_timing(stats))
+        return response
+
+    @app.teardown_request
+    def reset_query_trace(exc: BaseException | None = None) -> None:
+        # after_request is skipped on unhandled errors; don't leak the trace
+        token = g.pop("query_trace_token", None)
+        if token is not None:
+            end_trace(token)
+
+
+def server_timing(stats: QueryStats) -> str:
+    """``Server-Timing`` value for a request's query stats (shared with the ASGI app)."""
+    timings = [f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"']
+    if stats.slowest:
+        timings.append(f"db-slowest;dur={stats.slowest[0][0]:.2f}")
+    return ", ".join(timings)
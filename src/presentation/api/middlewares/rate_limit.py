@@ -0,0 +1,112 @@
+"""Rate Limit Middleware - token buckets for login and write endpoints."""
+import hashlib
+
+from flask import Flask, Response, g, jsonify, request
+
+from src.config import get_settings
+from src.infrastructure.metrics.instruments import RATE_LIMITED
+from src.infrastructure.rate_limiting.limiter import get_rate_limiter
+from src.infrastructure.rate_limiting.token_bucket import Limit
+from src.infrastructure.security.jwt_handler import JWTHandler
+
+settings = get_settings()
+
+# Reads are not limited
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+DIMENSIONS = ("ip", "account", "route")
+
+
+def parse_rules(config: dict[str, dict[str, str]]) -> dict[str, dict[str, Limit]]:
+    """Parse ``{rule: {dimension: "5/minute"}}``, rejecting unknown dimensions."""
+    rules = {}
+    for name, limits in config.items():
+        unknown = set(limits) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown rate limit dimension(s) in {name!r}: {', '.join(sorted(unknown))}"
+            )
+        rules[name] = {dimension: Limit.parse(spec) for dimension, spec in limits.items()}
+    return rules
+
+
+def match_rule(
+    rules: dict[str, dict[str, Limit]],
+    endpoint: str | None,
+    blueprint: str | None,
+) -> str | None:
+    """The most specific rule: the endpoint (``auth.login``), its blueprint, then ``*``."""
+    for name in (endpoint, blueprint, "*"):
+        if name is not None and name in rules:
+            return name
+    return None
+
+
+def _account() -> str | None:
+    """
+    The authenticated user, or for login/signup the email in the body.
+
+    The token is verified (a forged ``sub`` must not drain someone else's
+    bucket) and handed to ``require_auth``, which then skips decoding it.
+    """
+    auth_header = request.headers.get("Authorization", "")
+    scheme, _, token = auth_header.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            payload = JWTHandler().decode_token(token)
+        except ValueError:
+            return None
+        g.verified_token = (token, payload)
+        return payload.get("sub")
+
+    data = request.get_json(silent=True)
+    email = data.get("email") if isinstance(data, dict) else None
+    if isinstance(email, str) and email:
+        # Hashed: bucket keys end up in Redis
+        return hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
+    return None
+
+
+def register_rate_limiting(app: Flask) -> None:
+    """
+    Take a token per request from the buckets of the matching rule, and
+    answer 429 with ``Retry-After`` when any of them is empty.
+
+    ``RATE_LIMIT_RULES`` maps an endpoint, a blueprint or ``*`` to limits
+    per client IP, per account and per route (shared by every client).
+    Only non-GET requests are limited.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+
+    rules = parse_rules(settings.RATE_LIMIT_RULES)
+
+    @app.before_request
+    def enforce_rate_limits():
+        if request.method in SAFE_METHODS:
+            return None
+        name = match_rule(rules, request.endpoint, request.blueprint)
+        if name is None:
+            return None
+
+        values = {
+            "ip": lambda: request.remote_addr,
+            "account": _account,
+            "route": lambda: request.endpoint,
+        }
+        buckets = []
+        for dimension, limit in rules[name].items():
+            value = values[dimension]()
+            if value is not None:
+                buckets.append((f"{name}:{dimension}:{value}", limit))
+        if not buckets:
+            return None
+
+        decision = get_rate_limiter().acquire(buckets)
+        if decision.allowed:
+            return None
+
+        RATE_LIMITED.inc(name)
+        response: Response = jsonify({"error": "Too many requests", "code": "RATE_LIMITED"})
+        response.status_code = 429
+        response.headers["Retry-After"] = decision.retry_after_header
+        return response
@@ -0,0 +1,61 @@
+"""Request Logging Middleware - request IDs and one structured record per request."""
+import re
+import time
+from uuid import uuid4
+
+from flask import Flask, Response, g, request
+
+from src.config import get_settings
+from src.shared.utils.logger import bind_log_context, reset_log_context, setup_logger
+
+settings = get_settings()
+access_logger = setup_logger("cuidar_plus.access")
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Accept the caller's (e.g. the load balancer's) ID if it is reasonable
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+def register_request_logging(app: Flask) -> None:
+    """
+    Bind request ID, method and route to every record logged while the
+    request runs (``require_auth`` adds the user ID), echo the ID in the
+    ``X-Request-ID`` response header, and log status and latency when the
+    request completes.
+    """
+
+    @app.before_request
+    def bind_request_context():
+        request_id = request.headers.get(REQUEST_ID_HEADER, "")
+        if not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid4().hex
+
+        g.request_id = request_id
+        g.request_log_started = time.perf_counter()
+        g.log_context_token = bind_log_context(
+            request_id=request_id,
+            method=request.method,
+            route=request.url_rule.rule if request.url_rule is not None else request.path,
+        )
+
+    @app.after_request
+    def log_request(response: Response) -> Response:
+        request_id = g.get("request_id")
+        if request_id is None:
+            return response
+
+        response.headers[REQUEST_ID_HEADER] = request_id
+        if settings.LOG_REQUESTS:
+            latency_ms = (time.perf_counter() - g.request_log_started) * 1000
+            access_logger.info(
+                f"{request.method} {request.path} {response.status_code} {latency_ms:.1f}ms",
+                extra={"status": response.status_code, "latency_ms": round(latency_ms, 2)},
+            )
+        return response
+
+    @app.teardown_request
+    def unbind_request_context(exc: BaseException | None = None) -> None:
+        token = g.pop("log_context_token", None)
+        if token is not None:
+            reset_log_context(token)
@@ -0,0 +1,31 @@
+"""Unit of Work Middleware - one transaction boundary per request."""
+from flask import Flask, Response, g
+
+
+def register_unit_of_work(app: Flask) -> None:
+    """
+    Finish the request's unit of work.
+
+    Successful responses (< 400) are committed; error responses roll back.
+    Requests that never asked for a session have nothing to finish.
+    """
+
+    @app.after_request
+    def finish_unit_of_work(response: Response) -> Response:
+        uow = g.get("unit_of_work")
+        if uow is None or not uow.active:
+            return response
+
+        if response.status_code < 400:
+            uow.commit()
+        else:
+            uow.rollback()
+        return response
+
+    @app.teardown_request
+    def close_unit_of_work(exc: BaseException | None = None) -> None:
+        # Also runs on unhandled errors, when after_request was skipped;
+        # closing an uncommitted session rolls it back
+        uow = g.pop("unit_of_work", None)
+        if uow is not None:
+            uow.close()
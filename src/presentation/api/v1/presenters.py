@@ -0,0 +1,65 @@
+"""Presenters - JSON bodies of read responses, shared by the WSGI and ASGI apps."""
+from typing import Any
+
+from src.application.use_cases.patients.caregiver_dashboard import CaregiverDashboardOutput
+from src.application.use_cases.patients.list_patients import ListPatientsOutput
+from src.application.use_cases.users.get_user_by_id import GetUserByIdOutput
+
+
+def present_user(output: GetUserByIdOutput) -> dict[str, Any]:
+    return {
+        "id": str(output.id),
+        "email": output.email,
+        "full_name": output.full_name,
+        "role": output.role,
+        "is_active": output.is_active,
+        "created_at": output.created_at.isoformat(),
+        "last_login": output.last_login.isoformat() if output.last_login else None,
+    }
+
+
+def present_patient_list(output: ListPatientsOutput) -> dict[str, Any]:
+    return {
+        "patients": [
+            {
+                "id": str(p.id),
+                "full_name": p.full_name,
+                "age": p.age,
+                "gender": p.gender,
+                "is_active": p.is_active,
+            }
+            for p in output.patients
+        ],
+        "total": output.total,
+    }
+
+
+def present_caregiver_dashboard(output: CaregiverDashboardOutput) -> dict[str, Any]:
+    return {
+        "patients": [
+            {
+                "id": str(p.id),
+                "full_name": p.full_name,
+                "age": p.age,
+                "active_medication_count": p.active_medication_count,
+                "todays_doses": [
+                    {
+                        "medication_id": str(dose.medication_id),
+                        "medication_name": dose.medication_name,
+                        "dosage": dose.dosage,
+                        "scheduled_time": dose.scheduled_time.isoformat(),
+                    }
+                    for dose in p.todays_doses
+                ],
+                "next_appointment": {
+                    "id": str(p.next_appointment.id),
+                    "title": p.next_appointment.title,
+                    "appointment_date": p.next_appointment.appointment_date.isoformat(),
+                    "location": p.next_appointment.location,
+                    "doctor_name": p.next_appointment.doctor_name,
+                } if p.next_appointment else None,
+            }
+            for p in output.patients
+        ],
+        "total": output.total,
+    }
@@ -0,0 +1,197 @@
+"""Admin Routes - request profiling, pool metrics and the access audit trail."""
+import time
+from datetime import datetime
+from uuid import UUID
+
+from flask import Blueprint, jsonify, request, send_file
+from pydantic import ValidationError
+
+from src.config import get_settings
+from src.infrastructure.audit.sqlalchemy_audit_store import SQLAlchemyAuditEventReader
+from src.infrastructure.database.session import REPORTING, get_pool_metrics
+from src.infrastructure.database.unit_of_work import get_session
+from src.infrastructure.profiling.store import (
+    ProfilingToggle,
+    get_profile_store,
+    profile_token_secret,
+    sign_profile_token,
+)
+from src.presentation.api.middlewares.auth_middleware import require_auth, require_role
+from src.presentation.api.middlewares.profiling import PROFILE_HEADER
+from src.presentation.api.v1.schemas.admin_schemas import (
+    CreateProfilingTokenRequest,
+    EnableProfilingRequest,
+)
+from src.presentation.api.v1.schemas.base import parse_body, validation_error_response
+
+settings = get_settings()
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/api/v1/admin")
+
+MAX_AUDIT_PAGE_SIZE = 1000
+
+
+@admin_bp.route("/profiling", methods=["GET"])
+@require_auth
+@require_role("admin")
+def get_profiling():
+    """Profiling settings and the active toggle, if any."""
+    toggle = get_profile_store().get_toggle()
+    return jsonify({
+        "enabled": settings.PROFILING_ENABLED,
+        "sample_rate": settings.PROFILING_SAMPLE_RATE,
+        "interval_ms": settings.PROFILING_INTERVAL_MS,
+        "toggle": None if toggle is None else {
+            "path_prefix": toggle.path_prefix,
+            "expires_at": toggle.expires_at,
+        },
+    }), 200
+
+
+@admin_bp.route("/profiling", methods=["PUT"])
+@require_auth
+@require_role("admin")
+def enable_profiling():
+    """
+    Profile every request under a path prefix for a while.
+
+    Request body:
+    {
+        "path_prefix": "/api/v1/patients/caregiver",
+        "duration_seconds": 300
+    }
+    """
+    try:
+        body = parse_body(EnableProfilingRequest, optional=True)
+    except ValidationError as e:
+        return validation_error_response(e)
+
+    toggle = ProfilingToggle(
+        path_prefix=body.path_prefix, expires_at=time.time() + body.duration_seconds
+    )
+    get_profile_store().set_toggle(toggle)
+    return jsonify({"path_prefix": toggle.path_prefix, "expires_at": toggle.expires_at}), 200
+
+
+@admin_bp.route("/profiling", methods=["DELETE"])
+@require_auth
+@require_role("admin")
+def disable_profiling():
+    """Clear the toggle; signed headers and sampling keep working."""
+    get_profile_store().set_toggle(None)
+    return "", 204
+
+
+@admin_bp.route("/profiling/tokens", methods=["POST"])
+@require_auth
+@require_role("admin")
+def create_profiling_token():
+    """
+    Mint a token for the ``X-Profile`` header, so a single request can ask
+    to be profiled.
+
+    Request body (optional):
+    {
+        "ttl_seconds": 300
+    }
+    """
+    try:
+        body = parse_body(CreateProfilingTokenRequest, optional=True)
+    except ValidationError as e:
+        return validation_error_response(e)
+
+    expires_at = int(time.time()) + body.ttl_seconds
+    return jsonify({
+        "header": PROFILE_HEADER,
+        "token": sign_profile_token(profile_token_secret(), expires_at),
+        "expires_at": expires_at,
+    }), 201
+
+
+@admin_bp.route("/profiles", methods=["GET"])
+@require_auth
+@require_role("admin")
+def list_profiles():
+    """Stored profiles, newest first."""
+    return jsonify({"data": get_profile_store().list()}), 200
+
+
+@admin_bp.route("/profiles/<profile_id>", methods=["GET"])
+@require_auth
+@require_role("admin")
+def get_profile(profile_id: str):
+    """
+    Download a profile.
+
+    ``?format=speedscope`` (default) opens in https://www.speedscope.app;
+    ``?format=collapsed`` feeds flamegraph.pl or similar tools.
+    """
+    fmt = request.args.get("format", "speedscope")
+    path = get_profile_store().path(profile_id, fmt)
+    if path is None:
+        return jsonify({"error": "Profile not found"}), 404
+
+    mimetype = "application/json" if fmt == "speedscope" else "text/plain"
+    return send_file(path.resolve(), mimetype=mimetype, as_attachment=True, download_name=path.name)
+
+
+@admin_bp.route("/pools", methods=["GET"])
+@require_auth
+@require_role("admin")
+def pool_metrics():
+    """Connection pool usage and checkout wait times per named engine."""
+    return jsonify({"pools": get_pool_metrics()}), 200
+
+
+@admin_bp.route("/audit/patient-access", methods=["GET"])
+@require_auth
+@require_role("admin")
+def list_patient_access_events():
+    """
+    Who accessed which patient, newest first.
+
+    Query parameters (all optional): ``patient_id``, ``actor_id``,
+    ``since`` and ``until`` (ISO 8601), ``limit`` (default 100) and
+    ``cursor`` (the ``next_cursor`` of the previous page).
+    """
+    try:
+        patient_id = request.args.get("patient_id")
+        actor_id = request.args.get("actor_id")
+        since = request.args.get("since")
+        until = request.args.get("until")
+        filters = {
+            "patient_id": UUID(patient_id) if patient_id else None,
+            "actor_id": UUID(actor_id) if actor_id else None,
+            "since": datetime.fromisoformat(since) if since else None,
+            "until": datetime.fromisoformat(until) if until else None,
+        }
+    except ValueError:
+        return jsonify({"error": "Invalid filter"}), 400
+
+    limit = request.args.get("limit", 100, type=int)
+    if not 0 < limit <= MAX_AUDIT_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_AUDIT_PAGE_SIZE}"}), 400
+
+    # Auditor queries can scan months of events: keep them off the OLTP pool
+    reader = SQLAlchemyAuditEventReader(get_session(REPORTING, read_only=True))
+    try:
+        page = reader.find_events(limit=limit, cursor=request.args.get("cursor"), **filters)
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    return jsonify({
+        "data": [
+            {
+                "id": str(event.id),
+                "actor_id": str(event.actor_id) if event.actor_id else None,
+                "patient_id": str(event.patient_id),
+                "action": event.action,
+                "route": event.route,
+                "request_id": event.request_id,
+                "ip_address": event.ip_address,
+                "occurred_at": event.occurred_at.isoformat(),
+            }
+            for event in page.events
+        ],
+        "next_cursor": page.next_cursor,
+    }), 200
@@ -1,14 +1,22 @@
 """Authentication Routes."""
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify, request
+from pydantic import ValidationError
 
 from src.application.use_cases.users.authenticate_user import (
     AuthenticateUserInput,
     AuthenticateUserUseCase,
 )
-from src.infrastructure.database.session import get_db_context
+from src.application.use_cases.users.logout_user import LogoutUserInput, LogoutUserUseCase
+from src.application.use_cases.users.refresh_tokens import RefreshTokensInput, RefreshTokensUseCase
+from src.infrastructure.database.unit_of_work import get_session
+from src.infrastructure.repositories.buffered_last_login_recorder import get_last_login_recorder
 from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
-from src.infrastructure.security.password_hasher import PasswordHasher
 from src.infrastructure.security.jwt_handler import JWTHandler
+from src.infrastructure.security.password_hasher import PasswordHasher
+from src.infrastructure.security.token_revocation import get_token_revocation_store
+from src.presentation.api.middlewares.auth_middleware import require_auth
+from src.presentation.api.v1.schemas.auth_schemas import LoginRequest, LogoutRequest, RefreshRequest
+from src.presentation.api.v1.schemas.base import parse_body, validation_error_response
 from src.shared.exceptions.application_exception import ApplicationException
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/v1/auth")
@@ -18,13 +26,13 @@ auth_bp = Blueprint("auth", __name__, url_prefix="/api/v1/auth")
 def login():
     """
     Authenticate user and return JWT tokens.
-    
+
     Request body:
     {
         "email": "user@example.com",
         "password": "password123"
     }
-    
+
     Response:
     {
         "access_token": "...",
@@ -34,86 +42,116 @@ def login():
     }
     """
     try:
-        data = request.get_json()
-        
-        if not data or "email" not in data or "password" not in data:
-            return jsonify({"error": "Email and password are required"}), 400
-        
-        input_dto = AuthenticateUserInput(
-            email=data["email"],
-            password=data["password"],
+        body = parse_body(LoginRequest)
+        input_dto = AuthenticateUserInput(email=body.email, password=body.password)
+
+        session = get_session()
+        user_repository = SQLAlchemyUserRepository(session)
+        password_hasher = PasswordHasher()
+        jwt_handler = JWTHandler()
+
+        use_case = AuthenticateUserUseCase(
+            user_repository,
+            password_hasher,
+            jwt_handler,
+            get_last_login_recorder(),
         )
-        
-        with get_db_context() as session:
-            user_repository = SQLAlchemyUserRepository(session)
-            password_hasher = PasswordHasher()
-            jwt_handler = JWTHandler()
-            
-            use_case = AuthenticateUserUseCase(
-                user_repository,
-                password_hasher,
-                jwt_handler,
-            )
-            
-            output = use_case.execute(input_dto)
-            
-            return jsonify({
-                "access_token": output.access_token,
-                "refresh_token": output.refresh_token,
-                "token_type": output.token_type,
-                "expires_in": output.expires_in,
-            }), 200
-    
+
+        output = use_case.execute(input_dto)
+
+        return jsonify({
+            "access_token": output.access_token,
+            "refresh_token": output.refresh_token,
+            "token_type": output.token_type,
+            "expires_in": output.expires_in,
+        }), 200
+
+    except ValidationError as e:
+        return validation_error_response(e)
     except ApplicationException as e:
         return jsonify({"error": e.message, "code": e.code}), 401
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
-    except Exception as e:
+    except Exception:
         return jsonify({"error": "Internal server error"}), 500
 
 
 @auth_bp.route("/refresh", methods=["POST"])
 def refresh():
     """
-    Refresh access token using refresh token.
-    
+    Rotate a refresh token: the token is spent and a new pair is issued.
+
     Request body:
     {
         "refresh_token": "..."
     }
-    
+
     Response:
     {
         "access_token": "...",
+        "refresh_token": "...",
         "token_type": "Bearer",
         "expires_in": 3600
     }
     """
     try:
-        data = request.get_json()
-        
-        if not data or "refresh_token" not in data:
-            return jsonify({"error": "Refresh token is required"}), 400
-        
-        jwt_handler = JWTHandler()
-        
-        # Decode and validate refresh token
-        payload = jwt_handler.decode_token(data["refresh_token"])
-        
-        if payload.get("type") != "refresh":
-            return jsonify({"error": "Invalid token type"}), 400
-        
-        # Create new access token
-        user_id = payload.get("sub")
-        access_token = jwt_handler.create_access_token(subject=user_id)
-        
+        body = parse_body(RefreshRequest)
+
+        session = get_session(read_only=True)
+        use_case = RefreshTokensUseCase(
+            SQLAlchemyUserRepository(session),
+            JWTHandler(),
+            get_token_revocation_store(),
+        )
+        output = use_case.execute(RefreshTokensInput(refresh_token=body.refresh_token))
+
         return jsonify({
-            "access_token": access_token,
-            "token_type": "Bearer",
-            "expires_in": jwt_handler.access_token_expires,
+            "access_token": output.access_token,
+            "refresh_token": output.refresh_token,
+            "token_type": output.token_type,
+            "expires_in": output.expires_in,
         }), 200
-    
+
+    except ValidationError as e:
+        return validation_error_response(e)
+    except ApplicationException as e:
+        return jsonify({"error": e.message, "code": e.code}), 401
     except ValueError as e:
         return jsonify({"error": str(e)}), 401
-    except Exception as e:
+    except Exception:
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@auth_bp.route("/logout", methods=["POST"])
+@require_auth
+def logout():
+    """
+    Revoke the access token used for this request and, if given, every
+    refresh token rotated from the same login.
+
+    Request body (optional):
+    {
+        "refresh_token": "..."
+    }
+    """
+    try:
+        body = parse_body(LogoutRequest, optional=True)
+
+        use_case = LogoutUserUseCase(JWTHandler(), get_token_revocation_store())
+        use_case.execute(LogoutUserInput(
+            user_id=request.user_id,
+            access_token_id=request.token_id,
+            access_token_expires_at=request.token_expires_at,
+            refresh_token=body.refresh_token,
+        ))
+
+        return "", 204
+
+    except ValidationError as e:
+        return validation_error_response(e)
+    except ApplicationException as e:
+        return jsonify({"error": e.message, "code": e.code}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
         return jsonify({"error": "Internal server error"}), 500
@@ -1,18 +1,27 @@
 """Patient Routes."""
-from flask import Blueprint, request, jsonify
 from uuid import UUID
-from datetime import datetime
 
+from flask import Blueprint, jsonify, request
+from pydantic import ValidationError
+
+from src.application.use_cases.patients.caregiver_dashboard import GetCaregiverDashboardUseCase
 from src.application.use_cases.patients.create_patient import (
     CreatePatientInput,
     CreatePatientUseCase,
 )
 from src.application.use_cases.patients.list_patients import ListPatientsByCaregiverUseCase
-from src.infrastructure.database.session import get_db_context
-from src.infrastructure.repositories.sqlalchemy_patient_repository import SQLAlchemyPatientRepository
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.unit_of_work import get_session
+from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+    SQLAlchemyPatientRepository,
+)
 from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
-from src.shared.exceptions.application_exception import ApplicationException
+from src.presentation.api.middlewares.audit import record_patient_access
 from src.presentation.api.middlewares.auth_middleware import require_auth
+from src.presentation.api.v1.presenters import present_caregiver_dashboard, present_patient_list
+from src.presentation.api.v1.schemas.base import parse_body, validation_error_response
+from src.presentation.api.v1.schemas.patient_schemas import CreatePatientRequest
+from src.shared.exceptions.application_exception import ApplicationException
 
 patient_bp = Blueprint("patients", __name__, url_prefix="/api/v1/patients")
 
@@ -26,35 +35,35 @@ def list_all_patients():
     try:
         page = request.args.get("page", 1, type=int)
         page_size = request.args.get("pageSize", 20, type=int)
-        
-        with get_db_context() as session:
-            from src.infrastructure.database.models.patient_model import PatientModel
-            patients = session.query(PatientModel).offset((page - 1) * page_size).limit(page_size).all()
-            total = session.query(PatientModel).count()
-            
-            return jsonify({
-                "data": [
-                    {
-                        "id": str(patient.id),
-                        "caregiver_id": str(patient.caregiver_id),
-                        "full_name": patient.full_name,
-                        "cpf": patient.cpf,
-                        "date_of_birth": patient.date_of_birth.isoformat(),
-                        "gender": patient.gender,
-                        "phone": patient.phone,
-                        "is_active": patient.is_active,
-                        "created_at": patient.created_at.isoformat(),
-                    }
-                    for patient in patients
-                ],
-                "pagination": {
-                    "total": total,
-                    "page": page,
-                    "pageSize": page_size,
-                    "totalPages": (total + page_size - 1) // page_size
+
+        session = get_session(read_only=True)
+        patients = session.query(PatientModel).offset((page - 1) * page_size).limit(page_size).all()
+        total = session.query(PatientModel).count()
+        record_patient_access(patient.id for patient in patients)
+
+        return jsonify({
+            "data": [
+                {
+                    "id": str(patient.id),
+                    "caregiver_id": str(patient.caregiver_id),
+                    "full_name": patient.full_name,
+                    "cpf": patient.cpf,
+                    "date_of_birth": patient.date_of_birth.isoformat(),
+                    "gender": patient.gender,
+                    "phone": patient.phone,
+                    "is_active": patient.is_active,
+                    "created_at": patient.created_at.isoformat(),
                 }
-            }), 200
-    
+                for patient in patients
+            ],
+            "pagination": {
+                "total": total,
+                "page": page,
+                "pageSize": page_size,
+                "totalPages": (total + page_size - 1) // page_size
+            }
+        }), 200
+
     except Exception as e:
         return jsonify({"error": "Internal server error", "message": str(e)}), 500
 
@@ -64,7 +73,7 @@ def list_all_patients():
 def create_patient():
     """
     Create a new patient.
-    
+
     Request body:
     {
         "caregiver_id": "...",
@@ -82,54 +91,32 @@ def create_patient():
     }
     """
     try:
-        data = request.get_json()
-        
-        required_fields = [
-            "caregiver_id", "full_name", "cpf", "date_of_birth", "gender",
-            "address", "phone", "emergency_contact", "emergency_phone"
-        ]
-        if not all(field in data for field in required_fields):
-            return jsonify({"error": "Missing required fields"}), 400
-        
-        # Parse date
-        date_of_birth = datetime.strptime(data["date_of_birth"], "%Y-%m-%d").date()
-        
-        input_dto = CreatePatientInput(
-            caregiver_id=UUID(data["caregiver_id"]),
-            full_name=data["full_name"],
-            cpf=data["cpf"],
-            date_of_birth=date_of_birth,
-            gender=data["gender"],
-            address=data["address"],
-            phone=data["phone"],
-            emergency_contact=data["emergency_contact"],
-            emergency_phone=data["emergency_phone"],
-            medical_conditions=data.get("medical_conditions"),
-            allergies=data.get("allergies"),
-            observations=data.get("observations"),
-        )
-        
-        with get_db_context() as session:
-            patient_repository = SQLAlchemyPatientRepository(session)
-            user_repository = SQLAlchemyUserRepository(session)
-            
-            use_case = CreatePatientUseCase(patient_repository, user_repository)
-            output = use_case.execute(input_dto)
-            
-            return jsonify({
-                "id": str(output.id),
-                "caregiver_id": str(output.caregiver_id),
-                "full_name": output.full_name,
-                "cpf": output.cpf,
-                "age": output.age,
-                "gender": output.gender,
-            }), 201
-    
+        body = parse_body(CreatePatientRequest)
+        input_dto = CreatePatientInput(**body.model_dump())
+
+        session = get_session()
+        patient_repository = SQLAlchemyPatientRepository(session)
+        user_repository = SQLAlchemyUserRepository(session)
+
+        use_case = CreatePatientUseCase(patient_repository, user_repository)
+        output = use_case.execute(input_dto)
+
+        return jsonify({
+            "id": str(output.id),
+            "caregiver_id": str(output.caregiver_id),
+            "full_name": output.full_name,
+            "cpf": output.cpf,
+            "age": output.age,
+            "gender": output.gender,
+        }), 201
+
+    except ValidationError as e:
+        return validation_error_response(e)
     except ApplicationException as e:
         return jsonify({"error": e.message, "code": e.code}), 400
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
-    except Exception as e:
+    except Exception:
         return jsonify({"error": "Internal server error"}), 500
 
 
@@ -138,7 +125,7 @@ def create_patient():
 def list_patients_by_caregiver(caregiver_id: str):
     """
     List all patients for a specific caregiver.
-    
+
     Response:
     {
         "patients": [
@@ -155,27 +142,63 @@ def list_patients_by_caregiver(caregiver_id: str):
     """
     try:
         caregiver_uuid = UUID(caregiver_id)
-        
-        with get_db_context() as session:
-            patient_repository = SQLAlchemyPatientRepository(session)
-            use_case = ListPatientsByCaregiverUseCase(patient_repository)
-            output = use_case.execute(caregiver_uuid)
-            
-            return jsonify({
-                "patients": [
-                    {
-                        "id": str(p.id),
-                        "full_name": p.full_name,
-                        "age": p.age,
-                        "gender": p.gender,
-                        "is_active": p.is_active,
-                    }
-                    for p in output.patients
+
+        session = get_session(read_only=True)
+        patient_repository = SQLAlchemyPatientRepository(session)
+        use_case = ListPatientsByCaregiverUseCase(patient_repository)
+        output = use_case.execute(caregiver_uuid)
+        record_patient_access(p.id for p in output.patients)
+
+        return jsonify(present_patient_list(output)), 200
+
+    except ValueError:
+        return jsonify({"error": "Invalid caregiver ID format"}), 400
+    except Exception:
+        return jsonify({"error": "Internal server error"}), 500
+
+
+@patient_bp.route("/caregiver/<caregiver_id>/dashboard", methods=["GET"])
+@require_auth
+def caregiver_dashboard(caregiver_id: str):
+    """
+    Dashboard for a caregiver: each patient with active medication count,
+    today's doses and next appointment.
+
+    Response:
+    {
+        "patients": [
+            {
+                "id": "...",
+                "full_name": "Maria Silva",
+                "age": 74,
+                "active_medication_count": 2,
+                "todays_doses": [
+                    {"medication_id": "...", "medication_name": "Losartana",
+                     "dosage": "50mg", "scheduled_time": "2024-05-01T08:00:00"}
                 ],
-                "total": output.total,
-            }), 200
-    
+                "next_appointment": {
+                    "id": "...", "title": "Cardiologista",
+                    "appointment_date": "2024-05-03T14:00:00",
+                    "location": "Clínica", "doctor_name": "Dr. Souza"
+                }
+            }
+        ],
+        "total": 1
+    }
+    """
+    try:
+        caregiver_uuid = UUID(caregiver_id)
     except ValueError:
         return jsonify({"error": "Invalid caregiver ID format"}), 400
-    except Exception as e:
+
+    try:
+        session = get_session(read_only=True)
+        patient_repository = SQLAlchemyPatientRepository(session)
+        use_case = GetCaregiverDashboardUseCase(patient_repository)
+        output = use_case.execute(caregiver_uuid)
+        record_patient_access(p.id for p in output.patients)
+
+        return jsonify(present_caregiver_dashboard(output)), 200
+
+    except Exception:
         return jsonify({"error": "Internal server error"}), 500
@@ -1,10 +1,21 @@
 """Reports Routes."""
-from flask import Blueprint, request, jsonify
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from src.infrastructure.database.session import get_db_context
+from flask import Blueprint, jsonify
+
+from src.config import get_settings
+from src.infrastructure.database.models.appointment_model import AppointmentModel
+from src.infrastructure.database.models.medication_model import MedicationModel
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.report_executor import (
+    ReportDeadlineError,
+    ReportResult,
+    get_report_executor,
+)
 from src.presentation.api.middlewares.auth_middleware import require_auth
 
+settings = get_settings()
+
 reports_bp = Blueprint("reports", __name__, url_prefix="/api/v1/reports")
 
 
@@ -34,7 +45,7 @@ def list_reports():
             "endpoint": "/api/v1/reports/appointments"
         }
     ]
-    
+
     return jsonify({
         "data": reports,
         "pagination": {
@@ -46,6 +57,19 @@ def list_reports():
     }), 200
 
 
+def _meta(result: ReportResult) -> dict:
+    """Per-query timings; the report took about as long as the slowest one."""
+    return {"elapsed_ms": result.elapsed_ms, "queries_ms": result.timings_ms}
+
+
+def _deadline_response(e: ReportDeadlineError):
+    return jsonify({
+        "error": "Report deadline exceeded",
+        "code": "REPORT_TIMEOUT",
+        "meta": {"deadline_s": e.deadline_s, "queries_ms": e.timings_ms},
+    }), 504
+
+
 @reports_bp.route("/summary", methods=["GET"])
 @require_auth
 def get_summary():
@@ -53,42 +77,51 @@ def get_summary():
     Get summary statistics about patients, medications, and appointments.
     """
     try:
-        with get_db_context() as session:
-            from src.infrastructure.database.models.patient_model import PatientModel
-            from src.infrastructure.database.models.medication_model import MedicationModel
-            from src.infrastructure.database.models.appointment_model import AppointmentModel
-            
-            # Count totals
-            total_patients = session.query(PatientModel).count()
-            active_patients = session.query(PatientModel).filter(PatientModel.is_active == True).count()
-            total_medications = session.query(MedicationModel).count()
-            active_medications = session.query(MedicationModel).filter(MedicationModel.is_active == True).count()
-            
-            # Count appointments
-            total_appointments = session.query(AppointmentModel).count()
-            upcoming_appointments = session.query(AppointmentModel).filter(
-                AppointmentModel.appointment_date >= datetime.now()
-            ).count()
-            
-            return jsonify({
-                "patients": {
-                    "total": total_patients,
-                    "active": active_patients,
-                    "inactive": total_patients - active_patients
-                },
-                "medications": {
-                    "total": total_medications,
-                    "active": active_medications,
-                    "inactive": total_medications - active_medications
-                },
-                "appointments": {
-                    "total": total_appointments,
-                    "upcoming": upcoming_appointments,
-                    "completed": total_appointments - upcoming_appointments
-                },
-                "generated_at": datetime.now().isoformat()
-            }), 200
-    
+        now = datetime.now()
+        result = get_report_executor().run({
+            "total_patients": lambda session: session.query(PatientModel).count(),
+            "active_patients": lambda session: session.query(PatientModel).filter(
+                PatientModel.is_active.is_(True)
+            ).count(),
+            "total_medications": lambda session: session.query(MedicationModel).count(),
+            "active_medications": lambda session: session.query(MedicationModel).filter(
+                MedicationModel.is_active.is_(True)
+            ).count(),
+            "total_appointments": lambda session: session.query(AppointmentModel).count(),
+            "upcoming_appointments": lambda session: session.query(AppointmentModel).filter(
+                AppointmentModel.appointment_date >= now
+            ).count(),
+        }, deadline_s=settings.REPORT_DEADLINE_SECONDS)
+        counts = result.values
+        total_patients = counts["total_patients"]
+        active_patients = counts["active_patients"]
+        total_medications = counts["total_medications"]
+        active_medications = counts["active_medications"]
+        total_appointments = counts["total_appointments"]
+        upcoming_appointments = counts["upcoming_appointments"]
+
+        return jsonify({
+            "patients": {
+                "total": total_patients,
+                "active": active_patients,
+                "inactive": total_patients - active_patients
+            },
+            "medications": {
+                "total": total_medications,
+                "active": active_medications,
+                "inactive": total_medications - active_medications
+            },
+            "appointments": {
+                "total": total_appointments,
+                "upcoming": upcoming_appointments,
+                "completed": total_appointments - upcoming_appointments
+            },
+            "generated_at": datetime.now().isoformat(),
+            "meta": _meta(result),
+        }), 200
+
+    except ReportDeadlineError as e:
+        return _deadline_response(e)
     except Exception as e:
         return jsonify({"error": "Internal server error", "message": str(e)}), 500
 
@@ -102,33 +135,33 @@ def get_summary_by_period(start_date: str, end_date: str):
     try:
         start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
         end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-        
-        with get_db_context() as session:
-            from src.infrastructure.database.models.patient_model import PatientModel
-            from src.infrastructure.database.models.appointment_model import AppointmentModel
-            
+
+        result = get_report_executor().run({
             # Patients created in period
-            patients_created = session.query(PatientModel).filter(
+            "patients_created": lambda session: session.query(PatientModel).filter(
                 PatientModel.created_at >= start,
                 PatientModel.created_at <= end
-            ).count()
-            
+            ).count(),
             # Appointments in period
-            appointments_period = session.query(AppointmentModel).filter(
+            "appointments": lambda session: session.query(AppointmentModel).filter(
                 AppointmentModel.appointment_date >= start,
                 AppointmentModel.appointment_date <= end
-            ).count()
-            
-            return jsonify({
-                "period": {
-                    "start": start_date,
-                    "end": end_date
-                },
-                "patients_created": patients_created,
-                "appointments": appointments_period,
-                "generated_at": datetime.now().isoformat()
-            }), 200
-    
+            ).count(),
+        }, deadline_s=settings.REPORT_DEADLINE_SECONDS)
+
+        return jsonify({
+            "period": {
+                "start": start_date,
+                "end": end_date
+            },
+            "patients_created": result.values["patients_created"],
+            "appointments": result.values["appointments"],
+            "generated_at": datetime.now().isoformat(),
+            "meta": _meta(result),
+        }), 200
+
+    except ReportDeadlineError as e:
+        return _deadline_response(e)
     except ValueError as e:
         return jsonify({"error": "Invalid date format", "message": str(e)}), 400
     except Exception as e:
@@ -0,0 +1,17 @@
+"""Admin request schemas."""
+from pydantic import Field
+
+from src.presentation.api.v1.schemas.base import RequestSchema
+
+MAX_PROFILING_SECONDS = 3600
+
+
+class EnableProfilingRequest(RequestSchema):
+    """Body of ``PUT /api/v1/admin/profiling``; the body itself is optional."""
+    path_prefix: str = Field(default="/", pattern=r"^/")
+    duration_seconds: float = Field(default=300, gt=0, le=MAX_PROFILING_SECONDS)
+
+
+class CreateProfilingTokenRequest(RequestSchema):
+    """Body of ``POST /api/v1/admin/profiling/tokens``; the body itself is optional."""
+    ttl_seconds: int = Field(default=300, gt=0, le=MAX_PROFILING_SECONDS, strict=True)
@@ -0,0 +1,19 @@
+"""Authentication request schemas."""
+
+from src.presentation.api.v1.schemas.base import NonEmptyStr, RequestSchema
+
+
+class LoginRequest(RequestSchema):
+    """Body of ``POST /api/v1/auth/login``."""
+    email: NonEmptyStr
+    password: NonEmptyStr
+
+
+class RefreshRequest(RequestSchema):
+    """Body of ``POST /api/v1/auth/refresh``."""
+    refresh_token: NonEmptyStr
+
+
+class LogoutRequest(RequestSchema):
+    """Body of ``POST /api/v1/auth/logout``; the body itself is optional."""
+    refresh_token: str | None = None
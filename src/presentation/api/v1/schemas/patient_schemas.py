@@ -0,0 +1,21 @@
+"""Patient request schemas."""
+from datetime import date
+from uuid import UUID
+
+from src.presentation.api.v1.schemas.base import NonEmptyStr, RequestSchema
+
+
+class CreatePatientRequest(RequestSchema):
+    """Body of ``POST /api/v1/patients/``."""
+    caregiver_id: UUID
+    full_name: NonEmptyStr
+    cpf: NonEmptyStr  # check digits validated by the CPF value object
+    date_of_birth: date  # YYYY-MM-DD
+    gender: NonEmptyStr
+    address: NonEmptyStr
+    phone: NonEmptyStr
+    emergency_contact: NonEmptyStr
+    emergency_phone: NonEmptyStr
+    medical_conditions: str | None = None
+    allergies: str | None = None
+    observations: str | None = None
@@ -0,0 +1,12 @@
+"""User request schemas."""
+from typing import Literal
+
+from src.presentation.api.v1.schemas.base import NonEmptyStr, RequestSchema
+
+
+class CreateUserRequest(RequestSchema):
+    """Body of ``POST /api/v1/users/``."""
+    email: NonEmptyStr  # format validated by the Email value object
+    password: NonEmptyStr
+    full_name: NonEmptyStr
+    role: Literal["caregiver", "family", "admin"]
@@ -0,0 +1 @@
+"""ASGI package - async read API."""
@@ -0,0 +1,207 @@
+"""
+Minimal ASGI application: routing, JSON responses, authentication,
+request logging and per-request query tracing for the async read API.
+"""
+import asyncio
+import json
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+from src.config import get_settings
+from src.infrastructure.database.async_session import dispose_async_engine
+from src.infrastructure.database.n_plus_one import end_detection, start_detection
+from src.infrastructure.database.query_tracing import end_trace, start_trace
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.infrastructure.security.token_revocation import get_token_revocation_store
+from src.presentation.api.middlewares.query_tracing import server_timing
+from src.shared.utils.logger import (
+    app_logger,
+    bind_log_context,
+    reset_log_context,
+    setup_logger,
+    update_log_context,
+)
+
+settings = get_settings()
+access_logger = setup_logger("cuidar_plus.access")
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+_PATH_PARAM = re.compile(r"<(\w+)>")
+
+
+@dataclass
+class Request:
+    """The parts of an ASGI HTTP request the handlers use."""
+    method: str
+    path: str
+    headers: dict[str, str]
+    query: dict[str, list[str]]
+    client: str | None = None
+    route: str | None = None
+    path_params: dict[str, str] = field(default_factory=dict)
+    request_id: str = ""
+    user_id: str | None = None
+    user_role: str | None = None
+
+    @classmethod
+    def from_scope(cls, scope: dict[str, Any]) -> "Request":
+        return cls(
+            method=scope["method"],
+            path=scope["path"],
+            headers={
+                name.decode("latin-1").lower(): value.decode("latin-1")
+                for name, value in scope["headers"]
+            },
+            query=parse_qs(scope.get("query_string", b"").decode("latin-1")),
+            client=scope["client"][0] if scope.get("client") else None,
+        )
+
+
+@dataclass
+class Response:
+    status: int
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def json_response(body: Any, status: int = 200) -> Response:
+    return Response(status, json.dumps(body).encode(), {"content-type": "application/json"})
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+def require_auth(handler: Handler) -> Handler:
+    """
+    Async counterpart of the WSGI ``require_auth``: same checks, same
+    error bodies. The revocation check may call Redis, so it runs in a
+    worker thread.
+    """
+    @wraps(handler)
+    async def authenticated(request: Request) -> Response:
+        auth_header = request.headers.get("authorization")
+        if not auth_header:
+            return json_response({"error": "Authorization header is missing"}, 401)
+
+        parts = auth_header.split()
+        if len(parts) != 2 or parts[0].lower() != "bearer":
+            return json_response({"error": "Invalid authorization header format"}, 401)
+
+        try:
+            payload = JWTHandler().decode_token(parts[1])
+        except ValueError as e:
+            return json_response({"error": str(e)}, 401)
+
+        if payload.get("type") != "access":
+            return json_response({"error": "Invalid token type"}, 401)
+
+        token_id = payload.get("jti")
+        if token_id and await asyncio.to_thread(get_token_revocation_store().is_revoked, token_id):
+            return json_response({"error": "Token has been revoked"}, 401)
+
+        request.user_id = payload.get("sub")
+        request.user_role = payload.get("role")
+        update_log_context(user_id=request.user_id)
+        return await handler(request)
+
+    return authenticated
+
+
+class AsyncApp:
+    """
+    Routes ``GET`` requests to async handlers.
+
+    Paths use the Flask placeholder syntax (``/users/<user_id>``). On
+    lifespan shutdown the async engine's pool is closed.
+    """
+
+    def __init__(self) -> None:
+        self._routes: list[tuple[re.Pattern[str], str, Handler]] = []
+
+    def get(self, rule: str) -> Callable[[Handler], Handler]:
+        pattern = re.compile("^" + _PATH_PARAM.sub(r"(?P<\1>[^/]+)", rule) + "$")
+
+        def register(handler: Handler) -> Handler:
+            self._routes.append((pattern, rule, handler))
+            return handler
+        return register
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            response = await self._handle(Request.from_scope(scope))
+            await send({
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": [
+                    (name.encode(), value.encode()) for name, value in response.headers.items()
+                ],
+            })
+            await send({"type": "http.response.body", "body": response.body})
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await dispose_async_engine()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, request: Request) -> Response:
+        started = time.perf_counter()
+        request_id = request.headers.get(REQUEST_ID_HEADER.lower(), "")
+        request.request_id = request_id if _VALID_REQUEST_ID.match(request_id) else uuid4().hex
+
+        handler, path_allowed = None, False
+        for pattern, rule, candidate in self._routes:
+            match = pattern.match(request.path)
+            if match:
+                path_allowed = True
+                if request.method == "GET":
+                    handler, request.route, request.path_params = candidate, rule, match.groupdict()
+                    break
+
+        token = bind_log_context(
+            request_id=request.request_id,
+            method=request.method,
+            route=request.route or request.path,
+        )
+        # Same per-request scopes as the WSGI middlewares; run_sync keeps the context
+        trace_token = start_trace() if settings.QUERY_TRACING_ENABLED else None
+        detection_token = start_detection() if settings.QUERY_N_PLUS_ONE_MODE != "off" else None
+        try:
+            if handler is not None:
+                response = await handler(request)
+            elif path_allowed:
+                response = json_response({"error": "Method not allowed"}, 405)
+            else:
+                response = json_response({"error": "Not found"}, 404)
+        except Exception:
+            app_logger.exception("Unhandled error in async handler")
+            response = json_response({"error": "Internal server error"}, 500)
+        finally:
+            if detection_token is not None:
+                end_detection(detection_token)
+            stats = end_trace(trace_token) if trace_token is not None else None
+
+        if stats is not None:
+            response.headers["Server-Timing"] = server_timing(stats)
+        response.headers[REQUEST_ID_HEADER] = request.request_id
+        if settings.LOG_REQUESTS:
+            latency_ms = (time.perf_counter() - started) * 1000
+            access_logger.info(
+                f"{request.method} {request.path} {response.status} {latency_ms:.1f}ms",
+                extra={"status": response.status, "latency_ms": round(latency_ms, 2)},
+            )
+        reset_log_context(token)
+        return response
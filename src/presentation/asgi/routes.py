@@ -0,0 +1,103 @@
+"""Async read routes - the same endpoints and bodies as the WSGI API."""
+from collections.abc import Iterable
+from uuid import UUID
+
+from src.application.interfaces.audit_trail import PatientAccessEvent
+from src.application.use_cases.patients.caregiver_dashboard import GetCaregiverDashboardUseCase
+from src.application.use_cases.patients.list_patients import ListPatientsByCaregiverUseCase
+from src.application.use_cases.users.get_user_by_id import GetUserByIdUseCase
+from src.config import get_settings
+from src.infrastructure.audit.buffered_audit_trail import get_audit_trail
+from src.infrastructure.database.async_session import async_read_session
+from src.infrastructure.repositories.async_repositories import AsyncRepositories
+from src.presentation.api.v1.presenters import (
+    present_caregiver_dashboard,
+    present_patient_list,
+    present_user,
+)
+from src.presentation.asgi.app import AsyncApp, Request, Response, json_response, require_auth
+from src.shared.exceptions.application_exception import ApplicationException
+
+settings = get_settings()
+
+
+def _record_patient_access(request: Request, patient_ids: Iterable[UUID]) -> None:
+    """Same audit events as the WSGI ``record_patient_access``; buffered, no I/O here."""
+    if not settings.AUDIT_ENABLED:
+        return
+    try:
+        actor_id = UUID(request.user_id)
+    except (TypeError, ValueError):
+        actor_id = None
+    events = [
+        PatientAccessEvent(
+            actor_id=actor_id,
+            patient_id=patient_id,
+            action="read",
+            route=request.route or request.path,
+            request_id=request.request_id,
+            ip_address=request.client,
+        )
+        for patient_id in patient_ids
+    ]
+    if events:
+        get_audit_trail().record(events)
+
+
+def register_read_routes(app: AsyncApp) -> None:
+    """Register the async read endpoints."""
+
+    @app.get("/health")
+    async def health_check(request: Request) -> Response:
+        return json_response({
+            "status": "healthy",
+            "service": "cuidar-plus-backend",
+            "version": settings.API_VERSION,
+            "mode": "asgi",
+        })
+
+    @app.get("/api/v1/users/<user_id>")
+    async def get_user(request: Request) -> Response:
+        try:
+            user_uuid = UUID(request.path_params["user_id"])
+        except ValueError:
+            return json_response({"error": "Invalid user ID format"}, 400)
+
+        try:
+            async with async_read_session() as session:
+                output = await AsyncRepositories(session).run(
+                    lambda repos: GetUserByIdUseCase(repos.users).execute(user_uuid)
+                )
+        except ApplicationException as e:
+            return json_response({"error": e.message, "code": e.code}, 404)
+        return json_response(present_user(output))
+
+    @app.get("/api/v1/patients/caregiver/<caregiver_id>")
+    @require_auth
+    async def list_patients_by_caregiver(request: Request) -> Response:
+        try:
+            caregiver_uuid = UUID(request.path_params["caregiver_id"])
+        except ValueError:
+            return json_response({"error": "Invalid caregiver ID format"}, 400)
+
+        async with async_read_session() as session:
+            output = await AsyncRepositories(session).run(
+                lambda repos: ListPatientsByCaregiverUseCase(repos.patients).execute(caregiver_uuid)
+            )
+        _record_patient_access(request, (p.id for p in output.patients))
+        return json_response(present_patient_list(output))
+
+    @app.get("/api/v1/patients/caregiver/<caregiver_id>/dashboard")
+    @require_auth
+    async def caregiver_dashboard(request: Request) -> Response:
+        try:
+            caregiver_uuid = UUID(request.path_params["caregiver_id"])
+        except ValueError:
+            return json_response({"error": "Invalid caregiver ID format"}, 400)
+
+        async with async_read_session() as session:
+            output = await AsyncRepositories(session).run(
+                lambda repos: GetCaregiverDashboardUseCase(repos.patients).execute(caregiver_uuid)
+            )
+        _record_patient_access(request, (p.id for p in output.patients))
+        return json_response(present_caregiver_dashboard(output))
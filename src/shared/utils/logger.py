@@ -1,49 +1,229 @@
-"""Logger Utility - Structured logging configuration."""
+"""
+Logger Utility - Structured logging configuration.
+
+Loggers set up here never write from the calling thread. Records go
+through a bounded queue to a background ``QueueListener`` that owns the
+stdout handler. When the queue is full, the record is dropped and counted
+(``log_records_dropped_total``), so a slow stdout can never stall a request.
+
+Records carry the fields bound with ``bind_log_context`` (request ID,
+route, user ID, ...) and, with ``LOG_FORMAT=json``, are written as one JSON
+object per line. ``LOG_SAMPLING`` keeps only a fraction of the DEBUG/INFO
+records of noisy loggers, e.g. ``cuidar_plus.sql=0.1``.
+"""
+import atexit
+import json
 import logging
+import os
+import queue
+import random
 import sys
-from typing import Optional
+import threading
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 from src.config import get_settings
 
 settings = get_settings()
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+TEXT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = {
+    *vars(logging.LogRecord("", 0, "", 0, "", None, None)), "message", "asctime"
+}
+
+_log_context: ContextVar[dict[str, Any] | None] = ContextVar("log_context", default=None)
+
+
+def bind_log_context(**fields: Any) -> Token:
+    """Attach ``fields`` to every record logged in this context, until ``reset_log_context``."""
+    return _log_context.set({**(_log_context.get() or {}), **fields})
+
+
+def update_log_context(**fields: Any) -> None:
+    """Add fields to the current request's log context (e.g. the user, once authenticated)."""
+    context = _log_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def reset_log_context(token: Token) -> None:
+    _log_context.reset(token)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: timestamp, level, logger, message, context and extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value) for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_")
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def parse_sampling(spec: str) -> dict[str, float]:
+    """``"a=0.1,b.c=0.5"`` -> ``{"a": 0.1, "b.c": 0.5}``."""
+    rates = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, _, rate = item.partition("=")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of the records below WARNING for the configured
+    loggers (and their children). Warnings and errors always pass.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self._rate_for = lru_cache(maxsize=256)(self._lookup)
+
+    def _lookup(self, name: str) -> float:
+        while True:
+            if name in self.rates:
+                return self.rates[name]
+            if "." not in name:
+                return 1.0
+            name = name.rsplit(".", 1)[0]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate_for(record.name)
+        return rate >= 1 or random.random() < rate
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Hand records to the listener without blocking.
+
+    The log context is copied onto the record here, in the logging thread,
+    because the listener thread does not share its context variables.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve message and traceback now: args may be mutable, exc_info holds frames
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        for key, value in (_log_context.get() or {}).items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.LOG_FORMAT == "json":
+        return JsonFormatter()
+    return logging.Formatter(fmt=TEXT_FORMAT, datefmt=TEXT_DATE_FORMAT)
+
+
+class _Pipeline:
+    """The queue, its handler and the listener thread shared by all loggers."""
+
+    def __init__(self) -> None:
+        self.output = logging.StreamHandler(sys.stdout)
+        self.output.setFormatter(_build_formatter())
+        self.handler = ContextQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+        self.handler.addFilter(SamplingFilter(parse_sampling(settings.LOG_SAMPLING)))
+        self.listener: QueueListener | None = None
+        self.start()
+
+    def start(self) -> None:
+        self.listener = QueueListener(self.handler.queue, self.output, respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Write out what is queued and stop the listener thread."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def after_fork(self) -> None:
+        # The listener thread does not survive fork; the child needs its own
+        # (and a fresh queue: the old one's lock may have been held mid-fork)
+        self.handler.queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        self.start()
 
-def setup_logger(name: Optional[str] = None) -> logging.Logger:
+
+_pipeline: _Pipeline | None = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline() -> _Pipeline:
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = _Pipeline()
+            atexit.register(_pipeline.stop)
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(after_in_child=_pipeline.after_fork)
+        return _pipeline
+
+
+def setup_logger(name: str | None = None) -> logging.Logger:
     """
     Set up a logger with structured formatting.
-    
+
     Args:
         name: Logger name (typically __name__ from calling module)
-    
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name or __name__)
-    
+
     # Set log level from environment
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
     logger.setLevel(log_level)
-    
+
     # Avoid duplicate handlers
     if logger.handlers:
         return logger
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(console_handler)
-    
+
+    # Records are written by the pipeline's background thread
+    logger.addHandler(get_log_pipeline().handler)
+
     # Prevent propagation to root logger
     logger.propagate = False
-    
+
     return logger
 
 
@@ -1,9 +1,18 @@
 """Test configuration and fixtures."""
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker
 
+from src.infrastructure.database.n_plus_one import end_detection, start_detection, watch_engine
 from src.infrastructure.database.session import Base
+from src.infrastructure.rate_limiting.limiter import RateLimiter
+from src.infrastructure.rate_limiting.token_bucket import InMemoryTokenBuckets
+from src.infrastructure.security.token_revocation import InMemoryTokenRevocationStore
+
+# Same statement shape allowed per test before NPlusOneQueryError is raised
+N_PLUS_ONE_THRESHOLD = 5
 
 
 @pytest.fixture(scope="session")
@@ -11,6 +20,7 @@ def test_engine():
     """Create a test database engine."""
     # Use in-memory SQLite for tests
     engine = create_engine("sqlite:///:memory:", echo=False)
+    watch_engine(engine)
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
@@ -19,9 +29,9 @@ def test_engine():
 @pytest.fixture(scope="function")
 def test_session(test_engine):
     """Create a test database session."""
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-    session = TestSessionLocal()
-    
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+    session = session_factory()
+
     try:
         yield session
         session.commit()
@@ -32,6 +42,62 @@ def test_session(test_engine):
         session.close()
 
 
+@pytest.fixture(autouse=True)
+def n_plus_one_guard():
+    """Fail any test (including route tests) that repeats a statement shape too often."""
+    token = start_detection(threshold=N_PLUS_ONE_THRESHOLD, mode="raise")
+    yield
+    end_detection(token)
+
+
+@pytest.fixture(autouse=True)
+def token_revocation_store(mocker):
+    """Keep require_auth and token rotation off Redis in tests."""
+    store = InMemoryTokenRevocationStore()
+    for module in (
+        "src.presentation.api.middlewares.auth_middleware",
+        "src.presentation.api.v1.routes.auth_routes",
+        "src.presentation.asgi.app",
+    ):
+        mocker.patch(f"{module}.get_token_revocation_store", return_value=store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter(mocker):
+    """Per-test in-process buckets instead of Redis."""
+    limiter = RateLimiter(None, InMemoryTokenBuckets())
+    mocker.patch(
+        "src.presentation.api.middlewares.rate_limit.get_rate_limiter", return_value=limiter
+    )
+    return limiter
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert that a block of code stays within a query budget.
+
+    Usage:
+        def test_route(client, query_budget):
+            with query_budget(2):
+                client.get("/api/v1/patients/")
+    """
+    @contextmanager
+    def budget(max_queries: int, threshold: int = N_PLUS_ONE_THRESHOLD):
+        token = start_detection(threshold=threshold, mode="raise")
+        try:
+            yield
+        finally:
+            counter = end_detection(token)
+        assert counter.total <= max_queries, (
+            f"Query budget exceeded: {counter.total} > {max_queries}\n"
+            + "\n".join(f"{count}x {shape}" for shape, count in counter.shapes.most_common())
+        )
+
+    return budget
+
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for tests."""
@@ -48,7 +114,7 @@ def sample_patient_data():
     """Sample patient data for tests."""
     from datetime import date
     from uuid import uuid4
-    
+
     return {
         "caregiver_id": uuid4(),
         "full_name": "Maria Silva",
@@ -1,7 +1,7 @@
+import os
+import sys
 import unittest
 from unittest.mock import MagicMock, patch
-import sys
-import os
 
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -13,8 +13,8 @@ os.environ['DATABASE_URL'] = 'sqlite:///:memory:'
 
 # Patch create_engine to avoid SQLite errors with pool params
 with patch('sqlalchemy.create_engine') as mock_create_engine:
-    from src.main import create_app
     from src.infrastructure.security.jwt_handler import JWTHandler
+    from src.main import create_app
 
 class TestSecurityFix(unittest.TestCase):
     def setUp(self):
@@ -24,8 +24,8 @@ class TestSecurityFix(unittest.TestCase):
         self.valid_token = self.jwt_handler.create_access_token(subject="user123")
         self.headers = {"Authorization": f"Bearer {self.valid_token}"}
 
-    @patch('src.presentation.api.v1.routes.patient_routes.get_db_context')
-    def test_patients_endpoints_protected(self, mock_get_db_context):
+    @patch('src.presentation.api.v1.routes.patient_routes.get_session')
+    def test_patients_endpoints_protected(self, mock_get_session):
         """Test that patient endpoints are protected (401 without token)."""
         endpoints = [
             ('GET', '/api/v1/patients/'),
@@ -34,16 +34,16 @@ class TestSecurityFix(unittest.TestCase):
         for method, url in endpoints:
             with self.subTest(method=method, url=url):
                 response = self.client.get(url)
-                self.assertEqual(response.status_code, 401, f"{method} {url} should return 401 without token")
+                self.assertEqual(
+                    response.status_code, 401, f"{method} {url} should return 401 without token"
+                )
 
-    @patch('src.presentation.api.v1.routes.patient_routes.get_db_context')
-    def test_patients_endpoints_accessible_with_token(self, mock_get_db_context):
+    @patch('src.presentation.api.v1.routes.patient_routes.get_session')
+    def test_patients_endpoints_accessible_with_token(self, mock_get_session):
         """Test that patient endpoints are accessible with valid token."""
         # Setup mock DB
         mock_session = MagicMock()
-        mock_ctx = MagicMock()
-        mock_ctx.__enter__.return_value = mock_session
-        mock_get_db_context.return_value = mock_ctx
+        mock_get_session.return_value = mock_session
 
         # Mock query results to avoid 500 error
         mock_query = mock_session.query.return_value
@@ -55,8 +55,8 @@ class TestSecurityFix(unittest.TestCase):
         # Should be 200 OK
         self.assertEqual(response.status_code, 200, "Should be accessible with valid token")
 
-        # Should have called get_db_context
-        mock_get_db_context.assert_called()
+        # Should have asked for the request session
+        mock_get_session.assert_called()
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+from datetime import date, datetime, time
+from unittest.mock import Mock
+from uuid import uuid4
+
+from src.application.use_cases.patients import caregiver_dashboard
+from src.application.use_cases.patients.caregiver_dashboard import GetCaregiverDashboardUseCase
+from src.domain.entities.appointment import Appointment
+from src.domain.entities.medication import Medication
+from src.domain.entities.patient import Patient
+from src.domain.repositories.patient_repository import PatientCareSnapshot
+from src.domain.value_objects.cpf import CPF
+
+
+def make_patient(caregiver_id):
+    return Patient(
+        id=uuid4(),
+        caregiver_id=caregiver_id,
+        full_name="John Doe",
+        cpf=CPF("52998224725"),
+        date_of_birth=date(1950, 1, 1),
+        gender="M",
+        address="Addr",
+        phone="123",
+        emergency_contact="EC",
+        emergency_phone="123",
+    )
+
+
+def make_medication(patient_id, name, schedule_times, start_date):
+    return Medication(
+        id=uuid4(),
+        patient_id=patient_id,
+        name=name,
+        dosage="10mg",
+        frequency="daily",
+        schedule_times=schedule_times,
+        start_date=start_date,
+    )
+
+
+class TestGetCaregiverDashboardUseCase:
+    def test_should_build_dashboard_from_snapshots(self):
+        # Arrange
+        mock_repository = Mock()
+        use_case = GetCaregiverDashboardUseCase(mock_repository)
+        caregiver_id = uuid4()
+        now = datetime(2024, 5, 1, 9, 0)
+
+        patient = make_patient(caregiver_id)
+        appointment = Appointment(
+            id=uuid4(),
+            patient_id=patient.id,
+            title="Cardiologist",
+            description=None,
+            appointment_date=datetime(2024, 5, 3, 14, 0),
+            duration_minutes=30,
+            location="Clinic",
+        )
+        mock_repository.find_care_snapshots_by_caregiver.return_value = [
+            PatientCareSnapshot(
+                patient=patient,
+                active_medications=[
+                    make_medication(patient.id, "Evening", [time(20, 0)], datetime(2024, 4, 1)),
+                    make_medication(patient.id, "Morning", [time(8, 0)], datetime(2024, 4, 1)),
+                    # Starts tomorrow: active, but no dose today
+                    make_medication(patient.id, "Future", [time(12, 0)], datetime(2024, 5, 2)),
+                ],
+                next_appointment=appointment,
+            ),
+            PatientCareSnapshot(patient=make_patient(caregiver_id)),
+        ]
+
+        # Act
+        output = use_case.execute(caregiver_id, now)
+
+        # Assert
+        assert output.total == 2
+        item = output.patients[0]
+        assert item.age == 74
+        assert item.active_medication_count == 3
+        assert [dose.medication_name for dose in item.todays_doses] == ["Morning", "Evening"]
+        assert item.todays_doses[0].scheduled_time == datetime(2024, 5, 1, 8, 0)
+        assert item.next_appointment.title == "Cardiologist"
+
+        assert output.patients[1].todays_doses == []
+        assert output.patients[1].next_appointment is None
+
+        mock_repository.find_care_snapshots_by_caregiver.assert_called_once_with(caregiver_id, now)
+
+    def test_should_default_to_utc_now(self, mocker):
+        # Arrange
+        mock_repository = Mock()
+        mock_repository.find_care_snapshots_by_caregiver.return_value = []
+        clock = mocker.patch.object(caregiver_dashboard, "datetime")
+        clock.utcnow.return_value = datetime(2024, 5, 1, 23, 30)
+        caregiver_id = uuid4()
+
+        # Act
+        GetCaregiverDashboardUseCase(mock_repository).execute(caregiver_id)
+
+        # Assert
+        mock_repository.find_care_snapshots_by_caregiver.assert_called_once_with(
+            caregiver_id, datetime(2024, 5, 1, 23, 30)
+        )
+        clock.now.assert_not_called()
@@ -0,0 +1,43 @@
+from unittest.mock import Mock
+
+from src.application.use_cases.users.authenticate_user import (
+    AuthenticateUserInput,
+    AuthenticateUserUseCase,
+)
+from src.domain.entities.user import User
+
+
+def make_use_case(recorder=None):
+    user = User.create(
+        email="carer@example.com",
+        password_hash="hash",
+        full_name="Carer",
+        role="caregiver",
+    )
+    repository = Mock()
+    repository.find_by_email.return_value = user
+    password_hasher = Mock()
+    password_hasher.verify.return_value = True
+    jwt_handler = Mock()
+    jwt_handler.access_token_expires = 3600
+    use_case = AuthenticateUserUseCase(repository, password_hasher, jwt_handler, recorder)
+    return use_case, repository, user
+
+
+class TestAuthenticateUserUseCase:
+    def test_defers_last_login_to_the_recorder(self):
+        recorder = Mock()
+        use_case, repository, user = make_use_case(recorder)
+
+        use_case.execute(AuthenticateUserInput(email="carer@example.com", password="secret"))
+
+        recorder.record.assert_called_once_with(user.id, user.last_login)
+        repository.save.assert_not_called()
+
+    def test_saves_last_login_without_a_recorder(self):
+        use_case, repository, user = make_use_case()
+
+        use_case.execute(AuthenticateUserInput(email="carer@example.com", password="secret"))
+
+        repository.save.assert_called_once_with(user)
+        assert user.last_login is not None
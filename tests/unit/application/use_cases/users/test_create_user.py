@@ -0,0 +1,22 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.use_cases.users.create_user import CreateUserInput, CreateUserUseCase
+from src.shared.exceptions.application_exception import ApplicationException
+
+
+class TestCreateUserUseCase:
+    def test_maps_email_conflict_to_user_already_exists(self):
+        repository = Mock()
+        repository.insert_if_absent.return_value = None
+        use_case = CreateUserUseCase(repository, Mock(hash=Mock(return_value="hash")))
+
+        with pytest.raises(ApplicationException) as error:
+            use_case.execute(CreateUserInput(
+                email="carer@example.com", password="secret123",
+                full_name="Carer", role="caregiver",
+            ))
+
+        assert error.value.code == "USER_ALREADY_EXISTS"
+        repository.exists_by_email.assert_not_called()
@@ -0,0 +1,214 @@
+"""Unit tests for the patient access audit trail."""
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from flask import Flask, g, request
+
+from src.application.interfaces.audit_trail import PatientAccessEvent
+from src.infrastructure.audit.buffered_audit_trail import BufferedAuditTrail
+from src.infrastructure.audit.spool import AuditSpool
+from src.infrastructure.audit.sqlalchemy_audit_store import (
+    SQLAlchemyAuditEventReader,
+    SQLAlchemyAuditSink,
+    partition_name,
+)
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.api.middlewares import audit
+from src.presentation.api.middlewares.audit import record_patient_access
+from src.presentation.api.v1.routes import admin_routes
+from src.presentation.api.v1.routes.admin_routes import admin_bp
+
+
+def make_event(patient_id=None, actor_id=None, occurred_at=None):
+    return PatientAccessEvent(
+        actor_id=actor_id or uuid4(),
+        patient_id=patient_id or uuid4(),
+        action="read",
+        route="/api/v1/patients/caregiver/<caregiver_id>",
+        request_id="req-1",
+        ip_address="10.0.0.1",
+        occurred_at=occurred_at or datetime.utcnow(),
+    )
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return AuditSpool(tmp_path / "audit-spool")
+
+
+@pytest.fixture
+def sink(test_engine):
+    return SQLAlchemyAuditSink(lambda: test_engine)
+
+
+class TestAuditSpool:
+    """Test suite for the fallback spool."""
+
+    def test_round_trips_a_batch(self, spool):
+        events = [make_event(), make_event()]
+        spool.write(events)
+
+        (path,) = spool.pending()
+        claimed = spool.claim(path)
+        assert spool.load(claimed) == events
+        assert spool.pending() == []
+
+        spool.remove(claimed)
+        assert list(spool.directory.iterdir()) == []
+
+    def test_second_claim_loses(self, spool):
+        path = spool.write([make_event()])
+
+        assert spool.claim(path) is not None
+        assert spool.claim(path) is None
+
+    def test_claims_of_dead_processes_are_pending_again(self, spool, mocker):
+        path = spool.write([make_event()])
+        claimed = spool.claim(path)
+        abandoned = claimed.with_name(f"{path.name}.claimed-999999")
+        claimed.rename(abandoned)
+        mocker.patch("src.infrastructure.audit.spool._pid_alive", return_value=False)
+
+        assert spool.pending() == [abandoned]
+        assert spool.claim(abandoned) is not None
+
+
+class TestSQLAlchemyAuditStore:
+    """Test suite for the bulk writer and the auditor query API."""
+
+    def test_writes_batches_and_ignores_replayed_events(self, sink, test_session):
+        patient_id = uuid4()
+        events = [make_event(patient_id) for _ in range(3)]
+        sink.write(events)
+        sink.write(events[:2])
+
+        page = SQLAlchemyAuditEventReader(test_session).find_events(patient_id=patient_id)
+        assert sorted(event.id for event in page.events) == sorted(event.id for event in events)
+
+    def test_filters_and_paginates_newest_first(self, sink, test_session):
+        patient_id, actor_id = uuid4(), uuid4()
+        start = datetime(2026, 1, 31, 23, 0)
+        events = [
+            make_event(patient_id, actor_id, start + timedelta(minutes=minutes))
+            for minutes in range(0, 150, 30)
+        ]
+        sink.write(events + [make_event(patient_id, uuid4(), start)])
+        reader = SQLAlchemyAuditEventReader(test_session)
+
+        query = {"patient_id": patient_id, "actor_id": actor_id, "limit": 2}
+        first = reader.find_events(**query)
+        second = reader.find_events(**query, cursor=first.next_cursor)
+        last = reader.find_events(**query, cursor=second.next_cursor)
+
+        pages = [event.id for page in (first, second, last) for event in page.events]
+        assert pages == [event.id for event in reversed(events)]
+        assert last.next_cursor is None
+
+        february = reader.find_events(patient_id=patient_id, since=datetime(2026, 2, 1))
+        assert len(february.events) == 3
+
+    def test_partition_names(self):
+        assert partition_name(datetime(2026, 3, 1).date()) == "patient_access_events_y2026m03"
+
+
+class TestBufferedAuditTrail:
+    """Test suite for the buffered trail."""
+
+    def test_flushes_in_the_background_once_a_batch_is_full(self, spool, mocker):
+        sink = mocker.Mock()
+        trail = BufferedAuditTrail(sink, spool, batch_size=2, flush_interval_ms=60000)
+
+        trail.record([make_event()])
+        assert not sink.write.called
+        trail.record([make_event()])
+
+        deadline = time.monotonic() + 2
+        while not sink.write.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        trail.stop()
+        assert len(sink.write.call_args_list[0].args[0]) == 2
+
+    def test_failed_writes_are_spooled_and_replayed(self, spool, mocker):
+        sink = mocker.Mock()
+        sink.write.side_effect = [RuntimeError("database down"), None, None]
+        trail = BufferedAuditTrail(sink, spool)
+        failed = [make_event()]
+
+        trail._buffer.extend(failed)
+        trail.flush()
+        assert len(spool.pending()) == 1
+
+        later = [make_event()]
+        trail._buffer.extend(later)
+        trail.flush()
+
+        assert [call.args[0] for call in sink.write.call_args_list[1:]] == [later, failed]
+        assert spool.pending() == []
+
+    def test_overflowing_buffer_spills_to_the_spool(self, spool, mocker):
+        sink = mocker.Mock()
+        trail = BufferedAuditTrail(sink, spool, max_buffer=3)
+
+        trail.record([make_event() for _ in range(4)])
+
+        assert trail._buffer == []
+        assert len(AuditSpool.load(spool.pending()[0])) == 4
+        assert not sink.write.called
+
+
+class TestAuditRoutes:
+    """Test suite for recording accesses and the auditor route."""
+
+    @pytest.fixture
+    def trail(self, mocker):
+        trail = mocker.Mock()
+        mocker.patch.object(audit.settings, "AUDIT_ENABLED", True)
+        mocker.patch.object(audit, "get_audit_trail", return_value=trail)
+        return trail
+
+    def test_records_actor_route_and_request_id(self, trail):
+        app = Flask(__name__)
+        user_id, patient_id = uuid4(), uuid4()
+
+        app.add_url_rule("/patients/<patient_id>", "get_patient", lambda patient_id: "")
+
+        environ = {"REMOTE_ADDR": "10.1.1.1"}
+        with app.test_request_context(f"/patients/{patient_id}", environ_base=environ):
+            request.user_id = str(user_id)
+            g.request_id = "req-42"
+            record_patient_access([patient_id])
+
+        (event,) = trail.record.call_args.args[0]
+        assert event.actor_id == user_id
+        assert event.patient_id == patient_id
+        assert event.route == "/patients/<patient_id>"
+        assert event.request_id == "req-42"
+        assert event.ip_address == "10.1.1.1"
+
+    def test_auditors_query_events(self, sink, test_session, mocker):
+        mocker.patch.object(admin_routes, "get_session", return_value=test_session)
+        patient_id = uuid4()
+        sink.write([make_event(patient_id) for _ in range(3)])
+        app = Flask(__name__)
+        app.register_blueprint(admin_bp)
+        client = app.test_client()
+
+        def get(role, **params):
+            token = JWTHandler().create_access_token(str(uuid4()), {"role": role})
+            return client.get(
+                "/api/v1/admin/audit/patient-access",
+                query_string={"patient_id": str(patient_id), **params},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert get("caregiver").status_code == 403
+        assert get("admin", limit=0).status_code == 400
+
+        response = get("admin", limit=2)
+        assert response.status_code == 200
+        assert len(response.json["data"]) == 2
+        rest = get("admin", limit=2, cursor=response.json["next_cursor"]).json
+        assert len(rest["data"]) == 1
+        assert rest["next_cursor"] is None
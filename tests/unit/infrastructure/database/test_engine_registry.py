@@ -0,0 +1,111 @@
+"""Unit tests for named engines and pool metrics."""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.infrastructure.database.session import (
+    OLTP,
+    REPORTING,
+    EngineProfile,
+    EngineRegistry,
+    TimedQueuePool,
+    build_engine,
+)
+
+
+def make_profile(url, **overrides):
+    values = dict(
+        url=url,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        statement_timeout_ms=5000,
+        lock_timeout_ms=2000,
+    )
+    values.update(overrides)
+    return EngineProfile(**values)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = EngineRegistry({
+        OLTP: make_profile(f"sqlite:///{tmp_path / 'oltp.db'}", pool_size=2),
+        REPORTING: make_profile(f"sqlite:///{tmp_path / 'reports.db'}"),
+    })
+    yield registry
+    registry.dispose()
+
+
+class TestEngineRegistry:
+    """Test suite for EngineRegistry."""
+
+    def test_engines_are_created_lazily_and_separately(self, registry):
+        assert registry.pool_metrics() == {}
+
+        oltp = registry.get_engine(OLTP)
+        reporting = registry.get_engine(REPORTING)
+
+        assert oltp is registry.get_engine(OLTP)
+        assert oltp is not reporting
+        assert isinstance(oltp.pool, TimedQueuePool)
+        assert oltp.pool.size() == 2
+        assert reporting.pool.size() == 1
+
+    def test_unknown_engine(self, registry):
+        with pytest.raises(ValueError, match="Unknown database engine"):
+            registry.get_engine("analytics")
+
+    def test_exhausted_reporting_pool_does_not_block_oltp(self, registry):
+        reporting = registry.get_engine(REPORTING)
+        held = reporting.connect()
+
+        try:
+            with pytest.raises(PoolTimeoutError):
+                reporting.connect()
+
+            with registry.get_sessionmaker(OLTP)() as session:
+                assert session.execute(text("SELECT 1")).scalar() == 1
+        finally:
+            held.close()
+
+        metrics = registry.pool_metrics()
+        assert metrics[REPORTING]["timeouts"] == 1
+        assert metrics[REPORTING]["checkouts"] == 1
+        assert metrics[OLTP]["checkouts"] == 1
+        assert metrics[OLTP]["wait_seconds_max"] >= 0
+
+    def test_metrics_survive_dispose(self, registry):
+        engine = registry.get_engine(OLTP)
+        engine.connect().close()
+        registry.dispose()
+        engine.connect().close()
+
+        assert registry.pool_metrics()[OLTP]["checkouts"] == 2
+
+
+class TestBuildEngine:
+    """Test suite for per-profile engine options."""
+
+    def test_postgres_timeouts_are_set_per_connection(self, mocker):
+        create_engine = mocker.patch("src.infrastructure.database.session.create_engine")
+        mocker.patch("src.infrastructure.database.session.instrument_engine")
+        mocker.patch("src.infrastructure.database.session.watch_engine")
+
+        build_engine(REPORTING, make_profile(
+            "postgresql://u:p@localhost/db", statement_timeout_ms=60000, lock_timeout_ms=1000
+        ))
+
+        kwargs = create_engine.call_args.kwargs
+        assert kwargs["echo"] is False
+        assert kwargs["pool_pre_ping"] is True
+        assert kwargs["pool_recycle"] == 1800
+        assert kwargs["connect_args"]["options"] == (
+            "-c statement_timeout=60000 -c lock_timeout=1000"
+        )
+
+    def test_memory_sqlite_skips_pool_sizing(self):
+        engine = build_engine(OLTP, make_profile("sqlite:///:memory:"))
+
+        assert not isinstance(engine.pool, TimedQueuePool)
@@ -0,0 +1,81 @@
+"""Unit tests for single-statement inserts with ON CONFLICT DO NOTHING."""
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.domain.entities.patient import Patient
+from src.domain.entities.user import User
+from src.infrastructure.database import insert_if_absent
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.n_plus_one import watch_engine
+from src.infrastructure.database.session import Base
+from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    watch_engine(engine)
+    Base.metadata.create_all(engine, tables=[UserModel.__table__, PatientModel.__table__])
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def make_user(email="carer@example.com"):
+    return User.create(email=email, password_hash="hash", full_name="Carer", role="caregiver")
+
+
+def make_patient(caregiver_id, cpf="52998224725"):
+    return Patient.create(
+        caregiver_id=caregiver_id, full_name="Maria Silva", cpf=cpf,
+        date_of_birth=date(1950, 5, 15), gender="F", address="Rua Example, 123",
+        phone="(11) 98765-4321", emergency_contact="João", emergency_phone="(11) 91234-5678",
+    )
+
+
+class TestInsertIfAbsent:
+    """Test suite for insert_if_absent on the user and patient repositories."""
+
+    def test_user_email_conflict_returns_none(self, session, query_budget):
+        repository = SQLAlchemyUserRepository(session)
+        user = make_user()
+
+        with query_budget(2):
+            assert repository.insert_if_absent(user) == user
+            assert repository.insert_if_absent(make_user()) is None
+
+        assert session.query(UserModel).count() == 1
+        assert repository.find_by_email(user.email).id == user.id
+
+    def test_patient_cpf_conflict_returns_none(self, session):
+        caregiver = SQLAlchemyUserRepository(session).insert_if_absent(make_user())
+        repository = SQLAlchemyPatientRepository(session)
+
+        assert repository.insert_if_absent(make_patient(caregiver.id)) is not None
+        assert repository.insert_if_absent(make_patient(caregiver.id)) is None
+        other_cpf = make_patient(caregiver.id, cpf="11144477735")
+        assert repository.insert_if_absent(other_cpf) is not None
+
+
+    def test_savepoint_fallback_for_other_dialects(self, session, mocker):
+        mocker.patch.dict(insert_if_absent._DIALECT_INSERTS, clear=True)
+        users = SQLAlchemyUserRepository(session)
+        user = make_user()
+
+        assert users.insert_if_absent(user) == user
+        assert users.insert_if_absent(make_user()) is None
+        assert users.find_by_email(user.email).id == user.id
+
+        # Other constraint violations are not mistaken for a duplicate
+        invalid = UserModel(id=uuid4(), email="new@example.com", full_name="New", role="caregiver")
+        with pytest.raises(IntegrityError):
+            insert_if_absent.insert_if_absent(session, invalid, "email")
@@ -0,0 +1,95 @@
+"""Unit tests for the N+1 query detector."""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models.stored_blob_model import StoredBlobModel, StoredFileModel
+from src.infrastructure.database.n_plus_one import (
+    NPlusOneQueryError,
+    end_detection,
+    normalize_statement,
+    start_detection,
+    watch_engine,
+)
+from src.infrastructure.database.session import Base
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    watch_engine(engine)
+    Base.metadata.create_all(
+        engine, tables=[StoredBlobModel.__table__, StoredFileModel.__table__]
+    )
+    with Session(engine) as session:
+        for i in range(4):
+            digest = uuid4().hex
+            session.add(StoredBlobModel(digest=digest, size=i, ref_count=1))
+            session.add(StoredFileModel(file_path=f"file-{i}", digest=digest))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+class TestNormalizeStatement:
+    """Test suite for statement shape normalisation."""
+
+    def test_collapses_whitespace_and_placeholder_lists(self):
+        first = normalize_statement("SELECT *  FROM t\n WHERE id IN (?, ?, ?)")
+        second = normalize_statement("SELECT * FROM t WHERE id IN (?)")
+
+        assert first == second == "SELECT * FROM t WHERE id IN (?)"
+
+    def test_psycopg_placeholders(self):
+        assert normalize_statement("id IN (%(id_1)s, %(id_2)s)") == "id IN (?)"
+
+
+class TestNPlusOneDetection:
+    """Test suite for the detector."""
+
+    def test_lazy_loading_per_row_raises(self, engine):
+        token = start_detection(threshold=2, mode="raise")
+        try:
+            with Session(engine) as session:
+                files = session.query(StoredFileModel).all()
+                with pytest.raises(NPlusOneQueryError, match="N\\+1"):
+                    for stored_file in files:
+                        _ = stored_file.blob.size
+        finally:
+            end_detection(token)
+
+    def test_eager_loading_passes(self, engine, query_budget):
+        from sqlalchemy.orm import selectinload
+
+        with query_budget(2, threshold=1):
+            with Session(engine) as session:
+                files = session.query(StoredFileModel).options(
+                    selectinload(StoredFileModel.blob)
+                ).all()
+                assert [f.blob.size for f in files] == [0, 1, 2, 3]
+
+    def test_log_mode_only_warns_once_per_shape(self, engine, mocker):
+        from src.infrastructure.database import n_plus_one
+
+        warning = mocker.patch.object(n_plus_one.logger, "warning")
+        token = start_detection(threshold=1, mode="log")
+        with engine.connect() as connection:
+            for _ in range(5):
+                connection.execute(text("SELECT 1"))
+        counter = end_detection(token)
+
+        assert counter.total == 5
+        warning.assert_called_once()
+
+    def test_query_budget_fails_when_exceeded(self, engine, query_budget):
+        with pytest.raises(AssertionError, match="Query budget exceeded: 2 > 1"):
+            with query_budget(1):
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 2"))
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError, match="Invalid N\\+1 detection mode"):
+            start_detection(mode="panic")
@@ -0,0 +1,93 @@
+"""Unit tests for query tracing and the Server-Timing middleware."""
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.database import query_tracing
+from src.infrastructure.database.query_tracing import (
+    QueryStats,
+    end_trace,
+    instrument_engine,
+    start_trace,
+)
+from src.presentation.api.middlewares.query_tracing import register_query_tracing
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestQueryStats:
+    """Test suite for QueryStats."""
+
+    def test_keeps_only_the_slowest_statements(self):
+        stats = QueryStats(top_n=2)
+        for statement, duration in [("a", 1.0), ("b", 5.0), ("c", 3.0), ("d", 0.5)]:
+            stats.record(statement, duration)
+
+        assert stats.count == 4
+        assert stats.total_ms == pytest.approx(9.5)
+        assert stats.slowest == [(5.0, "b"), (3.0, "c")]
+
+
+class TestQueryTracing:
+    """Test suite for engine instrumentation."""
+
+    def test_counts_queries_inside_trace(self, engine):
+        token = start_trace(sample_rate=1.0)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        stats = end_trace(token)
+
+        assert stats.count == 2
+        assert stats.total_ms >= 0
+        assert stats.slowest[0][1] in ("SELECT 1", "SELECT 2")
+
+    def test_unsampled_trace_collects_nothing(self, engine):
+        token = start_trace(sample_rate=0.0)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert end_trace(token) is None
+
+    def test_slow_queries_are_logged(self, engine, mocker):
+        mocker.patch.object(query_tracing.settings, "QUERY_SLOW_THRESHOLD_MS", 0)
+        warning = mocker.patch.object(query_tracing.logger, "warning")
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT   1"))
+
+        assert "SELECT 1" in warning.call_args.args[0]
+
+
+class TestServerTimingMiddleware:
+    """Test suite for the Server-Timing response header."""
+
+    def test_header_reports_query_count(self, engine):
+        app = Flask(__name__)
+        register_query_tracing(app)
+
+        @app.route("/queries")
+        def run_queries():
+            with engine.connect() as connection:
+                for _ in range(3):
+                    connection.execute(text("SELECT 1"))
+            return jsonify({})
+
+        @app.route("/static")
+        def no_queries():
+            return jsonify({})
+
+        client = app.test_client()
+
+        header = client.get("/queries").headers["Server-Timing"]
+        assert header.startswith("db;dur=")
+        assert 'desc="3 queries"' in header
+        assert "db-slowest" in header
+
+        assert 'desc="0 queries"' in client.get("/static").headers["Server-Timing"]
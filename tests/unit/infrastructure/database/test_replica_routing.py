@@ -0,0 +1,132 @@
+"""Unit tests for read-replica routing, using SQLite files as stand-ins."""
+import sqlite3
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from src.infrastructure.database.session import (
+    OLTP,
+    EngineProfile,
+    EngineRegistry,
+    close_session,
+)
+
+
+def make_database(path, role):
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE node (role TEXT)")
+    connection.execute("INSERT INTO node VALUES (?)", (role,))
+    connection.commit()
+    connection.close()
+    return f"sqlite:///{path}"
+
+
+def profile(url):
+    return EngineProfile(
+        url=url,
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=1,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        statement_timeout_ms=5000,
+        lock_timeout_ms=2000,
+    )
+
+
+def served_by(registry, read_only=True):
+    session = registry.open_session(OLTP, read_only=read_only)
+    try:
+        return session.execute(text("SELECT role FROM node")).scalar()
+    finally:
+        close_session(session)
+
+
+@pytest.fixture
+def databases(tmp_path):
+    return {
+        "primary": make_database(tmp_path / "primary.db", "primary"),
+        "replica-a": make_database(tmp_path / "a.db", "replica-a"),
+        "replica-b": make_database(tmp_path / "b.db", "replica-b"),
+    }
+
+
+@pytest.fixture
+def registry(databases):
+    registry = EngineRegistry(
+        {OLTP: profile(databases["primary"])},
+        replica_urls=[databases["replica-a"], databases["replica-b"]],
+        replica_retry_interval=60,
+    )
+    yield registry
+    registry.dispose()
+
+
+class TestReplicaRouting:
+    """Test suite for read-only routing in EngineRegistry."""
+
+    def test_reads_round_robin_over_replicas(self, registry):
+        served = [served_by(registry) for _ in range(4)]
+
+        assert served == ["replica-a", "replica-b", "replica-a", "replica-b"]
+
+    def test_writes_go_to_primary(self, registry):
+        assert served_by(registry, read_only=False) == "primary"
+
+    def test_no_replicas_falls_back_to_primary(self, databases):
+        registry = EngineRegistry({OLTP: profile(databases["primary"])}, replica_urls=[])
+
+        assert served_by(registry) == "primary"
+        registry.dispose()
+
+    def test_unhealthy_replica_is_skipped(self, databases, tmp_path):
+        registry = EngineRegistry(
+            {OLTP: profile(databases["primary"])},
+            replica_urls=[f"sqlite:///{tmp_path / 'missing' / 'down.db'}", databases["replica-b"]],
+            replica_retry_interval=60,
+        )
+
+        served = [served_by(registry) for _ in range(3)]
+
+        assert served == ["replica-b", "replica-b", "replica-b"]
+        registry.dispose()
+
+    def test_all_replicas_down_uses_primary(self, databases, tmp_path):
+        registry = EngineRegistry(
+            {OLTP: profile(databases["primary"])},
+            replica_urls=[f"sqlite:///{tmp_path / 'missing' / 'down.db'}"],
+        )
+
+        assert served_by(registry) == "primary"
+        registry.dispose()
+
+    def test_read_only_session_rejects_writes(self, registry):
+        from src.infrastructure.database.models.stored_blob_model import StoredBlobModel
+
+        session = registry.open_session(OLTP, read_only=True)
+        try:
+            session.add(StoredBlobModel(digest="abc", size=1, ref_count=1))
+            with pytest.raises(RuntimeError, match="read-only"):
+                session.flush()
+        finally:
+            close_session(session)
+
+    def test_reads_stick_to_primary_after_write_in_request(self, registry):
+        from src.infrastructure.database.models.stored_blob_model import StoredBlobModel
+
+        StoredBlobModel.__table__.create(registry.get_engine(OLTP))
+        app = Flask(__name__)
+
+        with app.test_request_context():
+            assert served_by(registry) == "replica-a"
+
+            session = registry.open_session(OLTP)
+            session.add(StoredBlobModel(digest="abc", size=1, ref_count=1))
+            session.commit()
+            close_session(session)
+
+            assert served_by(registry) == "primary"
+
+        with app.test_request_context():
+            assert served_by(registry) == "replica-b"
@@ -0,0 +1,181 @@
+"""Unit tests for the concurrent report executor."""
+import threading
+import time
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from src.infrastructure.database.models.appointment_model import AppointmentModel
+from src.infrastructure.database.models.medication_model import MedicationModel
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.query_tracing import end_trace, start_trace
+from src.infrastructure.database.report_executor import (
+    QueryWatchdog,
+    ReportDeadlineError,
+    ReportExecutor,
+)
+from src.infrastructure.database.session import OLTP, REPORTING, Base, EngineProfile, EngineRegistry
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.api.v1.routes import reports_routes
+from src.presentation.api.v1.routes.reports_routes import reports_bp
+
+
+def profile(url):
+    return EngineProfile(
+        url=url, pool_size=4, max_overflow=0, pool_timeout=1, pool_recycle=1800,
+        pool_pre_ping=False, statement_timeout_ms=5000, lock_timeout_ms=2000,
+    )
+
+
+@pytest.fixture
+def registry(tmp_path):
+    url = f"sqlite:///{tmp_path / 'reports.db'}"
+    registry = EngineRegistry({OLTP: profile(url), REPORTING: profile(url)})
+    Base.metadata.create_all(registry.get_engine(REPORTING), tables=[
+        UserModel.__table__,
+        PatientModel.__table__,
+        MedicationModel.__table__,
+        AppointmentModel.__table__,
+    ])
+    yield registry
+    registry.dispose()
+
+
+def slow(seconds, value=1):
+    def query(session):
+        time.sleep(seconds)
+        return session.execute(text(f"SELECT {value}")).scalar()
+    return query
+
+
+class TestReportExecutor:
+    """Test suite for ReportExecutor."""
+
+    def test_latency_is_the_slowest_query_not_the_sum(self, registry):
+        executor = ReportExecutor(registry, REPORTING, max_workers=3)
+
+        started = time.perf_counter()
+        queries = {"a": slow(0.2, 1), "b": slow(0.2, 2), "c": slow(0.2, 3)}
+        result = executor.run(queries, deadline_s=5)
+        elapsed = time.perf_counter() - started
+        executor.shutdown()
+
+        assert result.values == {"a": 1, "b": 2, "c": 3}
+        assert elapsed < 0.5
+        assert set(result.timings_ms) == {"a", "b", "c"}
+        assert all(timing >= 200 for timing in result.timings_ms.values())
+
+    def test_deadline(self, registry):
+        executor = ReportExecutor(registry, REPORTING, max_workers=2)
+
+        with pytest.raises(ReportDeadlineError) as error:
+            executor.run({"fast": slow(0), "slow": slow(1)}, deadline_s=0.3)
+        executor.shutdown()
+
+        assert set(error.value.timings_ms) == {"fast"}
+
+    def test_late_query_is_interrupted_and_frees_its_connection(self, registry):
+        executor = ReportExecutor(registry, REPORTING, max_workers=1)
+        endless = text(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT count(*) FROM n"
+        )
+
+        def run_endless(session):
+            return session.execute(endless).scalar()
+
+        with pytest.raises(ReportDeadlineError):
+            executor.run({"endless": run_endless}, deadline_s=0.2)
+        executor.shutdown()
+
+        pool = registry.get_engine(REPORTING).pool
+        waited = 0.0
+        while pool.checkedout() and waited < 2:
+            time.sleep(0.05)
+            waited += 0.05
+        assert pool.checkedout() == 0
+
+    def test_query_errors_propagate(self, registry):
+        executor = ReportExecutor(registry, REPORTING, max_workers=2)
+
+        def broken(session):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            executor.run({"ok": slow(0), "broken": broken}, deadline_s=5)
+        executor.shutdown()
+
+    def test_sessions_are_read_only(self, registry):
+        executor = ReportExecutor(registry, REPORTING, max_workers=1)
+        info = {}
+
+        def capture(session):
+            info.update(session.info, thread=threading.current_thread().name)
+
+        executor.run({"capture": capture}, deadline_s=5)
+        executor.shutdown()
+
+        assert info["read_only"] is True
+        assert info["thread"].startswith("report-query")
+
+    def test_query_threads_record_into_the_callers_trace(self, registry):
+        executor = ReportExecutor(registry, REPORTING, max_workers=4)
+        queries = {str(i): slow(0, i) for i in range(40)}
+
+        token = start_trace(sample_rate=1)
+        executor.run(queries, deadline_s=5)
+        stats = end_trace(token)
+        executor.shutdown()
+
+        assert stats.count >= len(queries)
+
+
+class TestQueryWatchdog:
+    """Test suite for the non-PostgreSQL query interrupt."""
+
+    def test_disarmed_watchdog_never_interrupts(self):
+        interrupt = threading.Event()
+        watchdog = QueryWatchdog(interrupt.set, timeout_s=0.05)
+        watchdog._timer.start()
+
+        watchdog.disarm()
+
+        assert not interrupt.wait(0.2)
+
+    def test_disarm_waits_for_an_interrupt_in_progress(self):
+        interrupting, resume = threading.Event(), threading.Event()
+
+        def slow_interrupt():
+            interrupting.set()
+            resume.wait(5)
+
+        watchdog = QueryWatchdog(slow_interrupt, timeout_s=0)
+        watchdog._timer.start()
+        assert interrupting.wait(5)
+
+        disarm = threading.Thread(target=watchdog.disarm)
+        disarm.start()
+        disarm.join(0.2)
+        assert disarm.is_alive()  # the connection is not released mid-interrupt
+
+        resume.set()
+        disarm.join(5)
+        assert not disarm.is_alive()
+
+
+def test_summary_reports_per_query_timings(registry, mocker):
+    executor = ReportExecutor(registry, REPORTING, max_workers=4)
+    mocker.patch.object(reports_routes, "get_report_executor", return_value=executor)
+    app = Flask(__name__)
+    app.register_blueprint(reports_bp)
+    headers = {"Authorization": f"Bearer {JWTHandler().create_access_token('user-1')}"}
+
+    body = app.test_client().get("/api/v1/reports/summary", headers=headers).json
+    executor.shutdown()
+
+    assert body["patients"] == {"total": 0, "active": 0, "inactive": 0}
+    assert set(body["meta"]["queries_ms"]) == {
+        "total_patients", "active_patients", "total_medications",
+        "active_medications", "total_appointments", "upcoming_appointments",
+    }
@@ -0,0 +1,73 @@
+"""Unit tests for the portable column types."""
+from datetime import date, time
+from uuid import uuid4
+
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database import session as db_session
+from src.infrastructure.database.models import (  # noqa: F401 - register their tables
+    appointment_model,
+    audit_event_model,
+    user_model,
+)
+from src.infrastructure.database.models.medication_model import MedicationModel
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.session import OLTP, Base, EngineProfile, EngineRegistry, init_db
+from src.infrastructure.database.types import GUID
+
+
+def test_guid_is_native_on_postgresql():
+    column = PatientModel.__table__.c.id
+    assert column.type.compile(dialect=postgresql.dialect()) == "UUID"
+
+
+def test_models_round_trip_on_sqlite():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    patient_id, caregiver_id = uuid4(), uuid4()
+
+    with Session(engine) as session:
+        session.add(PatientModel(
+            id=patient_id, caregiver_id=caregiver_id, full_name="Patient", cpf="52998224725",
+            date_of_birth=date(1950, 1, 1), gender="F", address="Addr", phone="123",
+            emergency_contact="EC", emergency_phone="123",
+        ))
+        session.add(MedicationModel(
+            patient_id=patient_id, name="Losartan", dosage="50mg", frequency="twice_daily",
+            schedule_times=[time(8, 0), time(20, 30)], start_date=date(2024, 1, 1),
+        ))
+        session.commit()
+
+    with Session(engine) as session:
+        # Stored as the 16 raw bytes
+        assert session.execute(text("SELECT id FROM patients")).scalar() == patient_id.bytes
+
+        query = select(PatientModel).where(PatientModel.caregiver_id == caregiver_id)
+        patient = session.scalars(query).one()
+        assert patient.id == patient_id
+        medication = session.scalars(select(MedicationModel)).one()
+        assert medication.patient_id == patient_id
+        assert medication.schedule_times == [time(8, 0), time(20, 30)]
+    engine.dispose()
+
+
+def test_guid_accepts_uuid_strings():
+    bind = GUID().process_bind_param(str(uuid4()), create_engine("sqlite://").dialect)
+    assert isinstance(bind, bytes) and len(bind) == 16
+
+
+def test_init_db_on_memory_sqlite(mocker):
+    registry = EngineRegistry({OLTP: EngineProfile(
+        url="sqlite:///:memory:", pool_size=1, max_overflow=0, pool_timeout=1, pool_recycle=1800,
+        pool_pre_ping=False, statement_timeout_ms=5000, lock_timeout_ms=2000,
+    )})
+    mocker.patch.object(db_session, "engines", registry)
+
+    init_db()
+
+    tables = inspect(registry.get_engine(OLTP)).get_table_names()
+    expected = {"users", "patients", "medications", "appointments", "patient_access_events"}
+    assert expected <= set(tables)
+    registry.dispose()
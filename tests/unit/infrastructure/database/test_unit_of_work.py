@@ -0,0 +1,127 @@
+"""Unit tests for the request-scoped unit of work."""
+import sqlite3
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import text
+
+from src.infrastructure.database.session import OLTP, EngineProfile, EngineRegistry
+from src.infrastructure.database.unit_of_work import UnitOfWork, get_session
+from src.presentation.api.middlewares.unit_of_work import register_unit_of_work
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "app.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE note (body TEXT)")
+    connection.close()
+
+    registry = EngineRegistry(
+        {OLTP: EngineProfile(
+            url=f"sqlite:///{path}",
+            pool_size=2,
+            max_overflow=0,
+            pool_timeout=1,
+            pool_recycle=1800,
+            pool_pre_ping=False,
+            statement_timeout_ms=5000,
+            lock_timeout_ms=2000,
+        )},
+        replica_urls=[],
+    )
+    yield registry
+    registry.dispose()
+
+
+@pytest.fixture
+def client(registry, mocker):
+    mocker.patch("src.infrastructure.database.unit_of_work.engines", registry)
+    app = Flask(__name__)
+    register_unit_of_work(app)
+
+    @app.route("/static-info")
+    def static_info():
+        return jsonify({"ok": True})
+
+    @app.route("/notes/<body>", methods=["POST"])
+    def add_note(body):
+        get_session().execute(text("INSERT INTO note VALUES (:body)"), {"body": body})
+        status = 400 if body == "invalid" else 201
+        return jsonify({"body": body}), status
+
+    @app.route("/notes/<body>/crash", methods=["POST"])
+    def add_note_and_crash(body):
+        get_session().execute(text("INSERT INTO note VALUES (:body)"), {"body": body})
+        raise RuntimeError("boom")
+
+    @app.route("/notes/<body>/read-back", methods=["POST"])
+    def add_note_and_read_back(body):
+        get_session().execute(text("INSERT INTO note VALUES (:body)"), {"body": body})
+        reader = get_session(read_only=True)
+        assert reader is get_session()
+        return jsonify({"count": reader.execute(text("SELECT COUNT(*) FROM note")).scalar()})
+
+    return app.test_client()
+
+
+def stored_notes(registry):
+    with registry.get_engine(OLTP).connect() as connection:
+        return [row[0] for row in connection.execute(text("SELECT body FROM note"))]
+
+
+class TestRequestUnitOfWork:
+    """Test suite for the Flask unit of work middleware."""
+
+    def test_request_without_db_access_checks_out_no_connection(self, client, registry, mocker):
+        open_session = mocker.spy(registry, "open_session")
+
+        assert client.get("/static-info").status_code == 200
+        open_session.assert_not_called()
+
+    def test_successful_response_commits(self, client, registry):
+        assert client.post("/notes/hello").status_code == 201
+
+        assert stored_notes(registry) == ["hello"]
+
+    def test_error_response_rolls_back(self, client, registry):
+        assert client.post("/notes/invalid").status_code == 400
+
+        assert stored_notes(registry) == []
+
+    def test_unhandled_exception_rolls_back(self, client, registry):
+        client.application.testing = False
+        assert client.post("/notes/crash/crash").status_code == 500
+
+        assert stored_notes(registry) == []
+
+    def test_read_only_access_reuses_write_session(self, client, registry):
+        response = client.post("/notes/hello/read-back")
+
+        assert response.get_json() == {"count": 1}
+        assert stored_notes(registry) == ["hello"]
+
+    def test_connections_are_returned_to_the_pool(self, client, registry):
+        for _ in range(3):
+            client.post("/notes/hello")
+
+        assert registry.get_engine(OLTP).pool.checkedout() == 0
+
+
+class TestUnitOfWork:
+    """Test suite for UnitOfWork outside of Flask."""
+
+    def test_one_session_per_engine_and_mode(self, registry):
+        uow = UnitOfWork(registry)
+
+        assert not uow.active
+        reader = uow.session(read_only=True)
+        writer = uow.session()
+        assert writer is uow.session()
+        assert reader is not writer
+        uow.close()
+        assert not uow.active
+
+    def test_get_session_requires_app_context(self):
+        with pytest.raises(RuntimeError, match="outside of an application context"):
+            get_session()
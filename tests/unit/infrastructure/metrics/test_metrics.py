@@ -0,0 +1,225 @@
+"""Unit tests for the metrics registry, multi-process aggregation and /metrics."""
+import threading
+
+import pytest
+from flask import Blueprint, Flask, jsonify
+
+from src.infrastructure.metrics import instruments, multiprocess
+from src.infrastructure.metrics.multiprocess import MultiProcessCollector
+from src.infrastructure.metrics.registry import MetricsRegistry, render
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.infrastructure.security.password_hasher import PasswordHasher
+from src.presentation.api.middlewares import metrics as metrics_middleware
+from src.presentation.api.middlewares.metrics import register_metrics
+
+
+def sample(text, line_start):
+    """Value of the first exposition line starting with ``line_start``."""
+    for line in text.splitlines():
+        if line.startswith(line_start):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample {line_start!r} in:\n{text}")
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestRegistry:
+    """Test suite for metric recording and rendering."""
+
+    def test_counter_shards_add_up_across_threads(self, registry):
+        counter = registry.counter("jobs_total", "Jobs", ("kind",))
+
+        def work():
+            for _ in range(1000):
+                counter.inc("a")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sample(render(registry.collect()), 'jobs_total{kind="a"}') == 8000
+
+    def test_histogram_renders_cumulative_buckets(self, registry):
+        histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "/x")
+
+        text = render(registry.collect())
+
+        assert sample(text, 'latency_seconds_bucket{route="/x",le="0.1"}') == 2
+        assert sample(text, 'latency_seconds_bucket{route="/x",le="1.0"}') == 3
+        assert sample(text, 'latency_seconds_bucket{route="/x",le="+Inf"}') == 4
+        assert sample(text, 'latency_seconds_count{route="/x"}') == 4
+        assert sample(text, 'latency_seconds_sum{route="/x"}') == pytest.approx(3.65)
+        assert "# TYPE latency_seconds histogram" in text
+
+    def test_gauge_goes_up_and_down(self, registry):
+        gauge = registry.gauge("in_flight", "In flight")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert sample(render(registry.collect()), "in_flight") == 1
+
+    def test_label_values_are_escaped(self, registry):
+        registry.counter("paths_total", "Paths", ("path",)).inc('a"b\\c')
+
+        assert 'paths_total{path="a\\"b\\\\c"} 1' in render(registry.collect())
+
+    def test_wrong_label_count_is_rejected(self, registry):
+        counter = registry.counter("x_total", "X", ("a", "b"))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc("only-one")
+
+    def test_duplicate_names_are_rejected(self, registry):
+        registry.counter("x_total", "X")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.counter("x_total", "X")
+
+
+class TestMultiProcess:
+    """Test suite for cross-worker aggregation."""
+
+    def test_merges_worker_snapshots_and_drops_dead_gauges(self, tmp_path, registry, mocker):
+        counter = registry.counter("requests_total", "Requests")
+        gauge = registry.gauge("busy", "Busy")
+        collector = MultiProcessCollector(tmp_path)
+
+        for pid in (101, 102):
+            mocker.patch("os.getpid", return_value=pid)
+            counter.inc(amount=5)  # the registry is shared here; worker totals are 5 and 10
+            gauge.inc()
+            collector.flush(registry)
+
+        text = render(collector.collect())
+        assert sample(text, "requests_total") == 15
+        assert sample(text, "busy") == 3
+
+        collector.mark_process_dead(102)
+        text = render(collector.collect())
+        assert sample(text, "requests_total") == 15
+        assert sample(text, "busy") == 1
+
+    def test_maybe_flush_respects_interval(self, tmp_path, registry):
+        collector = MultiProcessCollector(tmp_path, flush_interval=60)
+        collector.maybe_flush(registry)
+        first = list(tmp_path.iterdir())[0].stat().st_mtime_ns
+
+        collector.maybe_flush(registry)
+
+        assert list(tmp_path.iterdir())[0].stat().st_mtime_ns == first
+
+
+class TestMetricsEndpoint:
+    """Test suite for the metrics middleware."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(multiprocess, "_collector", None)
+        app = Flask(__name__)
+        items = Blueprint("items", __name__, url_prefix="/items")
+
+        @items.route("/<item_id>")
+        def get_item(item_id):
+            return jsonify({"id": item_id})
+
+        app.register_blueprint(items)
+        register_metrics(app)
+        return app.test_client()
+
+    def test_records_latency_by_route_rule(self, client):
+        key = ("GET", "items", "/items/<item_id>", "200")
+        before = _value(instruments.registry.collect(), "http_requests_total", key)
+        client.get("/items/1")
+        client.get("/items/2")
+
+        text = client.get("/metrics").get_data(as_text=True)
+
+        labels = 'method="GET",blueprint="items",route="/items/<item_id>"'
+        assert sample(text, f'http_requests_total{{{labels},status="200"}}') == before + 2
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}' in text
+
+    def test_unmatched_paths_share_one_label(self, client):
+        client.get("/no/such/path")
+
+        text = client.get("/metrics").get_data(as_text=True)
+
+        assert 'route="unmatched",status="404"' in text
+
+    def test_content_type_is_prometheus_text(self, client):
+        response = client.get("/metrics")
+
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+
+    @pytest.fixture
+    def pools(self, mocker):
+        mocker.patch(
+            "src.infrastructure.database.session.get_pool_metrics",
+            return_value={"oltp": {"size": 5, "checked_out": 2, "overflow": 0}},
+        )
+
+    def test_pool_gauges_are_left_out_without_a_scrape_token(self, client, pools):
+        text = client.get("/metrics").get_data(as_text=True)
+
+        assert "db_pool_" not in text
+        assert "http_requests_total" in text
+
+    def test_scrape_token_is_required_and_unlocks_pool_gauges(self, client, pools, mocker):
+        mocker.patch.object(metrics_middleware.settings, "METRICS_TOKEN", "scrape-secret")
+
+        assert client.get("/metrics").status_code == 401
+        wrong = {"Authorization": "Bearer nope"}
+        assert client.get("/metrics", headers=wrong).status_code == 401
+
+        headers = {"Authorization": "Bearer scrape-secret"}
+        text = client.get("/metrics", headers=headers).get_data(as_text=True)
+        assert sample(text, 'db_pool_checked_out{engine="oltp"}') == 2
+
+
+class TestInstrumentation:
+    """Test suite for the security instrumentation."""
+
+    def test_jwt_verifications_are_counted_by_result(self):
+        handler = JWTHandler()
+        before = instruments.registry.collect()
+        valid_before = _value(before, "jwt_verifications_total", ("valid",))
+        invalid_before = _value(before, "jwt_verifications_total", ("invalid",))
+
+        handler.decode_token(handler.create_access_token("user"))
+        with pytest.raises(ValueError):
+            handler.decode_token("not-a-token")
+
+        after = instruments.registry.collect()
+        assert _value(after, "jwt_verifications_total", ("valid",)) == valid_before + 1
+        assert _value(after, "jwt_verifications_total", ("invalid",)) == invalid_before + 1
+
+    def test_bcrypt_operations_are_timed_and_leave_no_work_in_flight(self):
+        hasher = PasswordHasher()
+        before = _count(instruments.registry.collect(), "bcrypt_duration_seconds", ("verify",))
+
+        hasher.verify("secret", hasher.hash("secret"))
+
+        after = instruments.registry.collect()
+        assert _value(after, "bcrypt_operations_in_flight", ("verify",)) == 0
+        assert _count(after, "bcrypt_duration_seconds", ("verify",)) == before + 1
+
+
+def _values(families, name, labels):
+    family = next(family for family in families if family.name == name)
+    return family.values.get(labels, [0.0] * (len(family.buckets) + 2))
+
+
+def _value(families, name, labels):
+    return _values(families, name, labels)[0]
+
+
+def _count(families, name, labels):
+    """Observations of a histogram: every bucket count, without the trailing sum."""
+    return sum(_values(families, name, labels)[:-1])
@@ -0,0 +1,244 @@
+"""Unit tests for request profiling."""
+import threading
+import time
+from collections import Counter
+
+import pytest
+from flask import Flask, jsonify
+
+from src.infrastructure.profiling.sampler import Profile, StackSampler
+from src.infrastructure.profiling.store import (
+    ProfileStore,
+    ProfilingToggle,
+    new_profile_id,
+    sign_profile_token,
+    verify_profile_token,
+)
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.api.middlewares import profiling
+from src.presentation.api.middlewares.profiling import PROFILE_ID_HEADER, register_profiling
+from src.presentation.api.v1.routes import admin_routes
+from src.presentation.api.v1.routes.admin_routes import admin_bp
+
+FRAME_A = ("handler", "src/routes.py", 10)
+FRAME_B = ("query", "src/repo.py", 20)
+
+
+def busy_wait(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def make_profile(profile_id=None):
+    return Profile(
+        id=profile_id or new_profile_id(),
+        name="GET /api/v1/patients",
+        interval_ms=5,
+        duration_ms=20,
+        stacks=Counter({(FRAME_A, FRAME_B): 3, (FRAME_A,): 1}),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(tmp_path / "profiles", max_profiles=3)
+
+
+@pytest.fixture
+def profiling_enabled(mocker, store):
+    mocker.patch.object(profiling.settings, "PROFILING_ENABLED", True)
+    mocker.patch.object(profiling.settings, "PROFILING_SAMPLE_RATE", 0.0)
+    mocker.patch.object(profiling.settings, "PROFILING_INTERVAL_MS", 1)
+    mocker.patch.object(profiling, "get_profile_store", return_value=store)
+    mocker.patch.object(admin_routes, "get_profile_store", return_value=store)
+    return store
+
+
+@pytest.fixture
+def app(profiling_enabled):
+    app = Flask(__name__)
+    register_profiling(app)
+    app.register_blueprint(admin_bp)
+
+    @app.route("/work")
+    def work():
+        busy_wait(0.03)
+        return jsonify({"ok": True})
+
+    return app
+
+
+def auth_header(role):
+    token = JWTHandler().create_access_token("user-id", {"role": role})
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestStackSampler:
+    """Test suite for the stack sampler."""
+
+    def test_samples_the_target_thread(self):
+        profile = Profile(id="p", name="test", interval_ms=1)
+        sampler = StackSampler(profile, thread_id=threading.get_ident())
+        sampler.start()
+        busy_wait(0.05)
+        sampler.stop()
+
+        assert profile.samples > 0
+        assert profile.duration_ms >= 50
+        leaf_functions = {stack[-1][0] for stack in profile.stacks}
+        assert "busy_wait" in leaf_functions
+
+
+class TestProfileFormats:
+    """Test suite for the profile exports."""
+
+    def test_collapsed_lists_root_first_stacks_with_counts(self):
+        lines = make_profile().to_collapsed().splitlines()
+
+        assert lines == [
+            "handler (src/routes.py:10);query (src/repo.py:20) 3",
+            "handler (src/routes.py:10) 1",
+        ]
+
+    def test_speedscope_shares_frames_and_weights_by_interval(self):
+        data = make_profile().to_speedscope()
+
+        assert data["shared"]["frames"] == [
+            {"name": "handler", "file": "src/routes.py", "line": 10},
+            {"name": "query", "file": "src/repo.py", "line": 20},
+        ]
+        profile = data["profiles"][0]
+        assert profile["samples"] == [[0, 1], [0]]
+        assert profile["weights"] == [15, 5]
+        assert profile["endValue"] == 20
+
+
+class TestProfileStore:
+    """Test suite for the profile store."""
+
+    def test_saves_lists_and_serves_both_formats(self, store):
+        profile = make_profile()
+        store.save(profile)
+
+        assert store.list() == [
+            {"id": profile.id, "name": profile.name, "duration_ms": 20, "samples": 2}
+        ]
+        assert store.path(profile.id).name.endswith(".speedscope.json")
+        assert store.path(profile.id, "collapsed").read_text() == profile.to_collapsed()
+
+    def test_prunes_oldest_profiles(self, store):
+        ids = [f"20240101T00000{second}-0000000{second}" for second in range(5)]
+        for profile_id in ids:
+            store.save(make_profile(profile_id))
+
+        assert [entry["id"] for entry in store.list()] == ids[:1:-1]
+        assert store.path(ids[0], "collapsed") is None
+
+    @pytest.mark.parametrize("profile_id", ["../secret", "toggle", "20240101T000000-zzzzzzzz"])
+    def test_rejects_ids_outside_the_store(self, store, profile_id):
+        assert store.path(profile_id) is None
+
+    def test_toggle_round_trip_and_expiry(self, store):
+        store.set_toggle(ProfilingToggle("/api/v1/patients", time.time() + 60))
+        toggle = store.get_toggle()
+
+        assert toggle.matches("/api/v1/patients/caregiver/1")
+        assert not toggle.matches("/api/v1/users")
+
+        store.set_toggle(ProfilingToggle("/", time.time() - 1))
+        assert store.get_toggle() is None
+
+
+class TestProfileToken:
+    """Test suite for signed X-Profile tokens."""
+
+    def test_valid_token(self):
+        token = sign_profile_token("secret", int(time.time()) + 60)
+        assert verify_profile_token("secret", token)
+
+    def test_rejects_expired_tampered_and_foreign_tokens(self):
+        expires_at = int(time.time()) + 60
+        token = sign_profile_token("secret", expires_at)
+
+        expired = sign_profile_token("secret", int(time.time()) - 1)
+        assert not verify_profile_token("secret", expired)
+        assert not verify_profile_token("secret", f"{expires_at + 3600}.{token.split('.')[1]}")
+        assert not verify_profile_token("other", token)
+        assert not verify_profile_token("secret", "garbage")
+
+
+class TestProfilingMiddleware:
+    """Test suite for the profiling middleware."""
+
+    def test_disabled_registers_no_hooks(self, mocker):
+        mocker.patch.object(profiling.settings, "PROFILING_ENABLED", False)
+        app = Flask(__name__)
+        register_profiling(app)
+
+        assert not app.before_request_funcs
+        assert not app.teardown_request_funcs
+
+    def test_unselected_requests_are_not_profiled(self, app, store):
+        response = app.test_client().get("/work")
+
+        assert PROFILE_ID_HEADER not in response.headers
+        assert store.list() == []
+
+    def test_signed_header_profiles_the_request(self, app, store):
+        token = sign_profile_token(profiling.profile_token_secret(), int(time.time()) + 60)
+        response = app.test_client().get("/work", headers={"X-Profile": token})
+
+        profile_id = response.headers[PROFILE_ID_HEADER]
+        assert store.list()[0]["id"] == profile_id
+        assert store.list()[0]["name"] == "GET /work"
+        assert "work" in store.path(profile_id, "collapsed").read_text()
+
+    def test_invalid_header_is_ignored(self, app, store):
+        response = app.test_client().get("/work", headers={"X-Profile": "1.forged"})
+
+        assert PROFILE_ID_HEADER not in response.headers
+
+    def test_admin_toggle_profiles_matching_paths(self, app, store, mocker):
+        # Workers re-read the toggle at most once a second; don't wait for it here
+        mocker.patch.object(profiling, "TOGGLE_CACHE_SECONDS", 0)
+        client = app.test_client()
+        response = client.put(
+            "/api/v1/admin/profiling",
+            json={"path_prefix": "/work", "duration_seconds": 60},
+            headers=auth_header("admin"),
+        )
+        assert response.status_code == 200
+
+        profile_id = client.get("/work").headers[PROFILE_ID_HEADER]
+        download = client.get(f"/api/v1/admin/profiles/{profile_id}", headers=auth_header("admin"))
+
+        assert download.status_code == 200
+        assert download.get_json()["name"] == "GET /work"
+
+
+class TestAdminRoutes:
+    """Test suite for the profiling admin endpoints."""
+
+    def test_requires_admin_role(self, app):
+        response = app.test_client().get("/api/v1/admin/profiles", headers=auth_header("caregiver"))
+
+        assert response.status_code == 403
+
+    def test_minted_token_is_accepted_by_the_middleware(self, app):
+        client = app.test_client()
+        minted = client.post(
+            "/api/v1/admin/profiling/tokens", json={"ttl_seconds": 60}, headers=auth_header("admin")
+        )
+
+        assert minted.status_code == 201
+        grant = minted.get_json()
+        response = client.get("/work", headers={grant["header"]: grant["token"]})
+        assert PROFILE_ID_HEADER in response.headers
+
+    def test_unknown_profile_is_404(self, app):
+        response = app.test_client().get(
+            "/api/v1/admin/profiles/20240101T000000-00000000", headers=auth_header("admin")
+        )
+
+        assert response.status_code == 404
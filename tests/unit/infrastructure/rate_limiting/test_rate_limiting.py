@@ -0,0 +1,216 @@
+"""Unit tests for token-bucket rate limiting."""
+import math
+
+import pytest
+import redis
+from flask import Blueprint, Flask, jsonify
+
+from src.infrastructure.rate_limiting import token_bucket
+from src.infrastructure.rate_limiting.limiter import RateLimiter
+from src.infrastructure.rate_limiting.redis_token_buckets import ACQUIRE_SCRIPT, RedisTokenBuckets
+from src.infrastructure.rate_limiting.token_bucket import Decision, InMemoryTokenBuckets, Limit
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.api.middlewares import rate_limit
+
+
+class TestLimit:
+    """Test suite for limit parsing."""
+
+    def test_parse(self):
+        assert Limit.parse("5/minute") == Limit(capacity=5, rate=5 / 60)
+        assert Limit.parse(" 5 / minute burst 10 ") == Limit(capacity=10, rate=5 / 60)
+        assert Limit.parse("2/second") == Limit(capacity=2, rate=2.0)
+
+    @pytest.mark.parametrize("spec", ["5", "5/day", "five/minute", "5/minute burst"])
+    def test_parse_rejects_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            Limit.parse(spec)
+
+
+class TestInMemoryTokenBuckets:
+    """Test suite for the in-process buckets."""
+
+    @pytest.fixture
+    def clock(self, mocker):
+        clock = mocker.patch.object(token_bucket.time, "monotonic")
+        clock.return_value = 1000.0
+        return clock
+
+    def test_burst_then_refill(self, clock):
+        buckets = InMemoryTokenBuckets()
+        limit = Limit.parse("1/second burst 3")
+
+        assert all(buckets.acquire([("k", limit)]).allowed for _ in range(3))
+        denied = buckets.acquire([("k", limit)])
+        assert not denied.allowed
+        assert denied.retry_after == pytest.approx(1.0)
+
+        clock.return_value += 1.0
+        assert buckets.acquire([("k", limit)]).allowed
+
+    def test_all_or_nothing(self, clock):
+        buckets = InMemoryTokenBuckets()
+        tight, loose = Limit.parse("1/minute"), Limit.parse("10/minute")
+
+        assert buckets.acquire([("tight", tight), ("loose", loose)]).allowed
+        assert not buckets.acquire([("tight", tight), ("loose", loose)]).allowed
+
+        # The denied request took nothing from the loose bucket
+        assert sum(buckets.acquire([("loose", loose)]).allowed for _ in range(10)) == 9
+
+    def test_least_recently_used_buckets_are_dropped(self, clock):
+        buckets = InMemoryTokenBuckets(max_keys=2)
+        limit = Limit.parse("1/hour")
+
+        for key in ("a", "b", "a", "c"):
+            buckets.acquire([(key, limit)])
+
+        assert not buckets.acquire([("a", limit)]).allowed
+        assert buckets.acquire([("b", limit)]).allowed  # dropped, comes back full
+
+
+class FakeScriptRedis:
+    """
+    Runs ``ACQUIRE_SCRIPT`` as a Python port of the Lua, on in-memory hashes
+    and a settable server clock (ms); values are stored as strings like Redis.
+    """
+
+    def __init__(self):
+        self.now_ms = 1_000_000
+        self.hashes = {}
+        self.ttls_ms = {}
+        self.calls = []
+
+    def register_script(self, script):
+        assert script == ACQUIRE_SCRIPT
+        return self.run
+
+    def run(self, keys, args):
+        self.calls.append((keys, args))
+        levels, retry_ms = [], 0
+        for i, key in enumerate(keys):
+            capacity, rate = float(args[2 * i]), float(args[2 * i + 1])
+            bucket = self.hashes.get(key, {})
+            tokens = float(bucket.get("tokens", capacity))
+            updated = float(bucket.get("updated", self.now_ms))
+            tokens = min(capacity, tokens + max(0, self.now_ms - updated) * rate)
+            if tokens < 1:
+                retry_ms = max(retry_ms, (1 - tokens) / rate)
+            levels.append(tokens)
+
+        for i, key in enumerate(keys):
+            capacity, rate = float(args[2 * i]), float(args[2 * i + 1])
+            tokens = levels[i] - 1 if retry_ms == 0 else levels[i]
+            self.hashes[key] = {"tokens": str(tokens), "updated": str(self.now_ms)}
+            self.ttls_ms[key] = math.ceil((capacity - tokens) / rate) + 1000
+
+        return [1 if retry_ms == 0 else 0, str(retry_ms)]
+
+
+class TestRedisTokenBuckets:
+    """Test suite for the shared buckets, against a port of the Lua script."""
+
+    def test_passes_prefixed_keys_and_per_ms_rates(self):
+        redis_client = FakeScriptRedis()
+        buckets = RedisTokenBuckets(redis_client, key_prefix="rl")
+
+        buckets.acquire([
+            ("ip:1", Limit.parse("60/minute burst 5")),
+            ("route", Limit.parse("2/second")),
+        ])
+
+        keys, args = redis_client.calls[0]
+        assert keys == ["rl:ip:1", "rl:route"]
+        assert args == pytest.approx([5, 0.001, 2, 0.002])
+
+    def test_burst_then_refill_on_the_server_clock(self):
+        redis_client = FakeScriptRedis()
+        buckets = RedisTokenBuckets(redis_client)
+        limit = Limit.parse("1/second burst 3")
+
+        assert all(buckets.acquire([("k", limit)]).allowed for _ in range(3))
+        denied = buckets.acquire([("k", limit)])
+        assert denied == Decision(False, pytest.approx(1.0))
+
+        redis_client.now_ms += 1000
+        assert buckets.acquire([("k", limit)]).allowed
+        # An empty bucket expires once it would have refilled completely
+        assert redis_client.ttls_ms["ratelimit:k"] == 3000 + 1000
+
+    def test_all_or_nothing(self):
+        redis_client = FakeScriptRedis()
+        buckets = RedisTokenBuckets(redis_client)
+        tight, loose = Limit.parse("1/minute"), Limit.parse("10/minute")
+
+        assert buckets.acquire([("tight", tight), ("loose", loose)]).allowed
+        assert not buckets.acquire([("tight", tight), ("loose", loose)]).allowed
+
+        assert float(redis_client.hashes["ratelimit:loose"]["tokens"]) == pytest.approx(9)
+
+
+class TestRateLimiter:
+    """Test suite for the fallback to per-worker buckets."""
+
+    def test_falls_back_while_shared_backend_is_down(self, mocker):
+        shared = mocker.Mock()
+        shared.acquire.side_effect = redis.ConnectionError("down")
+        limiter = RateLimiter(shared, InMemoryTokenBuckets(), retry_interval=60)
+        limit = Limit.parse("1/minute")
+
+        assert limiter.acquire([("k", limit)]).allowed
+        assert not limiter.acquire([("k", limit)]).allowed
+        assert shared.acquire.call_count == 1
+
+    def test_uses_shared_backend_when_up(self, mocker):
+        shared = mocker.Mock()
+        shared.acquire.return_value = Decision(False, 2.5)
+        limiter = RateLimiter(shared, InMemoryTokenBuckets())
+
+        assert limiter.acquire([("k", Limit.parse("1/minute"))]) == Decision(False, 2.5)
+
+
+class TestRateLimitMiddleware:
+    """Test suite for the request hook."""
+
+    @pytest.fixture
+    def client(self, mocker):
+        mocker.patch.object(rate_limit.settings, "RATE_LIMIT_ENABLED", True)
+        mocker.patch.object(rate_limit.settings, "RATE_LIMIT_RULES", {
+            "auth.login": {"ip": "3/minute", "account": "2/minute"},
+            "*": {"account": "1/minute"},
+        })
+        auth = Blueprint("auth", __name__)
+        auth.add_url_rule("/login", "login", lambda: jsonify({}), methods=["POST"])
+        app = Flask(__name__)
+        app.register_blueprint(auth)
+        app.add_url_rule("/items", "items", lambda: jsonify({}), methods=["GET", "POST"])
+        rate_limit.register_rate_limiting(app)
+        return app.test_client()
+
+    def login(self, client, email, ip="203.0.113.7"):
+        return client.post("/login", json={"email": email}, environ_base={"REMOTE_ADDR": ip})
+
+    def test_login_is_limited_per_account_and_per_ip(self, client):
+        assert self.login(client, "a@example.com").status_code == 200
+        assert self.login(client, "A@example.com ").status_code == 200
+
+        response = self.login(client, "a@example.com")
+        assert response.status_code == 429
+        assert response.json["code"] == "RATE_LIMITED"
+        assert int(response.headers["Retry-After"]) == 30
+
+        # The denied attempt took no token from the IP bucket
+        assert self.login(client, "b@example.com").status_code == 200
+        assert self.login(client, "c@example.com").status_code == 429
+        assert self.login(client, "c@example.com", ip="198.51.100.1").status_code == 200
+
+    def test_accounts_come_from_verified_tokens_and_reads_are_not_limited(self, client):
+        token = JWTHandler().create_access_token("user-1")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        assert client.post("/items", headers=headers).status_code == 200
+        assert client.post("/items", headers=headers).status_code == 429
+        assert client.get("/items", headers=headers).status_code == 200
+
+        # A forged token does not count against user-1
+        assert client.post("/items", headers={"Authorization": "Bearer forged"}).status_code == 200
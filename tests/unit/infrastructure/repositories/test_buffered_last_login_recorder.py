@@ -0,0 +1,91 @@
+"""Unit tests for BufferedLastLoginRecorder."""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.session import Base
+from src.infrastructure.repositories.buffered_last_login_recorder import (
+    BufferedLastLoginRecorder,
+    build_batch_update,
+)
+
+NOW = datetime(2024, 5, 1, 9, 0)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[UserModel.__table__])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def user_ids(engine):
+    ids = [uuid4(), uuid4()]
+    with engine.begin() as connection:
+        connection.execute(UserModel.__table__.insert(), [
+            {
+                "id": user_id, "email": f"user{index}@example.com", "password_hash": "x",
+                "full_name": "User", "role": "caregiver", "is_active": True,
+                "created_at": NOW, "updated_at": NOW,
+            }
+            for index, user_id in enumerate(ids)
+        ])
+    return ids
+
+
+def last_logins(engine):
+    with engine.connect() as connection:
+        return dict(connection.execute(select(UserModel.id, UserModel.last_login)).all())
+
+
+class TestBufferedLastLoginRecorder:
+    """Test suite for coalesced last_login writes."""
+
+    def test_coalesces_logins_into_one_write_per_user(self, engine, user_ids):
+        recorder = BufferedLastLoginRecorder(lambda: engine, flush_interval=60)
+        first, second = user_ids
+        recorder.record(first, NOW)
+        recorder.record(first, NOW + timedelta(seconds=5))
+        recorder.record(first, NOW + timedelta(seconds=2))
+
+        assert last_logins(engine)[first] is None
+        recorder.stop()
+
+        assert last_logins(engine) == {first: NOW + timedelta(seconds=5), second: None}
+
+    def test_never_moves_last_login_backwards(self, engine, user_ids):
+        recorder = BufferedLastLoginRecorder(lambda: engine, flush_interval=60)
+        user_id = user_ids[0]
+        recorder.record(user_id, NOW)
+        recorder.flush()
+
+        # Another worker flushing an older login afterwards
+        recorder.record(user_id, NOW - timedelta(minutes=1))
+        recorder.flush()
+
+        assert last_logins(engine)[user_id] == NOW
+
+    def test_failed_writes_are_kept_for_the_next_flush(self, engine, user_ids, mocker):
+        get_engine = mocker.Mock(side_effect=[RuntimeError("database down"), engine])
+        recorder = BufferedLastLoginRecorder(get_engine, flush_interval=60)
+        recorder.record(user_ids[0], NOW)
+
+        recorder.flush()
+        recorder.flush()
+
+        assert last_logins(engine)[user_ids[0]] == NOW
+
+    def test_postgresql_batch_is_a_single_update_from_values(self):
+        pending = {uuid4(): NOW, uuid4(): NOW}
+
+        sql = str(build_batch_update(pending).compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("UPDATE users SET")
+        assert "FROM (VALUES" in sql
+        assert "users.last_login < logins.last_login" in sql
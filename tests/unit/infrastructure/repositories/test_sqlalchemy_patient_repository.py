@@ -0,0 +1,119 @@
+"""Unit tests for SQLAlchemyPatientRepository dashboard loading."""
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models.appointment_model import AppointmentModel
+from src.infrastructure.database.models.medication_model import MedicationModel
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.n_plus_one import watch_engine
+from src.infrastructure.database.session import Base
+from src.infrastructure.repositories.sqlalchemy_patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+
+NOW = datetime(2024, 5, 1, 9, 0)
+TABLES = [
+    UserModel.__table__,
+    PatientModel.__table__,
+    MedicationModel.__table__,
+    AppointmentModel.__table__,
+]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    watch_engine(engine)
+    Base.metadata.create_all(engine, tables=TABLES)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def make_cpf(index):
+    digits = [int(d) for d in f"{index + 100000000:09d}"]
+    for length in (9, 10):
+        total = sum(d * (length + 1 - i) for i, d in enumerate(digits))
+        digits.append((total * 10 % 11) % 10)
+    return "".join(map(str, digits))
+
+
+def add_caregiver(session):
+    caregiver = UserModel(
+        id=uuid4(), email=f"{uuid4().hex}@example.com", password_hash="x",
+        full_name="Caregiver", role="caregiver",
+    )
+    session.add(caregiver)
+    return caregiver.id
+
+
+def add_patient(session, caregiver_id, index):
+    patient_id = uuid4()
+    session.add(PatientModel(
+        id=patient_id, caregiver_id=caregiver_id, full_name=f"Patient {index:03d}",
+        cpf=make_cpf(index), date_of_birth=date(1950, 1, 1), gender="F",
+        address="Addr", phone="123", emergency_contact="EC", emergency_phone="123",
+    ))
+    for name, is_active in (("Losartan", True), ("Metformin", True), ("Old", False)):
+        session.add(MedicationModel(
+            patient_id=patient_id, name=name, dosage="50mg", frequency="twice_daily",
+            schedule_times=[time(8, 0), time(20, 0)], start_date=NOW - timedelta(days=30),
+            is_active=is_active,
+        ))
+    for title, offset, status in (
+        ("Past", -1, "scheduled"),
+        ("Cancelled", 1, "cancelled"),
+        ("Next", 2, "scheduled"),
+        ("Later", 5, "scheduled"),
+    ):
+        session.add(AppointmentModel(
+            patient_id=patient_id, title=title, appointment_date=NOW + timedelta(days=offset),
+            duration_minutes=30, location="Clinic", status=status,
+        ))
+    return patient_id
+
+
+class TestFindCareSnapshotsByCaregiver:
+    """Test suite for the caregiver dashboard repository method."""
+
+    @pytest.mark.parametrize("patient_count", [1, 25])
+    def test_query_count_does_not_grow_with_patients(self, session, query_budget, patient_count):
+        caregiver_id = add_caregiver(session)
+        for index in range(patient_count):
+            add_patient(session, caregiver_id, index)
+        session.commit()
+        session.expunge_all()
+
+        repository = SQLAlchemyPatientRepository(session)
+        with query_budget(4, threshold=1):
+            snapshots = repository.find_care_snapshots_by_caregiver(caregiver_id, NOW)
+
+        assert len(snapshots) == patient_count
+
+    def test_loads_active_medications_and_next_appointment(self, session):
+        caregiver_id = add_caregiver(session)
+        patient_id = add_patient(session, caregiver_id, 1)
+        add_patient(session, add_caregiver(session), 2)
+        session.commit()
+        session.expunge_all()
+
+        snapshots = SQLAlchemyPatientRepository(session).find_care_snapshots_by_caregiver(
+            caregiver_id, NOW
+        )
+
+        assert len(snapshots) == 1
+        snapshot = snapshots[0]
+        assert snapshot.patient.id == patient_id
+        assert sorted(m.name for m in snapshot.active_medications) == ["Losartan", "Metformin"]
+        assert snapshot.active_medications[0].schedule_times == [time(8, 0), time(20, 0)]
+        assert snapshot.next_appointment.title == "Next"
+
+    def test_caregiver_without_patients(self, session, query_budget):
+        repository = SQLAlchemyPatientRepository(session)
+        with query_budget(1):
+            assert repository.find_care_snapshots_by_caregiver(uuid4(), NOW) == []
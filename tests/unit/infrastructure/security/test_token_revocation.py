@@ -0,0 +1,183 @@
+"""Unit tests for refresh token rotation and revocation."""
+import time
+from uuid import uuid4
+
+import jwt
+import pytest
+from flask import Flask
+
+from src.domain.entities.user import User
+from src.infrastructure.security import token_revocation
+from src.infrastructure.security.bloom_filter import BloomFilter
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.infrastructure.security.token_revocation import RedisTokenRevocationStore
+from src.presentation.api.v1.routes import auth_routes
+from src.presentation.api.v1.routes.auth_routes import auth_bp
+
+
+class FakeRedis:
+    """The handful of Redis commands the store uses, with call counting."""
+
+    def __init__(self):
+        self.keys = {}
+        self.zsets = {}
+        self.calls = 0
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+            def execute(self):
+                client.calls += 1
+                return [
+                    getattr(client, f"_{name}")(*args, **kwargs)
+                    for name, args, kwargs in self.commands
+                ]
+
+        return Pipeline()
+
+    def _set(self, key, value, ex=None, nx=False):
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value
+        return True
+
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def _zremrangebyscore(self, key, low, high):
+        high = float(high)
+        zset = self.zsets.get(key, {})
+        for member in [member for member, score in zset.items() if score <= high]:
+            del zset[member]
+
+    def zremrangebyscore(self, key, low, high):
+        self.calls += 1
+        self._zremrangebyscore(key, low, high)
+
+    def zrangebyscore(self, key, low, high):
+        self.calls += 1
+        return [member for member, score in self.zsets.get(key, {}).items() if score >= float(low)]
+
+    def zrange(self, key, start, end):
+        self.calls += 1
+        return list(self.zsets.get(key, {}))
+
+    def exists(self, key):
+        self.calls += 1
+        return int(key in self.keys)
+
+
+class TestBloomFilter:
+    """Test suite for the Bloom filter."""
+
+    def test_no_false_negatives_and_few_false_positives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        members = [uuid4().hex for _ in range(1000)]
+        for member in members:
+            bloom.add(member)
+
+        assert all(member in bloom for member in members)
+        false_positives = sum(uuid4().hex in bloom for _ in range(10000))
+        assert false_positives < 300
+        assert not bloom.full
+
+
+class TestRedisTokenRevocationStore:
+    """Test suite for the Redis store and its local filter."""
+
+    def test_unrevoked_tokens_are_answered_locally(self):
+        client = FakeRedis()
+        store = RedisTokenRevocationStore(client, sync_interval=60)
+        store.is_revoked("warm-up")
+
+        calls = client.calls
+        assert not any(store.is_revoked(uuid4().hex) for _ in range(100))
+        assert client.calls - calls < 5  # only filter false positives reach Redis
+
+    def test_revocation_is_exact_and_once_only(self):
+        store = RedisTokenRevocationStore(FakeRedis())
+
+        assert store.revoke("jti-1", int(time.time()) + 60)
+        assert not store.revoke("jti-1", int(time.time()) + 60)
+        assert store.is_revoked("jti-1")
+
+    def test_other_workers_see_revocations_after_a_sync(self, mocker):
+        client = FakeRedis()
+        worker_a = RedisTokenRevocationStore(client, sync_interval=60)
+        worker_b = RedisTokenRevocationStore(client, sync_interval=60)
+        worker_b.is_revoked("warm-up")
+
+        worker_a.revoke("jti-1", int(time.time()) + 60)
+        assert not worker_b.is_revoked("jti-1")
+
+        mocker.patch.object(token_revocation.time, "monotonic", return_value=time.monotonic() + 61)
+        assert worker_b.is_revoked("jti-1")
+
+
+class TestTokenRotation:
+    """Test suite for /refresh and /logout."""
+
+    @pytest.fixture
+    def user(self, mocker):
+        user = User.create(
+            email="carer@example.com", password_hash="hash", full_name="Carer", role="caregiver",
+        )
+        repository = mocker.patch.object(auth_routes, "SQLAlchemyUserRepository").return_value
+        repository.find_by_id.return_value = user
+        mocker.patch.object(auth_routes, "get_session")
+        return user
+
+    @pytest.fixture
+    def client(self):
+        app = Flask(__name__)
+        app.register_blueprint(auth_bp)
+        return app.test_client()
+
+    def refresh(self, client, token):
+        return client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+
+    def test_rotation_spends_the_token_and_reuse_revokes_the_family(self, client, user):
+        first = JWTHandler().create_refresh_token(str(user.id))
+
+        response = self.refresh(client, first)
+        assert response.status_code == 200
+        second = response.json["refresh_token"]
+        assert JWTHandler().decode_token(response.json["access_token"])["role"] == "caregiver"
+
+        reused = self.refresh(client, first)
+        assert reused.status_code == 401
+        assert reused.json["code"] == "TOKEN_REUSED"
+
+        # The legitimate holder's newer token dies with the family
+        assert self.refresh(client, second).json["code"] == "TOKEN_REVOKED"
+
+    def test_tokens_without_jti_cannot_be_rotated(self, client, user):
+        handler = JWTHandler()
+        legacy = jwt.encode(
+            {"sub": str(user.id), "exp": int(time.time()) + 60, "type": "refresh"},
+            handler.secret_key, algorithm=handler.algorithm,
+        )
+
+        assert self.refresh(client, legacy).json["code"] == "TOKEN_NOT_ROTATABLE"
+
+    def test_logout_revokes_access_and_refresh_tokens(self, client, user):
+        handler = JWTHandler()
+        access = handler.create_access_token(str(user.id), {"role": user.role})
+        refresh_token = handler.create_refresh_token(str(user.id))
+        headers = {"Authorization": f"Bearer {access}"}
+
+        response = client.post(
+            "/api/v1/auth/logout", json={"refresh_token": refresh_token}, headers=headers
+        )
+        assert response.status_code == 204
+
+        response = client.post("/api/v1/auth/logout", headers=headers)
+        assert response.json["error"] == "Token has been revoked"
+        assert self.refresh(client, refresh_token).json["code"] == "TOKEN_REVOKED"
@@ -0,0 +1,166 @@
+"""Unit tests for the content-addressed deduplicating storage."""
+import io
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.models.stored_blob_model import StoredBlobModel, StoredFileModel
+from src.infrastructure.database.session import Base
+from src.infrastructure.storage.deduplicating_storage import (
+    DeduplicatingStorageService,
+    InMemoryBlobIndex,
+)
+from src.infrastructure.storage.local_storage import LocalStorageService
+from src.infrastructure.storage.sqlalchemy_blob_index import SQLAlchemyBlobIndex
+
+
+@pytest.fixture
+def sqlite_session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        engine, tables=[StoredBlobModel.__table__, StoredFileModel.__table__]
+    )
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def session_scope():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    yield session_scope
+    engine.dispose()
+
+
+@pytest.fixture(params=["memory", "sqlalchemy"])
+def index(request, sqlite_session_factory):
+    if request.param == "memory":
+        return InMemoryBlobIndex()
+    return SQLAlchemyBlobIndex(session_factory=sqlite_session_factory)
+
+
+@pytest.fixture
+def backend(tmp_path):
+    local = LocalStorageService(root=str(tmp_path), chunk_size=4)
+    return Mock(wraps=local)
+
+
+@pytest.fixture
+def storage(backend, index):
+    return DeduplicatingStorageService(backend, index, chunk_size=4)
+
+
+class TestDeduplicatingStorageService:
+    """Test suite for DeduplicatingStorageService."""
+
+    def test_duplicate_content_is_uploaded_once(self, storage, backend):
+        storage.upload_stream("family-a/prescription.pdf", io.BytesIO(b"same-pdf"))
+        storage.upload_file("family-b/prescription.pdf", b"same-pdf")
+
+        assert backend.upload_stream.call_count == 1
+        assert backend.upload_file.call_count == 0
+        assert storage.download_file("family-b/prescription.pdf") == b"same-pdf"
+        assert b"".join(storage.download_stream("family-a/prescription.pdf")) == b"same-pdf"
+
+    def test_file_exists_does_not_hit_backend(self, storage, backend):
+        storage.upload_file("a.pdf", b"content")
+
+        assert storage.file_exists("a.pdf") is True
+        assert storage.file_exists("b.pdf") is False
+        backend.file_exists.assert_not_called()
+
+    def test_blob_deleted_only_after_last_reference(self, storage, backend):
+        storage.upload_file("a.pdf", b"content")
+        storage.upload_file("b.pdf", b"content")
+        blob_key = DeduplicatingStorageService.blob_key(
+            "ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73"
+        )
+
+        assert storage.delete_file("a.pdf") is True
+        backend.delete_file.assert_not_called()
+        assert storage.download_file("b.pdf") == b"content"
+
+        assert storage.delete_file("b.pdf") is True
+        backend.delete_file.assert_called_once_with(blob_key)
+        assert storage.delete_file("b.pdf") is False
+
+    def test_overwrite_releases_previous_blob(self, storage, backend):
+        storage.upload_file("a.pdf", b"v1")
+        storage.upload_file("a.pdf", b"v2")
+
+        assert storage.download_file("a.pdf") == b"v2"
+        assert backend.delete_file.call_count == 1
+
+    def test_reupload_after_delete_restores_blob(self, storage):
+        storage.upload_file("a.pdf", b"content")
+        storage.delete_file("a.pdf")
+        storage.upload_file("b.pdf", b"content")
+
+        assert storage.download_range("b.pdf", 0, 4) == b"cont"
+
+    def test_missing_file_raises(self, storage):
+        with pytest.raises(FileNotFoundError):
+            storage.download_file("missing.pdf")
+
+
+class TestDigestLocking:
+    """Test suite for serialising uploads and collection of one digest."""
+
+    def test_collect_in_one_worker_blocks_reupload_in_another(self, tmp_path):
+        local = LocalStorageService(root=str(tmp_path), chunk_size=4)
+        backend = Mock(wraps=local)
+        index = InMemoryBlobIndex()
+        worker_a = DeduplicatingStorageService(backend, index, chunk_size=4)
+        worker_b = DeduplicatingStorageService(backend, index, chunk_size=4)
+        deleting, resume = threading.Event(), threading.Event()
+
+        def slow_delete(key):
+            deleting.set()
+            resume.wait(5)
+            return local.delete_file(key)
+
+        worker_a.upload_file("a.pdf", b"content")
+        backend.delete_file.side_effect = slow_delete
+        collect = threading.Thread(target=worker_a.delete_file, args=("a.pdf",))
+        collect.start()
+        assert deleting.wait(5)
+
+        upload = threading.Thread(target=worker_b.upload_file, args=("b.pdf", b"content"))
+        upload.start()
+        upload.join(0.2)
+        assert upload.is_alive()  # waits for the collection to finish
+
+        resume.set()
+        collect.join(5)
+        upload.join(5)
+        assert worker_b.download_file("b.pdf") == b"content"
+
+    def test_sqlalchemy_index_takes_advisory_lock_on_postgresql(self):
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        closed = threading.Event()
+
+        @contextmanager
+        def session_scope():
+            yield session
+            closed.set()
+
+        index = SQLAlchemyBlobIndex(session_factory=session_scope)
+        digest = "ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73"
+
+        with index.lock(digest):
+            statement = session.execute.call_args.args[0]
+            assert "pg_advisory_xact_lock" in str(statement)
+            assert list(statement.compile().params.values()) == [int(digest[:15], 16)]
+            assert not closed.is_set()
+        assert closed.is_set()
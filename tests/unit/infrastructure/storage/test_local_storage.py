@@ -0,0 +1,81 @@
+"""Unit tests for the local filesystem storage backend."""
+import io
+
+import pytest
+
+from src.infrastructure.storage.local_storage import LocalStorageService
+from src.infrastructure.storage.streaming import iter_chunks
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageService(root=str(tmp_path), chunk_size=4)
+
+
+class TestIterChunks:
+    """Test suite for the re-chunking helper."""
+
+    def test_rechunks_iterables_to_fixed_size(self):
+        chunks = list(iter_chunks([b"ab", b"cdefg", b"", b"hij"], 4))
+
+        assert chunks == [b"abcd", b"efgh", b"ij"]
+
+    def test_reads_file_objects_in_chunks(self):
+        chunks = list(iter_chunks(io.BytesIO(b"0123456789"), 3))
+
+        assert chunks == [b"012", b"345", b"678", b"9"]
+
+
+class TestLocalStorageService:
+    """Test suite for LocalStorageService."""
+
+    def test_upload_and_download_bytes(self, storage):
+        url = storage.upload_file("exams/scan.pdf", b"%PDF-content")
+
+        assert url.startswith("file://")
+        assert storage.file_exists("exams/scan.pdf")
+        assert storage.download_file("exams/scan.pdf") == b"%PDF-content"
+
+    def test_upload_stream_from_file_object(self, storage):
+        storage.upload_stream("a/b.bin", io.BytesIO(b"x" * 10))
+
+        assert b"".join(storage.download_stream("a/b.bin")) == b"x" * 10
+        assert [len(c) for c in storage.download_stream("a/b.bin", chunk_size=4)] == [4, 4, 2]
+
+    def test_download_range(self, storage):
+        storage.upload_file("data.bin", b"0123456789")
+
+        assert storage.download_range("data.bin", 2, 5) == b"234"
+        assert storage.download_range("data.bin", 7) == b"789"
+
+    def test_empty_file(self, storage):
+        storage.upload_file("empty.bin", b"")
+
+        assert storage.download_file("empty.bin") == b""
+        assert storage.download_range("empty.bin", 0) == b""
+
+    def test_failed_upload_leaves_no_partial_file(self, storage, tmp_path):
+        def broken_source():
+            yield b"partial"
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError):
+            storage.upload_stream("broken.bin", broken_source())
+
+        assert not storage.file_exists("broken.bin")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_delete_file(self, storage):
+        storage.upload_file("gone.bin", b"data")
+
+        assert storage.delete_file("gone.bin") is True
+        assert storage.delete_file("gone.bin") is False
+        assert not storage.file_exists("gone.bin")
+
+    def test_missing_file_raises(self, storage):
+        with pytest.raises(FileNotFoundError):
+            storage.download_stream("missing.bin")
+
+    def test_rejects_path_traversal(self, storage):
+        with pytest.raises(ValueError, match="Invalid file path"):
+            storage.upload_file("../outside.bin", b"data")
@@ -0,0 +1,137 @@
+"""Unit tests for the S3-compatible storage backend."""
+import io
+import threading
+
+import pytest
+
+from src.infrastructure.storage.s3_storage import S3StorageService
+
+
+class ClientError(Exception):
+    """Mimics botocore's ClientError shape."""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}}
+
+
+class FakeS3Client:
+    """In-memory stand-in for a boto3 S3 client."""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.max_part_size = 0
+        self.put_calls = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, **params):
+        self.put_calls += 1
+        self.objects[params["Key"]] = bytes(params["Body"])
+
+    def create_multipart_upload(self, **params):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, **params):
+        number, body = params["PartNumber"], params["Body"]
+        with self._lock:
+            self.uploads[params["UploadId"]][number] = body
+            self.max_part_size = max(self.max_part_size, len(body))
+        return {"ETag": f"etag-{number}"}
+
+    def complete_multipart_upload(self, **params):
+        parts = self.uploads.pop(params["UploadId"])
+        numbers = [p["PartNumber"] for p in params["MultipartUpload"]["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[params["Key"]] = b"".join(parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, **params):
+        self.aborted.append(params["UploadId"])
+
+    def get_object(self, **params):
+        key, byte_range = params["Key"], params.get("Range")
+        if key not in self.objects:
+            raise ClientError("NoSuchKey")
+        data = self.objects[key]
+        if byte_range:
+            start, _, end = byte_range.removeprefix("bytes=").partition("-")
+            data = data[int(start): int(end) + 1 if end else None]
+        return {"Body": io.BytesIO(data)}
+
+    def head_object(self, **params):
+        if params["Key"] not in self.objects:
+            raise ClientError("404")
+        return {}
+
+    def delete_object(self, **params):
+        self.objects.pop(params["Key"], None)
+
+
+@pytest.fixture
+def client():
+    return FakeS3Client()
+
+
+@pytest.fixture
+def storage(client):
+    return S3StorageService(
+        bucket="test-bucket",
+        client=client,
+        chunk_size=4,
+        multipart_threshold=8,
+        max_concurrency=2,
+    )
+
+
+class TestS3StorageService:
+    """Test suite for S3StorageService."""
+
+    def test_small_upload_uses_single_put(self, storage, client):
+        url = storage.upload_stream("small.bin", io.BytesIO(b"abcde"))
+
+        assert client.put_calls == 1
+        assert client.objects["small.bin"] == b"abcde"
+        assert url.endswith("/small.bin")
+
+    def test_large_upload_uses_bounded_multipart(self, storage, client):
+        payload = bytes(range(256)) * 4
+
+        storage.upload_stream("large.bin", (payload[i:i + 7] for i in range(0, len(payload), 7)))
+
+        assert client.put_calls == 0
+        assert client.objects["large.bin"] == payload
+        assert client.max_part_size == 4
+
+    def test_failed_part_aborts_upload(self, storage, client):
+        def failing_part(**kwargs):
+            raise RuntimeError("network error")
+
+        client.upload_part = failing_part
+
+        with pytest.raises(RuntimeError):
+            storage.upload_file("large.bin", b"x" * 32)
+
+        assert client.aborted == ["upload-0"]
+        assert "large.bin" not in client.objects
+
+    def test_download_stream_and_range(self, storage, client):
+        client.objects["data.bin"] = b"0123456789"
+
+        assert list(storage.download_stream("data.bin")) == [b"0123", b"4567", b"89"]
+        assert storage.download_range("data.bin", 2, 5) == b"234"
+        assert storage.download_range("data.bin", 8) == b"89"
+        assert storage.download_file("data.bin") == b"0123456789"
+
+    def test_missing_object(self, storage):
+        assert storage.file_exists("missing.bin") is False
+        with pytest.raises(FileNotFoundError):
+            storage.download_file("missing.bin")
+
+    def test_delete_file(self, storage, client):
+        client.objects["gone.bin"] = b"data"
+
+        assert storage.delete_file("gone.bin") is True
+        assert storage.file_exists("gone.bin") is False
@@ -0,0 +1,152 @@
+"""Unit tests for the async read API."""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.asgi import create_asgi_app
+from src.infrastructure.database import async_session
+from src.infrastructure.database.async_session import to_async_url
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.n_plus_one import watch_engine
+from src.infrastructure.database.query_tracing import instrument_engine
+from src.infrastructure.database.session import Base
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.asgi import app as asgi_app
+from src.presentation.asgi import routes
+
+
+class SyncBackedSession:
+    """``run_sync`` on a plain Session, standing in for an AsyncSession."""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def run_sync(self, work):
+        return work(self.session)
+
+
+@pytest.fixture
+def caregiver_id(mocker):
+    engine = create_engine("sqlite://")
+    watch_engine(engine)
+    instrument_engine(engine)
+    Base.metadata.create_all(engine)
+    caregiver_id = uuid4()
+    with Session(engine) as session:
+        session.add(UserModel(
+            id=caregiver_id, email="carer@example.com", password_hash="x",
+            full_name="Carer", role="caregiver",
+        ))
+        session.add(PatientModel(
+            id=uuid4(), caregiver_id=caregiver_id, full_name="Maria", cpf="52998224725",
+            date_of_birth=date(1950, 1, 1), gender="F", address="Addr", phone="123",
+            emergency_contact="EC", emergency_phone="123",
+        ))
+        session.commit()
+
+    @asynccontextmanager
+    async def read_session():
+        with Session(engine) as session:
+            yield SyncBackedSession(session)
+
+    mocker.patch.object(routes, "async_read_session", read_session)
+    mocker.patch.object(routes.settings, "AUDIT_ENABLED", False)
+    yield caregiver_id
+    engine.dispose()
+
+
+def get(path, headers=None):
+    async def send():
+        transport = httpx.ASGITransport(app=create_asgi_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers=headers)
+    return asyncio.run(send())
+
+
+def auth(subject="user-1"):
+    return {"Authorization": f"Bearer {JWTHandler().create_access_token(subject)}"}
+
+
+def test_patients_by_caregiver(caregiver_id, query_budget):
+    with query_budget(1):
+        response = get(f"/api/v1/patients/caregiver/{caregiver_id}", auth())
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+    assert response.json()["patients"][0]["full_name"] == "Maria"
+    assert response.headers["X-Request-ID"]
+
+
+def test_dashboard_and_user(caregiver_id, query_budget):
+    with query_budget(4):
+        dashboard = get(f"/api/v1/patients/caregiver/{caregiver_id}/dashboard", auth())
+    assert dashboard.json()["patients"][0]["active_medication_count"] == 0
+
+    user = get(f"/api/v1/users/{caregiver_id}")
+    assert user.json()["email"] == "carer@example.com"
+    assert get(f"/api/v1/users/{uuid4()}").json()["code"] == "USER_NOT_FOUND"
+
+
+def test_server_timing_reports_the_requests_queries(caregiver_id, mocker):
+    mocker.patch.object(asgi_app.settings, "QUERY_TRACING_ENABLED", True)
+    mocker.patch.object(asgi_app.settings, "QUERY_TRACING_SAMPLE_RATE", 1.0)
+
+    response = get(f"/api/v1/patients/caregiver/{caregiver_id}", auth())
+
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+
+
+def test_n_plus_one_detection_runs_per_request(caregiver_id, mocker):
+    mocker.patch.object(asgi_app.settings, "QUERY_N_PLUS_ONE_MODE", "raise")
+    mocker.patch.object(asgi_app.settings, "QUERY_N_PLUS_ONE_THRESHOLD", 0)
+
+    response = get(f"/api/v1/patients/caregiver/{caregiver_id}", auth())
+
+    assert response.status_code == 500
+
+
+def test_errors_match_the_wsgi_api(caregiver_id):
+    missing_auth = get(f"/api/v1/patients/caregiver/{caregiver_id}")
+    assert missing_auth.json() == {"error": "Authorization header is missing"}
+    assert get("/api/v1/patients/caregiver/not-a-uuid", auth()).status_code == 400
+    assert get("/api/v1/nothing-here").status_code == 404
+
+
+def test_async_driver_urls():
+    assert to_async_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert to_async_url("sqlite:///app.db") == "sqlite+aiosqlite:///app.db"
+    with pytest.raises(ValueError):
+        to_async_url("mysql://u:p@db/app")
+
+
+def test_read_session_on_aiosqlite(mocker, tmp_path):
+
+    url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    mocker.patch.object(async_session.settings, "ASYNC_DATABASE_URL", to_async_url(url))
+    async_session.get_async_engine.cache_clear()
+    async_session.get_async_sessionmaker.cache_clear()
+
+    async def find():
+        from src.infrastructure.repositories.async_repositories import AsyncRepositories
+        async with async_session.async_read_session() as session:
+            found = await AsyncRepositories(session).run(
+                lambda repos: repos.users.find_by_id(uuid4())
+            )
+        await async_session.dispose_async_engine()
+        return found
+
+    try:
+        assert asyncio.run(find()) is None
+    finally:
+        async_session.get_async_engine.cache_clear()
+        async_session.get_async_sessionmaker.cache_clear()
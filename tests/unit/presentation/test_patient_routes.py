@@ -0,0 +1,114 @@
+"""Unit tests for the caregiver patient list and dashboard routes."""
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.models.appointment_model import AppointmentModel
+from src.infrastructure.database.models.medication_model import MedicationModel
+from src.infrastructure.database.models.patient_model import PatientModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.n_plus_one import watch_engine
+from src.infrastructure.database.session import Base
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.api.middlewares import audit
+from src.presentation.api.v1.routes import patient_routes
+from src.presentation.api.v1.routes.patient_routes import patient_bp
+
+TABLES = [
+    UserModel.__table__,
+    PatientModel.__table__,
+    MedicationModel.__table__,
+    AppointmentModel.__table__,
+]
+
+
+def make_cpf(index):
+    digits = [int(d) for d in f"{index + 100000000:09d}"]
+    for length in (9, 10):
+        total = sum(d * (length + 1 - i) for i, d in enumerate(digits))
+        digits.append((total * 10 % 11) % 10)
+    return "".join(map(str, digits))
+
+
+@pytest.fixture
+def session(mocker):
+    engine = create_engine("sqlite:///:memory:")
+    watch_engine(engine)
+    Base.metadata.create_all(engine, tables=TABLES)
+    with Session(engine) as session:
+        mocker.patch.object(patient_routes, "get_session", return_value=session)
+        mocker.patch.object(audit.settings, "AUDIT_ENABLED", False)
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(patient_bp)
+    return app.test_client()
+
+
+def add_caregiver_with_patients(session, patient_count):
+    caregiver_id = uuid4()
+    session.add(UserModel(
+        id=caregiver_id, email=f"{uuid4().hex}@example.com", password_hash="x",
+        full_name="Caregiver", role="caregiver",
+    ))
+    for index in range(patient_count):
+        patient_id = uuid4()
+        session.add(PatientModel(
+            id=patient_id, caregiver_id=caregiver_id, full_name=f"Patient {index:03d}",
+            cpf=make_cpf(index), date_of_birth=date(1950, 1, 1), gender="F",
+            address="Addr", phone="123", emergency_contact="EC", emergency_phone="123",
+        ))
+        session.add(MedicationModel(
+            patient_id=patient_id, name="Losartan", dosage="50mg", frequency="twice_daily",
+            schedule_times=[time(8, 0), time(20, 0)],
+            start_date=datetime.now() - timedelta(days=30),
+        ))
+        session.add(AppointmentModel(
+            patient_id=patient_id, title="Checkup",
+            appointment_date=datetime.now() + timedelta(days=2),
+            duration_minutes=30, location="Clinic",
+        ))
+    session.commit()
+    session.expunge_all()
+    return caregiver_id
+
+
+def get(client, path):
+    token = JWTHandler().create_access_token(str(uuid4()))
+    return client.get(path, headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.parametrize("patient_count", [1, 10])
+def test_patient_list_query_count_does_not_grow_with_patients(
+    client, session, query_budget, patient_count
+):
+    caregiver_id = add_caregiver_with_patients(session, patient_count)
+
+    with query_budget(1, threshold=1):
+        response = get(client, f"/api/v1/patients/caregiver/{caregiver_id}")
+
+    assert response.status_code == 200
+    assert response.json["total"] == patient_count
+
+
+@pytest.mark.parametrize("patient_count", [1, 10])
+def test_dashboard_query_count_does_not_grow_with_patients(
+    client, session, query_budget, patient_count
+):
+    caregiver_id = add_caregiver_with_patients(session, patient_count)
+
+    with query_budget(4, threshold=1):
+        response = get(client, f"/api/v1/patients/caregiver/{caregiver_id}/dashboard")
+
+    assert response.status_code == 200
+    assert response.json["total"] == patient_count
+    assert all(p["active_medication_count"] == 1 for p in response.json["patients"])
+    assert all(p["next_appointment"]["title"] == "Checkup" for p in response.json["patients"])
@@ -0,0 +1,79 @@
+"""Unit tests for request schema validation on write routes."""
+import json
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+
+from src.infrastructure.security.jwt_handler import JWTHandler
+from src.presentation.api.v1.routes import user_routes
+from src.presentation.api.v1.routes.patient_routes import patient_bp
+from src.presentation.api.v1.routes.user_routes import user_bp
+from src.presentation.api.v1.schemas.patient_schemas import CreatePatientRequest
+
+PATIENT = {
+    "caregiver_id": str(uuid4()),
+    "full_name": "Maria Silva",
+    "cpf": "529.982.247-25",
+    "date_of_birth": "1950-05-15",
+    "gender": "F",
+    "address": "Rua Exemplo, 123",
+    "phone": "(11) 98765-4321",
+    "emergency_contact": "João Silva",
+    "emergency_phone": "(11) 91234-5678",
+}
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(patient_bp)
+    app.register_blueprint(user_bp)
+    return app.test_client()
+
+
+def test_patient_schema_parses_types():
+    body = CreatePatientRequest.model_validate_json(json.dumps(dict(PATIENT, ignored=1)))
+
+    assert body.date_of_birth == date(1950, 5, 15)
+    assert str(body.caregiver_id) == PATIENT["caregiver_id"]
+    assert body.allergies is None
+
+
+def test_every_invalid_field_is_reported_at_once(client):
+    headers = {"Authorization": f"Bearer {JWTHandler().create_access_token('user-1')}"}
+    body = dict(PATIENT, caregiver_id="not-a-uuid", date_of_birth="15/05/1950")
+    del body["phone"]
+
+    response = client.post("/api/v1/patients/", json=body, headers=headers)
+
+    assert response.status_code == 400
+    assert response.json["code"] == "VALIDATION_ERROR"
+    fields = {detail["field"] for detail in response.json["details"]}
+    assert fields == {"caregiver_id", "date_of_birth", "phone"}
+
+
+def test_malformed_json_is_a_validation_error(client):
+    response = client.post("/api/v1/users/", data="{", content_type="application/json")
+
+    assert response.status_code == 400
+    assert response.json["code"] == "VALIDATION_ERROR"
+
+
+def test_valid_body_reaches_the_use_case(client, mocker):
+    use_case = mocker.patch.object(user_routes, "CreateUserUseCase").return_value
+    use_case.execute.return_value = mocker.Mock(
+        id=uuid4(), email="a@example.com", full_name="A", role="family", is_active=True,
+    )
+    mocker.patch.object(user_routes, "get_session")
+
+    response = client.post("/api/v1/users/", json={
+        "email": "a@example.com", "password": "secret", "full_name": "A", "role": "family",
+    })
+
+    assert response.status_code == 201
+    assert use_case.execute.call_args.args[0].role == "family"
+    assert client.post("/api/v1/users/", json={
+        "email": "a@example.com", "password": "secret", "full_name": "A", "role": "owner",
+    }).json["details"][0]["field"] == "role"
@@ -0,0 +1,163 @@
+"""Unit tests for the logging pipeline."""
+import io
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+import pytest
+from flask import Flask, jsonify
+
+from src.presentation.api.middlewares import request_logging
+from src.presentation.api.middlewares.request_logging import register_request_logging
+from src.shared.utils.logger import (
+    ContextQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    bind_log_context,
+    parse_sampling,
+    reset_log_context,
+    update_log_context,
+)
+
+
+def make_record(name="cuidar_plus", level=logging.INFO, msg="hello %s", args=("world",), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def pipeline():
+    """A handler/listener pair writing JSON lines to a buffer."""
+    output = io.StringIO()
+    stream = logging.StreamHandler(output)
+    stream.setFormatter(JsonFormatter())
+    handler = ContextQueueHandler(queue.Queue(maxsize=100))
+    listener = QueueListener(handler.queue, stream)
+    listener.start()
+
+    logger = logging.getLogger("tests.pipeline")
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    def lines():
+        listener.stop()
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+    yield logger, lines
+    if listener._thread is not None:
+        listener.stop()
+
+
+class TestJsonFormatter:
+    """Test suite for the JSON formatter."""
+
+    def test_includes_message_and_extras(self):
+        entry = json.loads(JsonFormatter().format(make_record(request_id="abc", latency_ms=1.5)))
+
+        assert entry["message"] == "hello world"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "cuidar_plus"
+        assert entry["request_id"] == "abc"
+        assert entry["latency_ms"] == 1.5
+        assert "args" not in entry
+
+
+class TestSamplingFilter:
+    """Test suite for per-logger sampling."""
+
+    def test_parse_sampling(self):
+        parsed = parse_sampling(" cuidar_plus.sql=0.1, other=1 ,")
+        assert parsed == {"cuidar_plus.sql": 0.1, "other": 1.0}
+
+    def test_child_loggers_inherit_rate_and_warnings_always_pass(self):
+        sampler = SamplingFilter({"cuidar_plus.sql": 0.0})
+
+        assert not sampler.filter(make_record("cuidar_plus.sql.replicas", logging.DEBUG))
+        assert sampler.filter(make_record("cuidar_plus.sql", logging.WARNING))
+        assert sampler.filter(make_record("cuidar_plus", logging.DEBUG))
+
+    def test_partial_rate_keeps_a_fraction(self, mocker):
+        mocker.patch("src.shared.utils.logger.random.random", side_effect=[0.05, 0.5])
+        sampler = SamplingFilter({"noisy": 0.1})
+
+        assert sampler.filter(make_record("noisy", logging.DEBUG))
+        assert not sampler.filter(make_record("noisy", logging.DEBUG))
+
+
+class TestContextQueueHandler:
+    """Test suite for the non-blocking queue handler."""
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = ContextQueueHandler(queue.Queue(maxsize=1))
+        for _ in range(3):
+            handler.handle(make_record())
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 2
+
+    def test_records_carry_bound_context(self, pipeline):
+        logger, lines = pipeline
+        token = bind_log_context(request_id="req-1", route="/api/v1/patients/<patient_id>")
+        update_log_context(user_id="user-1")
+        try:
+            logger.info("inside %s", "request")
+        finally:
+            reset_log_context(token)
+        logger.info("outside")
+
+        inside, outside = lines()
+        assert inside["message"] == "inside request"
+        assert inside["request_id"] == "req-1"
+        assert inside["route"] == "/api/v1/patients/<patient_id>"
+        assert inside["user_id"] == "user-1"
+        assert "request_id" not in outside
+
+    def test_exceptions_are_formatted_in_the_calling_thread(self, pipeline):
+        logger, lines = pipeline
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+
+        (entry,) = lines()
+        assert "RuntimeError: boom" in entry["exception"]
+
+
+class TestRequestLogging:
+    """Test suite for the request logging middleware."""
+
+    @pytest.fixture
+    def app(self):
+        app = Flask(__name__)
+        register_request_logging(app)
+
+        @app.route("/items/<item_id>")
+        def get_item(item_id):
+            return jsonify({"id": item_id})
+
+        return app
+
+    def test_generates_request_id_and_logs_latency(self, app, mocker):
+        info = mocker.patch.object(request_logging.access_logger, "info")
+
+        response = app.test_client().get("/items/1")
+
+        request_id = response.headers["X-Request-ID"]
+        assert len(request_id) == 32
+        extra = info.call_args.kwargs["extra"]
+        assert extra["status"] == 200
+        assert extra["latency_ms"] >= 0
+
+    def test_keeps_valid_caller_request_id(self, app):
+        response = app.test_client().get("/items/1", headers={"X-Request-ID": "lb-1234"})
+
+        assert response.headers["X-Request-ID"] == "lb-1234"
+
+    def test_replaces_malformed_request_id(self, app):
+        malformed = "spaces and ; semicolons " * 10
+        response = app.test_client().get("/items/1", headers={"X-Request-ID": malformed})
+
+        assert len(response.headers["X-Request-ID"]) == 32
@@ -0,0 +1,83 @@
+"""Unit tests for the benchmark tooling (not the benchmarks themselves)."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from benchmarks.api import compare_to_baseline
+from benchmarks.load import Target, TargetStats, run_load
+from benchmarks.seed import cpf_from_number
+from src.domain.value_objects.cpf import CPF
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        status = 500 if self.path == "/fail" else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def result(throughput, p95, errors=0):
+    return {"targets": {"patients": {"throughput": throughput, "p95_ms": p95, "errors": errors}}}
+
+
+def test_percentiles_use_nearest_rank():
+    stats = TargetStats(latencies_ms=[float(ms) for ms in range(1, 101)])
+
+    assert stats.percentile(50) == 50
+    assert stats.percentile(95) == 95
+    assert stats.percentile(99) == 99
+    assert TargetStats().percentile(99) == 0
+
+
+def test_run_load_records_latencies_and_errors(base_url):
+    outcome = run_load(
+        base_url,
+        [Target("ok", "/ok"), Target("fail", "/fail")],
+        concurrency=2,
+        duration_s=0.3,
+        warmup_s=0,
+    )
+
+    assert outcome.targets["ok"].latencies_ms
+    assert outcome.targets["ok"].errors == 0
+    assert outcome.targets["fail"].errors > 0
+    assert outcome.throughput("fail") == 0
+    assert outcome.throughput() == outcome.throughput("ok")
+
+
+@pytest.mark.parametrize(
+    "current, regressed",
+    [
+        (result(95, 11), False),  # within tolerance
+        (result(70, 10), True),  # throughput dropped 30%
+        (result(100, 13), True),  # p95 grew 30%
+        (result(100, 10, errors=1), True),  # new errors
+    ],
+)
+def test_compare_to_baseline(current, regressed):
+    regressions = compare_to_baseline(current, result(100, 10), tolerance=0.25)
+
+    assert bool(regressions) is regressed
+
+
+def test_seed_cpfs_are_valid_and_unique():
+    cpfs = {cpf_from_number(n) for n in range(1, 1001)}
+
+    assert len(cpfs) == 1000
+    assert all(CPF(cpf).value == cpf for cpf in cpfs)
+    with pytest.raises(ValueError):
+        cpf_from_number(111_111_111)
@@ -0,0 +1,77 @@
+"""Unit tests for the synthetic dataset generator."""
+from datetime import date, datetime, time
+from uuid import UUID
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from benchmarks.dataset import (
+    CopyStream,
+    DatasetGenerator,
+    DatasetSpec,
+    encode_copy_row,
+    generate_dataset,
+)
+from src.domain.value_objects.cpf import CPF
+
+SPEC = DatasetSpec(caregivers=3, patients=40, medications=120, appointments=60)
+ANCHOR = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dataset.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_generates_exact_counts_with_valid_unique_cpfs(engine):
+    manifest = generate_dataset(engine, SPEC, seed=7, anchor=ANCHOR, log=lambda message: None)
+
+    with engine.connect() as connection:
+        counts = {
+            table: connection.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            for table in ("users", "patients", "medications", "appointments")
+        }
+        cpfs = [row[0] for row in connection.execute(text("SELECT cpf FROM patients"))]
+        orphans = connection.execute(text(
+            "SELECT COUNT(*) FROM medications m "
+            "LEFT JOIN patients p ON p.id = m.patient_id WHERE p.id IS NULL"
+        )).scalar()
+
+    assert counts == {"users": 3, "patients": 40, "medications": 120, "appointments": 60}
+    assert len(set(cpfs)) == 40
+    assert all(CPF(cpf).value == cpf for cpf in cpfs)
+    assert orphans == 0
+    assert manifest["spec"]["patients"] == 40
+
+
+def test_same_seed_reproduces_rows():
+    first = DatasetGenerator(SPEC, seed=7, anchor=ANCHOR)
+    second = DatasetGenerator(SPEC, seed=7, anchor=ANCHOR)
+    other = DatasetGenerator(SPEC, seed=8, anchor=ANCHOR)
+
+    assert list(first.patients()) == list(second.patients())
+    assert list(first.medications()) == list(second.medications())
+    assert list(first.patients())[0] != list(other.patients())[0]
+
+
+def test_copy_encoding():
+    row = (
+        UUID(int=1), "tab\there", None, True, [time(8, 0), time(20, 0)],
+        date(2025, 1, 2), datetime(2025, 1, 2, 3, 4), "back\\slash",
+    )
+
+    assert encode_copy_row(row) == (
+        b"00000000-0000-0000-0000-000000000001\ttab\\there\t\\N\tt\t{08:00:00,20:00:00}"
+        b"\t2025-01-02\t2025-01-02T03:04:00\tback\\\\slash\n"
+    )
+
+
+def test_copy_stream_reads_all_rows_in_small_chunks():
+    rows = [(index, f"name {index}") for index in range(100)]
+    stream = CopyStream(rows)
+
+    chunks = iter(lambda: stream.read(7), b"")
+
+    assert b"".join(chunks) == b"".join(encode_copy_row(row) for row in rows)
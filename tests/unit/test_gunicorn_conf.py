@@ -0,0 +1,65 @@
+"""Tests for the shipped gunicorn configuration."""
+import importlib
+
+import pytest
+
+from src.config import get_settings
+from src.infrastructure.metrics import multiprocess
+
+
+@pytest.fixture(autouse=True)
+def metrics_dir(monkeypatch, tmp_path):
+    # Loading the config enables multi-process metrics for the whole process
+    monkeypatch.setattr(get_settings(), "METRICS_MULTIPROC_DIR", str(tmp_path / "metrics"))
+    monkeypatch.setattr(multiprocess, "_collector", None)
+    return tmp_path / "metrics"
+
+
+def load_conf(monkeypatch, **overrides):
+    settings = get_settings()
+    for name, value in overrides.items():
+        monkeypatch.setattr(settings, name, value)
+    import src.gunicorn_conf as conf
+    return importlib.reload(conf)
+
+
+def test_sync_profile_preloads_app(monkeypatch):
+    conf = load_conf(monkeypatch, GUNICORN_WORKER_PROFILE="sync", GUNICORN_WORKERS=3)
+
+    assert conf.worker_class == "sync"
+    assert conf.threads == 1
+    assert conf.workers == 3
+    assert conf.preload_app is True
+    assert conf.wsgi_app == "src.main:create_app()"
+
+
+def test_gthread_profile_uses_threads(monkeypatch):
+    conf = load_conf(monkeypatch, GUNICORN_WORKER_PROFILE="gthread", GUNICORN_THREADS=8)
+
+    assert conf.worker_class == "gthread"
+    assert conf.threads == 8
+
+
+def test_unknown_profile_is_rejected(monkeypatch):
+    with pytest.raises(ValueError, match="Invalid GUNICORN_WORKER_PROFILE"):
+        load_conf(monkeypatch, GUNICORN_WORKER_PROFILE="eventlet")
+
+
+def test_post_fork_discards_inherited_connections(monkeypatch, mocker):
+    conf = load_conf(monkeypatch, GUNICORN_WORKER_PROFILE="sync")
+    dispose = mocker.patch("src.infrastructure.database.session.engines.dispose")
+
+    conf.post_fork(server=mocker.Mock(), worker=mocker.Mock())
+
+    dispose.assert_called_once_with(close=False)
+
+
+def test_metrics_are_aggregated_across_workers(monkeypatch, mocker, metrics_dir):
+    conf = load_conf(monkeypatch, GUNICORN_WORKER_PROFILE="sync")
+
+    assert multiprocess.get_multiprocess_collector().directory == metrics_dir
+
+    metrics_dir.mkdir()
+    (metrics_dir / "metrics-1.json").write_text("{}")
+    conf.on_starting(server=mocker.Mock())
+    assert list(metrics_dir.iterdir()) == []
@@ -1,5 +1,8 @@
 import pytest
+from flask import request
 
+from src import main
+from src.infrastructure.security.jwt_handler import JWTHandler
 from src.main import create_app
 
 
@@ -10,10 +13,11 @@ def client():
     with app.test_client() as client:
         yield client
 
-def test_root_json(client):
+def test_root_json(client, query_budget):
     """Test root endpoint returns JSON by default or when requested."""
     # Test explicitly requesting JSON
-    response = client.get("/", headers={"Accept": "application/json"})
+    with query_budget(0):
+        response = client.get("/", headers={"Accept": "application/json"})
     assert response.status_code == 200
     assert response.is_json
     data = response.get_json()
@@ -24,12 +28,47 @@ def test_root_json(client):
     assert response.status_code == 200
     assert response.is_json
 
-def test_root_html(client):
+def test_root_html(client, query_budget):
     """Test root endpoint returns HTML when requested."""
     # Browsers send text/html
-    response = client.get("/", headers={"Accept": "text/html"})
+    with query_budget(0):
+        response = client.get("/", headers={"Accept": "text/html"})
     assert response.status_code == 200
     assert "text/html" in response.content_type
     assert b"<!DOCTYPE html>" in response.data
     assert b"Cuidar Plus API" in response.data
     assert b"v1" in response.data
+
+def test_pool_metrics_require_admin(client):
+    """Pool internals are only served to admins; /health stays the public probe."""
+    assert client.get("/health").status_code == 200
+    assert client.get("/health/pools").status_code == 404
+    assert client.get("/api/v1/admin/pools").status_code == 401
+
+    def get_pools(role):
+        token = JWTHandler().create_access_token("user-1", {"role": role})
+        return client.get("/api/v1/admin/pools", headers={"Authorization": f"Bearer {token}"})
+
+    assert get_pools("caregiver").status_code == 403
+    response = get_pools("admin")
+    assert response.status_code == 200
+    assert "pools" in response.json
+
+@pytest.mark.parametrize("hops, expected", [
+    (0, "10.0.0.2"),
+    (1, "198.51.100.7"),
+    (2, "203.0.113.9"),
+])
+def test_client_ip_trusts_only_the_configured_proxy_hops(mocker, hops, expected):
+    """Rate limits and the audit trail key on this address; spoofed entries are ignored."""
+    mocker.patch.object(main.settings, "PROXY_FIX_X_FOR", hops)
+    app = create_app()
+    app.add_url_rule("/whoami", "whoami", lambda: request.remote_addr)
+
+    response = app.test_client().get(
+        "/whoami",
+        headers={"X-Forwarded-For": "1.2.3.4, 203.0.113.9, 198.51.100.7"},
+        environ_base={"REMOTE_ADDR": "10.0.0.2"},
+    )
+
+    assert response.text == expected
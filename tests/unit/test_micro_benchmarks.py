@@ -0,0 +1,47 @@
+"""Unit tests for the microbenchmark harness."""
+import pytest
+
+from benchmarks.micro import CASES, append_history, compare_runs, load_history, measure
+
+
+def timings(min_us):
+    return {"min_us": min_us, "median_us": min_us * 1.1}
+
+
+def test_compare_flags_slowdowns_over_threshold():
+    previous = {"cpf": timings(10.0), "email": timings(10.0)}
+    current = {"cpf": timings(11.5), "email": timings(10.9)}
+
+    slowdowns = compare_runs(current, previous, threshold=0.10)
+
+    assert len(slowdowns) == 1
+    assert slowdowns[0].startswith("cpf: 11.50 us (previous 10.00 us, +15%)")
+
+
+def test_compare_ignores_new_cases_and_speedups():
+    previous = {"cpf": timings(10.0)}
+    current = {"cpf": timings(5.0), "phone": timings(100.0)}
+
+    assert compare_runs(current, previous) == []
+
+
+def test_history_round_trip(tmp_path):
+    path = tmp_path / "results" / "history.jsonl"
+    assert load_history(path) == []
+
+    append_history(path, {"results": {"cpf": timings(1.0)}})
+    append_history(path, {"results": {"cpf": timings(2.0)}})
+
+    assert [entry["results"]["cpf"]["min_us"] for entry in load_history(path)] == [1.0, 2.0]
+
+
+def test_measure_reports_per_call_time():
+    measurement = measure("noop", lambda: None, rounds=3, min_time=0.01)
+
+    assert measurement.rounds == 3
+    assert 0 < measurement.min_us <= measurement.median_us
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_every_case_sets_up_and_runs(name):
+    CASES[name]()()
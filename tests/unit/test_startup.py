@@ -0,0 +1,42 @@
+"""Cold start budget for create_app()."""
+import os
+
+import pytest
+
+from scripts.startup_benchmark import measure_startup, parse_importtime
+
+# Generous defaults; CI can tighten them per runner class
+MAX_IMPORT_MS = float(os.environ.get("STARTUP_MAX_IMPORT_MS", 3000))
+MAX_RSS_MB = float(os.environ.get("STARTUP_MAX_RSS_MB", 150))
+
+
+@pytest.fixture(scope="module")
+def report():
+    return measure_startup()
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |   child",
+        "import time:      2000 |       2100 | parent",
+        "import time:       500 |        500 | other",
+        "unrelated log line",
+    ])
+
+    total_ms, modules = parse_importtime(stderr)
+
+    assert total_ms == pytest.approx(2.6)
+    assert modules[0] == ("parent", 2.0)
+
+
+@pytest.mark.slow
+def test_create_app_does_not_load_db_driver(report):
+    """The engine, and with it the DB driver, is only created on first use."""
+    assert report.loaded_deferred == []
+
+
+@pytest.mark.slow
+def test_create_app_within_budget(report):
+    assert report.import_ms < MAX_IMPORT_MS
+    assert report.rss_mb < MAX_RSS_MB